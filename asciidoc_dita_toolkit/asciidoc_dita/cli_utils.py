@@ -11,6 +11,8 @@ Example usage:
 
 import argparse
 
+from .io_pipeline import DEFAULT_IO_WORKERS
+
 
 def common_arg_parser(parser: argparse.ArgumentParser) -> None:
     """
@@ -18,6 +20,9 @@ def common_arg_parser(parser: argparse.ArgumentParser) -> None:
     -d / --directory: Root directory to search (default: current directory)
     -r / --recursive: Search subdirectories recursively
     -f / --file: Scan only the specified .adoc file
+    --profile [FILE]: Print per-phase timings, optionally writing a cProfile dump
+    --profile-top N: Number of slowest files listed when profiling
+    --memory-profile: Also report peak memory and top allocation sites
 
     Args:
         parser: ArgumentParser instance to add arguments to
@@ -39,3 +44,62 @@ def common_arg_parser(parser: argparse.ArgumentParser) -> None:
         action="store_true",
         help="Search subdirectories recursively",
     )
+    add_profile_argument(parser)
+
+
+def add_prefetch_argument(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the --prefetch option for plugins that can run through an io_pipeline.
+
+    Args:
+        parser: ArgumentParser instance to add the option to
+    """
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        nargs="?",
+        const=DEFAULT_IO_WORKERS,
+        metavar="N",
+        help=(
+            "Read upcoming files and write changed files in the background "
+            "with N threads each, for network filesystems "
+            f"(default N: {DEFAULT_IO_WORKERS})"
+        ),
+    )
+
+
+def add_profile_argument(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the --profile, --profile-top and --memory-profile options, read by
+    the CLI entry points.
+
+    Args:
+        parser: ArgumentParser instance to add the option to
+    """
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="summary",
+        metavar="FILE",
+        help=(
+            "Print a per-phase timing summary to stderr; with FILE, also write "
+            "a cProfile dump to it (or set ADT_PROFILE)"
+        ),
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        metavar="N",
+        help=(
+            "Number of slowest files listed in the profile summary "
+            "(default: 10, or set ADT_PROFILE_TOP)"
+        ),
+    )
+    parser.add_argument(
+        "--memory-profile",
+        action="store_true",
+        help=(
+            "Trace allocations and report peak memory per phase, plugin data "
+            "structure sizes and top allocation sites (or set ADT_MEMORY_PROFILE)"
+        ),
+    )
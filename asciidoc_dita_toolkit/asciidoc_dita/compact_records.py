@@ -0,0 +1,116 @@
+"""
+Compact storage for the per-xref and per-ID records built by the plugins.
+
+Large documentation sets produce hundreds of thousands of records, so this
+module provides two memory-saving building blocks:
+
+- intern_value(): interns repeated strings such as file paths and context
+  names, so every record for a file shares one string object. Records keep
+  their plain string fields, and asdict() and report output are unchanged.
+- XrefTable: a columnar, array-backed replacement for a list of
+  (filepath, line_number, full_match, target_id, target_file) tuples, with
+  file paths stored once in a file table and referenced by index.
+"""
+
+import sys
+from array import array
+from typing import Dict, Iterator, List, Tuple
+
+# Row layout of XrefTable
+XrefRow = Tuple[str, int, str, str, str]
+
+
+def intern_value(value: str) -> str:
+    """
+    Return the shared copy of a frequently repeated string.
+
+    Args:
+        value: String to intern, such as a file path or context name
+
+    Returns:
+        The interned string, identical in value to the argument
+    """
+    return sys.intern(value)
+
+
+class XrefTable:
+    """
+    Columnar list of xref occurrences.
+
+    Behaves like a list of (filepath, line_number, full_match, target_id,
+    target_file) tuples, but stores file paths as indices into a file table
+    and line numbers in an unsigned integer array. Rows are rebuilt on
+    access.
+    """
+
+    __slots__ = (
+        "_files",
+        "_file_index",
+        "_file_ids",
+        "_lines",
+        "_matches",
+        "_target_ids",
+        "_target_files",
+    )
+
+    def __init__(self, rows=()):
+        self._files: List[str] = []
+        self._file_index: Dict[str, int] = {}
+        self._file_ids = array("I")
+        self._lines = array("I")
+        self._matches: List[str] = []
+        self._target_ids: List[str] = []
+        self._target_files: List[str] = []
+        for row in rows:
+            self.append(row)
+
+    def _file_id(self, filepath: str) -> int:
+        """Return the file table index of a path, adding it on first use."""
+        index = self._file_index.get(filepath)
+        if index is None:
+            index = len(self._files)
+            self._files.append(filepath)
+            self._file_index[filepath] = index
+        return index
+
+    def append(self, row: XrefRow) -> None:
+        """Add one (filepath, line_number, full_match, target_id, target_file) row."""
+        filepath, line_number, full_match, target_id, target_file = row
+        self._file_ids.append(self._file_id(filepath))
+        self._lines.append(line_number)
+        self._matches.append(full_match)
+        self._target_ids.append(target_id)
+        self._target_files.append(intern_value(target_file))
+
+    @property
+    def files(self) -> List[str]:
+        """Distinct file paths, in order of first appearance."""
+        return list(self._files)
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __getitem__(self, index: int) -> XrefRow:
+        return (
+            self._files[self._file_ids[index]],
+            self._lines[index],
+            self._matches[index],
+            self._target_ids[index],
+            self._target_files[index],
+        )
+
+    def __iter__(self) -> Iterator[XrefRow]:
+        files = self._files
+        return zip(
+            (files[file_id] for file_id in self._file_ids),
+            self._lines,
+            self._matches,
+            self._target_ids,
+            self._target_files,
+        )
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"XrefTable({list(self)!r})"
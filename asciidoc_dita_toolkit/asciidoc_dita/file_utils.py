@@ -4,6 +4,8 @@ file_utils.py - Core file operations for AsciiDoc processing.
 This module provides core file operations for:
 - Discovering .adoc files in a directory (optionally recursively), always ignoring symlinks.
 - Reading and writing text files while preserving original line endings for each line.
+- Skipping files that contain none of a plugin's byte prefilters before decoding them.
+- Scanning large files through a memory map, decoding only the lines of interest.
 - Validating .adoc files (extension, file type, not a symlink).
 
 After modularization (Issue #92), this module focuses solely on file operations.
@@ -19,8 +21,11 @@ Legacy imports are maintained for backward compatibility with deprecation warnin
 """
 
 import logging
+import mmap
 import os
 import re
+import shutil
+import tempfile
 
 # For backward compatibility - import from new modules
 from .cli_utils import common_arg_parser
@@ -28,7 +33,9 @@ from .config_utils import (
     load_json_config as load_config_file,
     save_json_config as save_config_file,
 )
+from .io_pipeline import pipelined_read, pipelined_write
 from .plugin_manager import is_plugin_enabled
+from .profiling import count_bytes, profile_phase
 from .security_utils import (
     sanitize_directory_path,
     validate_directory_path,
@@ -44,14 +51,23 @@ logger = logging.getLogger(__name__)
 # Regex to split lines and preserve their original line endings
 LINE_SPLITTER = re.compile(rb"(.*?)(\r\n|\r|\n|$)")
 
+# Files at least this large are scanned through a memory map by read-only
+# plugins instead of being read and split into lines
+MMAP_THRESHOLD = 32 * 1024 * 1024
 
-def find_adoc_files(root, recursive):
+# Bytes copied at a time when counting line endings in a mapped file
+SCAN_CHUNK_SIZE = 1024 * 1024
+
+
+def find_adoc_files(root, recursive, skip_dir=None):
     """
     Find all .adoc files in the given directory (optionally recursively), ignoring symlinks.
 
     Args:
         root: Root directory to search
         recursive: Whether to search recursively
+        skip_dir: Optional predicate called with each subdirectory path; subtrees
+            for which it returns True are not entered
 
     Returns:
         List of file paths
@@ -67,6 +83,12 @@ def find_adoc_files(root, recursive):
     try:
         if recursive:
             for dirpath, dirnames, filenames in os.walk(root):
+                if skip_dir is not None:
+                    dirnames[:] = [
+                        name
+                        for name in dirnames
+                        if not skip_dir(os.path.join(dirpath, name))
+                    ]
                 for filename in filenames:
                     if filename.endswith(".adoc"):
                         fullpath = os.path.join(dirpath, filename)
@@ -88,18 +110,64 @@ def find_adoc_files(root, recursive):
     return adoc_files
 
 
-def read_text_preserve_endings(filepath):
+def read_bytes(filepath):
+    """
+    Read a file's raw bytes.
+
+    Inside an io_pipeline, the content prefetched in the background is used.
+
+    Args:
+        filepath: Path to the file to read
+
+    Returns:
+        The file content as bytes
+    """
+    content = pipelined_read(filepath)
+    if content is None:
+        with profile_phase("read"):
+            with open(filepath, "rb") as f:
+                content = f.read()
+    count_bytes("read", len(content))
+    return content
+
+
+def contains_any(data, needles):
+    """
+    Return True if data contains any of the given byte strings.
+
+    Each needle is searched with a single substring scan of the raw bytes,
+    which is much cheaper than decoding the content and splitting it into
+    lines. Plugins use this as a prefilter: a file that contains none of
+    the byte strings their patterns require cannot produce a match.
+
+    Args:
+        data: Raw file content
+        needles: Byte strings to look for, such as b"xref:"
+
+    Returns:
+        True if any needle occurs in data
+    """
+    return any(needle in data for needle in needles)
+
+
+def read_text_preserve_endings(filepath, prefilter=None):
     """
     Read a file as bytes, split into lines preserving original line endings, and decode as UTF-8.
 
+    Inside an io_pipeline, the content prefetched in the background is used.
+
     Args:
         filepath: Path to the file to read
+        prefilter: Optional byte strings; if the file contains none of them,
+            it is not decoded and None is returned
 
     Returns:
-        List of (text, ending) tuples, where 'text' is the line content and 'ending' is the original line ending.
+        List of (text, ending) tuples, where 'text' is the line content and 'ending' is the original line ending,
+        or None if the file was skipped by the prefilter.
     """
-    with open(filepath, "rb") as f:
-        content = f.read()
+    content = read_bytes(filepath)
+    if prefilter is not None and not contains_any(content, prefilter):
+        return None
 
     lines = []
     for match in LINE_SPLITTER.finditer(content):
@@ -112,17 +180,136 @@ def read_text_preserve_endings(filepath):
     return lines
 
 
+def _count_line_endings(buffer, start, end):
+    """Count the line endings (CRLF, CR or LF) in buffer[start:end]."""
+    count = 0
+    while start < end:
+        stop = min(end, start + SCAN_CHUNK_SIZE)
+        if (
+            stop < end
+            and buffer[stop - 1 : stop] == b"\r"
+            and buffer[stop : stop + 1] == b"\n"
+        ):
+            stop += 1  # Keep a CRLF in one chunk
+        chunk = buffer[start:stop]
+        count += chunk.count(b"\n") + chunk.count(b"\r") - chunk.count(b"\r\n")
+        start = stop
+    return count
+
+
+def _line_start(buffer, position, floor):
+    """Return the offset of the line holding position, searching back to floor."""
+    start = buffer.rfind(b"\n", floor, position) + 1 or floor
+    return buffer.rfind(b"\r", start, position) + 1 or start
+
+
+def _line_end(buffer, position):
+    """Return the offset of the line ending at or after position."""
+    end = buffer.find(b"\n", position)
+    if end == -1:
+        end = len(buffer)
+    carriage_return = buffer.find(b"\r", position, end)
+    return end if carriage_return == -1 else carriage_return
+
+
+def iter_matching_lines(filepath, needles):
+    """
+    Yield the lines of a file that contain any of the given byte strings.
+
+    The file is memory-mapped and searched in place, so it is never copied
+    into memory as a whole; only the matching lines are decoded as UTF-8.
+    Lines and line numbers are the same as those of
+    read_text_preserve_endings(). Invalid UTF-8 is only detected in the
+    lines that are decoded.
+
+    Args:
+        filepath: Path to the file to scan
+        needles: Byte strings to look for, such as b"xref:"
+
+    Yields:
+        (line_number, text) tuples in file order, each line at most once,
+        where 'text' is the decoded line without its ending
+    """
+    candidates = re.compile(b"|".join(re.escape(needle) for needle in needles))
+    with profile_phase("read"):
+        f = open(filepath, "rb")
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        count_bytes("read", size)
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            line_number = 1
+            counted_to = 0
+            position = 0
+            while True:
+                match = candidates.search(buffer, position)
+                if match is None:
+                    return
+                found = match.start()
+                start = _line_start(buffer, found, counted_to)
+                line_number += _count_line_endings(buffer, counted_to, start)
+                counted_to = start
+                end = _line_end(buffer, found)
+                yield line_number, buffer[start:end].decode("utf-8")
+                # Continue after the line ending, counting it with the next line
+                position = end + 1
+
+
 def write_text_preserve_endings(filepath, lines):
     """
     Write a list of (text, ending) tuples to a file, preserving original line endings.
 
+    Inside an io_pipeline, the write is queued and done in the background.
+
     Args:
         filepath: Path to the file to write
         lines: List of (text, ending) tuples, where 'ending' is the original line ending (e.g., '\n', '\r\n', or '').
     """
-    with open(filepath, "w", encoding="utf-8", newline="") as f:
-        for text, ending in lines:
-            f.write(text + ending)
+    if not pipelined_write(filepath, _write_text, filepath, list(lines)):
+        _write_text(filepath, lines)
+
+
+def _write_text(filepath, lines):
+    with profile_phase("write"):
+        with open(filepath, "w", encoding="utf-8", newline="") as f:
+            for text, ending in lines:
+                f.write(text + ending)
+            written = f.tell()
+    count_bytes("write", written)
+
+
+def write_bytes_atomic(filepath, data):
+    """
+    Replace a file with new content through a temporary file and a rename.
+
+    The file gets a new inode, so hard links to the old content keep the
+    original bytes, and readers never see a partially written file.
+    Permission bits are carried over. Inside an io_pipeline, the write is
+    queued and done in the background.
+
+    Args:
+        filepath: Path to the file to replace
+        data: New file content as bytes
+    """
+    if not pipelined_write(filepath, _write_bytes_atomic, filepath, bytes(data)):
+        _write_bytes_atomic(filepath, data)
+
+
+def _write_bytes_atomic(filepath, data):
+    directory = os.path.dirname(os.path.abspath(filepath))
+    with profile_phase("write"):
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            if os.path.exists(filepath):
+                shutil.copymode(filepath, temp_path)
+            os.replace(temp_path, filepath)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    count_bytes("write", len(data))
 
 
 def is_valid_adoc_file(filepath):
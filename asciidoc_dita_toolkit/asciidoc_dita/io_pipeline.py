@@ -0,0 +1,274 @@
+"""
+io_pipeline.py - Prefetched reads and pipelined writes for per-file workflows.
+
+On network filesystems such as NFS, opening and reading each file costs
+far more latency than processing it. An IOPipeline overlaps that latency
+with the processing:
+
+- Reads: while one file is processed, a thread pool reads the next files
+  in the background, with at most a bounded number of files read ahead.
+- Writes: rewritten files are handed to writer threads through a bounded
+  queue, so processing continues while earlier files are being written.
+  When the queue is full, the next write waits, which bounds the memory
+  held by pending writes.
+
+The pipeline plugs in behind the existing per-file callbacks: while a
+pipeline is active, file_utils.read_text_preserve_endings(),
+write_text_preserve_endings() and write_bytes_atomic() go through it, so
+callbacks need no changes. Workflows enable it with
+process_adoc_files(args, func, prefetch=N).
+
+Usage Examples:
+    with io_pipeline(workers=8) as pipeline:
+        for filepath in pipeline.prefetch(filepaths):
+            process(filepath)
+    # All writes have completed here; write errors are in pipeline.errors
+
+Writes to the same file are applied in order, and reading a file waits for
+its pending writes. Write errors are logged and collected rather than
+raised in the processing thread; process_adoc_files() raises them together
+as a PipelineWriteError once all writes have finished.
+"""
+
+import logging
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional
+
+from .profiling import count_bytes, profile_phase
+
+logger = logging.getLogger(__name__)
+
+# Threads used by --prefetch without a value
+DEFAULT_IO_WORKERS = 8
+
+# Files read ahead per worker thread
+READ_AHEAD_PER_WORKER = 2
+
+# Pending writes per worker thread before submitting another write blocks
+WRITE_QUEUE_PER_WORKER = 4
+
+_active: Optional["IOPipeline"] = None
+
+
+class PipelineWriteError(OSError):
+    """Background writes of an io_pipeline failed; errors lists each failure."""
+
+    def __init__(self, errors: List[str]):
+        super().__init__(
+            f"{len(errors)} background write(s) failed: {'; '.join(errors)}"
+        )
+        self.errors = errors
+
+
+def _read_file(filepath: str) -> bytes:
+    with profile_phase("prefetch"):
+        with open(filepath, "rb") as f:
+            data = f.read()
+    count_bytes("prefetch", len(data))
+    return data
+
+
+class IOPipeline:
+    """
+    Background reads ahead of the processed file and background writes.
+
+    Not thread-safe for processing: one thread iterates prefetch() and
+    calls read() and write(); the pipeline's own threads do the I/O.
+    """
+
+    def __init__(self, workers: int = DEFAULT_IO_WORKERS):
+        self.workers = max(1, workers)
+        self.read_ahead = self.workers * READ_AHEAD_PER_WORKER
+        self.errors: List[str] = []
+        self.failed_paths: List[str] = []  # File of each entry in errors
+        self.files_prefetched = 0
+        self.files_written = 0
+        self._pid = os.getpid()
+        self._readers = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="adt-read"
+        )
+        self._prefetched: Dict[str, Future] = {}
+        self._writes: "queue.Queue[Any]" = queue.Queue(
+            maxsize=self.workers * WRITE_QUEUE_PER_WORKER
+        )
+        self._pending: Dict[str, int] = {}
+        self._pending_changed = threading.Condition()
+        self._writers = [
+            threading.Thread(
+                target=self._write_loop, name=f"adt-write-{i}", daemon=True
+            )
+            for i in range(self.workers)
+        ]
+        for thread in self._writers:
+            thread.start()
+
+    @property
+    def usable(self) -> bool:
+        """False in a process forked while the pipeline was active."""
+        return os.getpid() == self._pid
+
+    def prefetch(self, filepaths: Iterable[str]) -> Iterator[str]:
+        """
+        Yield file paths in order, reading the upcoming files in the background.
+
+        Args:
+            filepaths: Files about to be processed, in processing order
+
+        Yields:
+            Each file path, once its read has been started
+        """
+        upcoming = iter(filepaths)
+        window: Deque[str] = deque()
+
+        def fill() -> None:
+            while len(window) < self.read_ahead:
+                filepath = next(upcoming, None)
+                if filepath is None:
+                    return
+                if filepath not in self._prefetched:
+                    self._wait_for_writes(filepath)
+                    self._prefetched[filepath] = self._readers.submit(
+                        _read_file, filepath
+                    )
+                window.append(filepath)
+
+        fill()
+        while window:
+            filepath = window.popleft()
+            try:
+                yield filepath
+            finally:
+                # Drop the content if the callback did not read the file
+                self._prefetched.pop(filepath, None)
+            fill()
+
+    def read(self, filepath: str) -> Optional[bytes]:
+        """
+        Return the prefetched content of a file, waiting for it if necessary.
+
+        Returns:
+            The file content, or None if the file was not prefetched or
+            reading it failed; the caller then reads it directly and
+            reports any error itself
+        """
+        future = self._prefetched.pop(filepath, None)
+        if future is None:
+            self._wait_for_writes(filepath)
+            return None
+        try:
+            # Time spent waiting for the background read counts as reading
+            with profile_phase("read"):
+                data = future.result()
+        except OSError:
+            return None
+        self.files_prefetched += 1
+        return data
+
+    def write(self, filepath: str, func: Callable[..., Any], *args: Any) -> None:
+        """
+        Queue func(*args) to write filepath on a writer thread.
+
+        Blocks while the write queue is full, and while an earlier write of
+        the same file is still pending.
+        """
+        self._wait_for_writes(filepath)
+        with self._pending_changed:
+            self._pending[filepath] = self._pending.get(filepath, 0) + 1
+        self._writes.put((filepath, func, args))
+
+    def _wait_for_writes(self, filepath: str) -> None:
+        with self._pending_changed:
+            while self._pending.get(filepath):
+                self._pending_changed.wait()
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._writes.get()
+            if item is None:
+                return
+            filepath, func, args = item
+            error = None
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error(f"Error writing {filepath}: {e}")
+                error = f"{filepath}: {e}"
+            finally:
+                with self._pending_changed:
+                    if error is None:
+                        self.files_written += 1
+                    else:
+                        self.errors.append(error)
+                        self.failed_paths.append(filepath)
+                    self._pending[filepath] -= 1
+                    if not self._pending[filepath]:
+                        del self._pending[filepath]
+                    self._pending_changed.notify_all()
+
+    def close(self) -> None:
+        """Wait for all queued writes and stop the pipeline's threads."""
+        for _ in self._writers:
+            self._writes.put(None)
+        for thread in self._writers:
+            thread.join()
+        self._prefetched.clear()
+        self._readers.shutdown(wait=True)
+
+
+@contextmanager
+def io_pipeline(workers: int = DEFAULT_IO_WORKERS) -> Iterator[IOPipeline]:
+    """
+    Route file_utils reads and writes through an IOPipeline for a block.
+
+    Leaving the block waits for all queued writes to complete.
+
+    Args:
+        workers: Number of reader threads and of writer threads
+
+    Yields:
+        The active IOPipeline
+    """
+    global _active
+    previous = _active
+    pipeline = IOPipeline(workers)
+    _active = pipeline
+    try:
+        yield pipeline
+    finally:
+        _active = previous
+        pipeline.close()
+
+
+def pipelined_read(filepath: str) -> Optional[bytes]:
+    """
+    Return a file's prefetched content if an active pipeline has it.
+
+    Returns:
+        The content, or None if the file should be read directly
+    """
+    if _active is None or not _active.usable:
+        return None
+    return _active.read(filepath)
+
+
+def pipelined_write(filepath: str, func: Callable[..., Any], *args: Any) -> bool:
+    """
+    Queue a write on the active pipeline, if there is one.
+
+    Args:
+        filepath: File the write replaces
+        func: Function doing the write, called as func(*args)
+        *args: Arguments to pass; they must not be changed afterwards
+
+    Returns:
+        True if the write was queued, False if the caller should write now
+    """
+    if _active is None or not _active.usable:
+        return False
+    _active.write(filepath, func, *args)
+    return True
@@ -0,0 +1,241 @@
+"""
+memory_profiling.py - tracemalloc-based memory measurements for profiled runs.
+
+Used by profiling.Profiler when a run is profiled with --memory-profile or
+ADT_MEMORY_PROFILE. It measures:
+
+- the peak traced memory of each phase (discovery, scan, report, ...)
+- the deep size of the large plugin data structures, such as
+  CrossReference's id_map and all_xrefs and ContextAnalyzer's
+  file_analyses, when the plugins report them before building their reports
+- the allocation sites holding the most memory at the largest point
+  measured
+
+Peaks are per phase on Python 3.9 and later. Python 3.8 has no
+tracemalloc.reset_peak(), so there each phase reports the peak of the run
+so far.
+
+tracemalloc slows a run down considerably, so timings of a run with memory
+profiling are not comparable with those of a plain run.
+"""
+
+import os
+import sys
+import tracemalloc
+from array import array
+from dataclasses import dataclass
+from types import FunctionType, ModuleType
+from typing import Any, Dict, List, Optional, Tuple
+
+# Frames kept per allocation traceback
+TRACEBACK_FRAMES = 1
+
+# Number of allocation sites listed in the summary
+DEFAULT_TOP_SITES = 10
+
+_LEAF_TYPES = (str, bytes, bytearray, int, float, complex, bool, type(None), array)
+_SKIPPED_TYPES = (type, ModuleType, FunctionType)
+
+_reset_peak = getattr(tracemalloc, "reset_peak", None)
+
+
+def deep_sizeof(obj: Any) -> int:
+    """
+    Return the memory used by an object and everything it references.
+
+    Containers, instance dictionaries and __slots__ are followed; each
+    object is counted once, including strings shared between records.
+    Classes, modules and functions are not followed.
+
+    Args:
+        obj: Object to measure
+
+    Returns:
+        Size in bytes
+    """
+    seen = set()
+    pending = [obj]
+    total = 0
+    while pending:
+        item = pending.pop()
+        if id(item) in seen or isinstance(item, _SKIPPED_TYPES):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+
+        if isinstance(item, _LEAF_TYPES):
+            continue
+        if isinstance(item, dict):
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            pending.extend(item)
+        else:
+            instance_dict = getattr(item, "__dict__", None)
+            if instance_dict is not None:
+                pending.append(instance_dict)
+            for cls in type(item).__mro__:
+                slots = cls.__dict__.get("__slots__", ())
+                if isinstance(slots, str):
+                    slots = (slots,)
+                for slot in slots:
+                    if slot != "__dict__" and hasattr(item, slot):
+                        pending.append(getattr(item, slot))
+    return total
+
+
+def format_bytes(size: int) -> str:
+    """Format a byte count with a binary unit."""
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+@dataclass
+class StructureSize:
+    """Largest measured size of one plugin data structure."""
+
+    name: str
+    bytes: int
+    items: Optional[int] = None
+
+
+class MemoryTracker:
+    """
+    Per-phase peaks, structure sizes and allocation sites of one run.
+
+    The profiler calls enter() and exit() around every phase, with its
+    per-thread phase stack; each stack frame is a list whose second item
+    is the peak seen so far inside that phase.
+    """
+
+    def __init__(self, top_sites: int = DEFAULT_TOP_SITES):
+        self.top_sites = top_sites
+        self.peak = 0
+        self.structures: Dict[str, StructureSize] = {}
+        self.sites: List[Tuple[str, int, int]] = []  # (location, size, count)
+        self.sites_taken_at = 0
+        self._started_tracing = False
+
+    def start(self) -> None:
+        """Start tracing allocations, unless they are already traced."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEBACK_FRAMES)
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        """Record the run's peak and stop tracing if start() began it."""
+        self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _close_parent(self, stack: List[list]) -> None:
+        # Fold the peak since the last reset into the enclosing phase
+        peak = tracemalloc.get_traced_memory()[1]
+        self.peak = max(self.peak, peak)
+        if stack:
+            stack[-1][1] = max(stack[-1][1], peak)
+        if _reset_peak is not None:
+            _reset_peak()
+
+    def enter(self, stack: List[list]) -> None:
+        """Start measuring a phase about to be pushed onto the stack."""
+        self._close_parent(stack)
+
+    def exit(self, frame: list, stack: List[list]) -> int:
+        """
+        Finish measuring a phase already popped from the stack.
+
+        Returns:
+            Peak traced memory during the phase, in bytes
+        """
+        peak = max(frame[1], tracemalloc.get_traced_memory()[1])
+        self.peak = max(self.peak, peak)
+        if stack:
+            stack[-1][1] = max(stack[-1][1], peak)
+        if _reset_peak is not None:
+            _reset_peak()
+        return peak
+
+    def take_sites(self, stack: List[list]) -> None:
+        """Record the top allocation sites if more memory is live than before."""
+        current = tracemalloc.get_traced_memory()[0]
+        if current <= self.sites_taken_at:
+            return
+        self._close_parent(stack)
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ]
+        )
+        self.sites = []
+        for stat in snapshot.statistics("lineno")[: self.top_sites]:
+            frame = stat.traceback[0]
+            location = f"{os.path.relpath(frame.filename)}:{frame.lineno}"
+            self.sites.append((location, stat.size, stat.count))
+        self.sites_taken_at = current
+        del snapshot
+
+        # Leave the snapshot's own allocations out of the phase peaks
+        if _reset_peak is not None:
+            _reset_peak()
+
+    def record_structures(
+        self, owner: str, structures: Dict[str, Any], stack: List[list]
+    ) -> None:
+        """
+        Measure plugin data structures, keeping the largest size of each.
+
+        Args:
+            owner: Plugin or class the structures belong to
+            structures: Structure name -> object
+            stack: The calling thread's phase stack
+        """
+        self.take_sites(stack)
+        self._close_parent(stack)
+
+        for name, obj in structures.items():
+            key = f"{owner}.{name}"
+            size = deep_sizeof(obj)
+            try:
+                items = len(obj)
+            except TypeError:
+                items = None
+            previous = self.structures.get(key)
+            if previous is None or size > previous.bytes:
+                self.structures[key] = StructureSize(key, size, items)
+
+        # Leave the measurement's own allocations out of the phase peaks
+        if _reset_peak is not None:
+            _reset_peak()
+
+    def format(self) -> List[str]:
+        """Format the memory section of the profile summary as lines."""
+        lines = ["=== Memory ===", f"Peak traced memory: {format_bytes(self.peak)}"]
+        if _reset_peak is None:
+            lines.append("(Python 3.8: phase peaks are peaks of the run so far)")
+
+        if self.structures:
+            lines.extend(["", f"{'Data structure':<40}{'Items':>10}{'Size':>14}"])
+            for structure in sorted(self.structures.values(), key=lambda s: -s.bytes):
+                items = "" if structure.items is None else structure.items
+                lines.append(
+                    f"{structure.name:<40}{items:>10}{format_bytes(structure.bytes):>14}"
+                )
+
+        if self.sites:
+            lines.extend(
+                [
+                    "",
+                    "Top allocation sites (with "
+                    f"{format_bytes(self.sites_taken_at)} traced):",
+                ]
+            )
+            for location, size, count in self.sites:
+                lines.append(f"{format_bytes(size):>12}{count:>10} blocks  {location}")
+        return lines
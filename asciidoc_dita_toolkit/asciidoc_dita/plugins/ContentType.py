@@ -9,16 +9,25 @@ __description__ = "Add a :_mod-docs-content-type: label in .adoc files where tho
 
 import logging
 import sys
+from dataclasses import asdict
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
-from ..cli_utils import common_arg_parser
+from ..cli_utils import add_prefetch_argument, common_arg_parser
+from ..io_pipeline import PipelineWriteError
 from ..plugin_manager import is_plugin_enabled
-from ..workflow_utils import process_adoc_files
+from ..profiling import profile_phase, profiled
+from ..workflow_utils import collect_adoc_files, process_adoc_files
 
 from .content_type_detector import ContentTypeDetector, ContentTypeConfig
 from .ui_interface import MinimalistConsoleUI, QuietModeUI, ConsoleUI, BatchUI
 from .content_type_processor import ContentTypeProcessor
+from .content_type_batch import (
+    format_batch_summary,
+    format_report_summary,
+    run_content_type_batch,
+    run_content_type_report,
+)
 
 # Try to import ADTModule for the new pattern
 try:
@@ -82,6 +91,17 @@ class ContentTypeModule(ADTModule):
         self.quiet_mode = config.get("quiet_mode", False)
         self.legacy_mode = config.get("legacy_mode", False)
         self.verbose = config.get("verbose", False)
+        self.workers = config.get("workers")  # None means one per CPU
+        self.prefetch = config.get("prefetch") or 0  # I/O threads, 0 for none
+
+        # Dry-run classification report configuration
+        self.report_mode = config.get("report", False)
+        self.report_output = config.get("report_output")
+        self.report_format = config.get("report_format") or (
+            "jsonl"
+            if self.report_output and self.report_output.endswith(".jsonl")
+            else "csv"
+        )
 
         # Content type detection configuration
         detector_config = config.get("detector_config")
@@ -107,6 +127,7 @@ class ContentTypeModule(ADTModule):
         self.content_types_assigned = 0
         self.content_types_updated = 0
         self.warnings_generated = 0
+        self.write_errors: List[str] = []
 
         # Initialize detector and processor
         self.detector = ContentTypeDetector(self.detector_config)
@@ -118,6 +139,10 @@ class ContentTypeModule(ADTModule):
             print(f"  Batch mode: {self.batch_mode}")
             print(f"  Quiet mode: {self.quiet_mode}")
             print(f"  Legacy mode: {self.legacy_mode}")
+            if self.batch_mode:
+                print(f"  Workers: {self.workers or 'auto'}")
+            if self.prefetch:
+                print(f"  Prefetch threads: {self.prefetch}")
             print(f"  Detector config: {type(self.detector_config).__name__}")
 
     def _create_ui_interface(self):
@@ -131,6 +156,7 @@ class ContentTypeModule(ADTModule):
         else:
             return MinimalistConsoleUI()
 
+    @profiled("ContentType")
     def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute the content type processing.
@@ -161,18 +187,34 @@ class ContentTypeModule(ADTModule):
             self.content_types_assigned = 0
             self.content_types_updated = 0
             self.warnings_generated = 0
-
-            # Process files using the existing logic
-            process_adoc_files(args, self._process_file_wrapper)
-
-            return {
+            self.write_errors = []
+
+            if self.report_mode:
+                return self._run_report(args)
+
+            batch_summary = None
+            if self.batch_mode:
+                batch_summary = self._run_batch(args)
+            else:
+                # Process files using the existing logic
+                try:
+                    process_adoc_files(args, self._process_file_wrapper, self.prefetch)
+                except PipelineWriteError as e:
+                    # With prefetch, files are written after they were reported
+                    self.write_errors = e.errors
+                    self.warnings_generated += len(e.errors)
+                    for error in e.errors:
+                        print(f"Error writing {error}")
+
+            result = {
                 "module_name": self.name,
                 "version": self.version,
                 "files_processed": self.files_processed,
                 "content_types_assigned": self.content_types_assigned,
                 "content_types_updated": self.content_types_updated,
                 "warnings_generated": self.warnings_generated,
-                "success": True,
+                "write_errors": self.write_errors,
+                "success": not self.write_errors,
                 "ui_mode": self._get_ui_mode_name(),
                 "detector_config": {
                     "filename_prefixes": len(self.detector_config.filename_prefixes),
@@ -180,6 +222,14 @@ class ContentTypeModule(ADTModule):
                     "content_patterns": len(self.detector_config.content_patterns),
                 },
             }
+            if batch_summary is not None:
+                result["batch_summary"] = asdict(batch_summary)
+            if self.write_errors:
+                result["error"] = (
+                    f"{len(self.write_errors)} file(s) could not be written"
+                )
+
+            return result
 
         except Exception as e:
             error_msg = f"Error in ContentType module: {e}"
@@ -195,6 +245,81 @@ class ContentTypeModule(ADTModule):
                 "content_types_updated": self.content_types_updated,
             }
 
+    def _run_batch(self, args):
+        """
+        Process all files with the non-interactive batch engine.
+
+        Files are collected first, then detected in a process pool and
+        rewritten together; a single summary is printed at the end. With
+        prefetch, the rewrites are written by that many background threads.
+
+        Args:
+            args: Args object with file, directory and recursive attributes
+
+        Returns:
+            BatchSummary for the run
+        """
+        filepaths = collect_adoc_files(args)
+
+        with profile_phase("batch", files=len(filepaths)):
+            summary = run_content_type_batch(
+                filepaths,
+                self.detector_config,
+                workers=self.workers,
+                prefetch=self.prefetch,
+            )
+        self.write_errors = summary.write_errors
+
+        self.files_processed = summary.files_processed
+        self.content_types_assigned = summary.attributes_added
+        self.content_types_updated = summary.attributes_updated
+        self.warnings_generated = len(summary.errors)
+
+        with profile_phase("report"):
+            print(format_batch_summary(summary))
+        return summary
+
+    def _run_report(self, args) -> Dict[str, Any]:
+        """
+        Classify all files and write a dry-run report without changing them.
+
+        Args:
+            args: Args object with file, directory and recursive attributes
+
+        Returns:
+            Dictionary with execution results
+        """
+        filepaths = collect_adoc_files(args)
+
+        with profile_phase("report", files=len(filepaths)):
+            if self.report_output:
+                with open(self.report_output, "w", encoding="utf-8", newline="") as f:
+                    summary = run_content_type_report(
+                        filepaths, f, self.report_format, self.detector_config, self.workers
+                    )
+                print(format_report_summary(summary))
+                print(f"Classification report saved to {self.report_output}")
+            else:
+                summary = run_content_type_report(
+                    filepaths, sys.stdout, self.report_format, self.detector_config, self.workers
+                )
+                # Keep stdout clean for the report itself
+                print(format_report_summary(summary), file=sys.stderr)
+
+        self.files_processed = summary.files_classified
+        self.warnings_generated = summary.errors
+
+        return {
+            "module_name": self.name,
+            "version": self.version,
+            "success": True,
+            "files_processed": self.files_processed,
+            "warnings_generated": self.warnings_generated,
+            "report_format": self.report_format,
+            "report_output": self.report_output,
+            "report_summary": asdict(summary),
+        }
+
     def _get_ui_mode_name(self) -> str:
         """Get the name of the current UI mode."""
         if self.batch_mode:
@@ -399,12 +524,18 @@ def main(args):
             "quiet_mode": getattr(args, "quiet_mode", False),
             "legacy_mode": getattr(args, "legacy", False),
             "verbose": getattr(args, "verbose", False),
+            "workers": getattr(args, "workers", None),
+            "prefetch": getattr(args, "prefetch", None),
+            "report": getattr(args, "report", False),
+            "report_format": getattr(args, "report_format", None),
+            "report_output": getattr(args, "report_output", None),
             "detector_config": None,  # Use default configuration
         }
 
         # Handle interactive mode selection if needed
         if (
-            not config["batch_mode"]
+            not config["report"]
+            and not config["batch_mode"]
             and not config["legacy_mode"]
             and not config["quiet_mode"]
         ):
@@ -430,6 +561,8 @@ def main(args):
         # Cleanup
         module.cleanup()
 
+        if result.get("write_errors"):
+            sys.exit(1)
         return result
     else:
         # Fallback to legacy implementation
@@ -465,20 +598,34 @@ def main(args):
         process_adoc_files(args, process_file_wrapper)
 
 
-def register_subcommand(subparsers):
-    """Register this plugin as a subcommand."""
-    if not is_plugin_enabled("ContentType"):
-        return  # Plugin is disabled, don't register
-
-    parser = subparsers.add_parser("ContentType", help=__description__)
-    common_arg_parser(parser)
-
-    # Add additional options for the refactored plugin
+def add_arguments(parser):
+    """Add ContentType-specific options to a subcommand parser."""
     parser.add_argument(
         "--batch",
         action="store_true",
         help="Run in batch mode without prompting for input",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes for batch and report modes (default: one per CPU)",
+    )
+    add_prefetch_argument(parser)
+    parser.add_argument(
+        "--report",
+        action="store_true",
+        help="Classify files without changing them and write a CSV or JSONL report",
+    )
+    parser.add_argument(
+        "--report-format",
+        choices=["csv", "jsonl"],
+        help="Report format (default: from --report-output extension, else csv)",
+    )
+    parser.add_argument(
+        "--report-output",
+        type=str,
+        help="Save the report to the specified file instead of printing it",
+    )
     parser.add_argument(
         "--legacy",
         action="store_true",
@@ -489,6 +636,18 @@ def register_subcommand(subparsers):
         action="store_true",
         help="Auto-assign TBD to unknown content types without prompting",
     )
+
+
+def register_subcommand(subparsers):
+    """Register this plugin as a subcommand."""
+    if not is_plugin_enabled("ContentType"):
+        return  # Plugin is disabled, don't register
+
+    parser = subparsers.add_parser("ContentType", help=__description__)
+    common_arg_parser(parser)
+
+    # Add additional options for the refactored plugin
+    add_arguments(parser)
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
     parser.add_argument(
         "--quiet", action="store_true", help="Suppress non-error output"
@@ -17,13 +17,27 @@ import os
 import sys
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import List, Dict, Optional, Set, Any
+from typing import List, Dict, Optional, Set, Any, Tuple
 import logging
 
 from ..cli_utils import common_arg_parser
-from ..file_utils import find_adoc_files, read_text_preserve_endings
+from ..compact_records import intern_value
+from ..file_utils import (
+    MMAP_THRESHOLD,
+    find_adoc_files,
+    iter_matching_lines,
+    read_text_preserve_endings,
+)
+from ..profiling import profile_phase, profiled, record_structures
 from ..workflow_utils import process_adoc_files
 from ..regex_patterns import CompiledPatterns
+from ..report_snapshot import SnapshotWriter
+from ..report_writers import (
+    STREAM_FORMATS,
+    MultiReportWriter,
+    ReportWriter,
+    open_report_writer,
+)
 
 # Try to import ADTModule for the new pattern
 try:
@@ -46,11 +60,40 @@ except ImportError:
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Columns of the CSV report, shared by all record types
+ANALYSIS_CSV_FIELDS = (
+    "file",
+    "line",
+    "id",
+    "base_id",
+    "context",
+    "target_id",
+    "target_file",
+    "text",
+    "context_attributes",
+    "context_ids",
+    "xrefs",
+    "links",
+    "files",
+    "suggestion",
+    "files_scanned",
+    "files_with_context_ids",
+    "total_context_ids",
+    "total_xrefs",
+    "total_links",
+    "collisions",
+    "low_risk",
+    "medium_risk",
+    "high_risk",
+)
+
 
 @dataclass
 class IDWithContext:
     """Represents an ID with context suffix found in documentation."""
 
+    __slots__ = ("id_value", "base_id", "context_value", "filepath", "line_number")
+
     id_value: str  # Full ID (e.g., "topic_banana")
     base_id: str  # Base without context (e.g., "topic")
     context_value: str  # Context part (e.g., "banana")
@@ -62,6 +105,8 @@ class IDWithContext:
 class XrefUsage:
     """Represents a cross-reference usage found in documentation."""
 
+    __slots__ = ("target_id", "target_file", "filepath", "line_number", "full_match")
+
     target_id: str
     target_file: str  # Empty if same-file reference
     filepath: str  # File containing the xref
@@ -82,6 +127,14 @@ class CollisionReport:
 class FileAnalysis:
     """Analysis results for a single file."""
 
+    __slots__ = (
+        "filepath",
+        "context_attributes",
+        "ids_with_context",
+        "xref_usages",
+        "link_usages",
+    )
+
     filepath: str
     context_attributes: List[str]
     ids_with_context: List[IDWithContext]
@@ -100,6 +153,7 @@ class AnalysisReport:
     total_links: int
     potential_collisions: List[CollisionReport]
     file_analyses: List[FileAnalysis]
+    files_skipped: int = 0
 
 
 class ContextAnalyzerModule(ADTModule):
@@ -146,17 +200,21 @@ class ContextAnalyzerModule(ADTModule):
         self.detailed = config.get("detailed", False)
         self.collisions_only = config.get("collisions_only", False)
         self.output_file = config.get("output_file")
+        self.snapshot_file = config.get("snapshot_file")
+        self.stream = config.get("stream", False)
         self.verbose = config.get("verbose", False)
+        self.mmap_threshold = config.get("mmap_threshold", MMAP_THRESHOLD)
 
         # Initialize statistics
         self.files_analyzed = 0
+        self.files_skipped = 0
         self.context_ids_found = 0
         self.xrefs_found = 0
         self.links_found = 0
         self.collisions_detected = 0
 
         # Initialize analyzer
-        self.analyzer = ContextAnalyzer()
+        self.analyzer = ContextAnalyzer(mmap_threshold=self.mmap_threshold)
 
         if self.verbose:
             print(f"Initialized ContextAnalyzer v{self.version}")
@@ -165,6 +223,7 @@ class ContextAnalyzerModule(ADTModule):
             print(f"  Collisions only: {self.collisions_only}")
             print(f"  Output file: {self.output_file}")
 
+    @profiled("ContextAnalyzer")
     def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute the context analysis.
@@ -192,36 +251,48 @@ class ContextAnalyzerModule(ADTModule):
 
             # Reset statistics
             self.files_analyzed = 0
+            self.files_skipped = 0
             self.context_ids_found = 0
             self.xrefs_found = 0
             self.links_found = 0
             self.collisions_detected = 0
 
+            if self.output_format in STREAM_FORMATS or (
+                self.stream and self.output_format == "text"
+            ):
+                return self._execute_streaming(args)
+
             # Process files using the existing logic
             process_adoc_files(args, self._process_file_wrapper)
 
-            # Generate report
-            report = self.analyzer.generate_report()
+            with profile_phase("report"):
+                # Generate report
+                report = self.analyzer.generate_report()
+
+                # Update statistics
+                self.files_analyzed = report.total_files_scanned
+                self.files_skipped = report.files_skipped
+                self.context_ids_found = report.total_context_ids
+                self.xrefs_found = report.total_xrefs
+                self.links_found = report.total_links
+                self.collisions_detected = len(report.potential_collisions)
 
-            # Update statistics
-            self.files_analyzed = report.total_files_scanned
-            self.context_ids_found = report.total_context_ids
-            self.xrefs_found = report.total_xrefs
-            self.links_found = report.total_links
-            self.collisions_detected = len(report.potential_collisions)
+                if self.snapshot_file:
+                    save_analysis_snapshot(self.analyzer, report, self.snapshot_file)
 
-            # Generate output content
-            output_content = self._generate_output_content(report)
+                # Generate output content
+                output_content = self._generate_output_content(report)
 
-            # Save to file if specified
-            if self.output_file:
-                self._save_output_to_file(output_content)
+                # Save to file if specified
+                if self.output_file:
+                    self._save_output_to_file(output_content)
 
             return {
                 "module_name": self.name,
                 "version": self.version,
                 "success": True,
                 "files_analyzed": self.files_analyzed,
+                "files_skipped": self.files_skipped,
                 "context_ids_found": self.context_ids_found,
                 "xrefs_found": self.xrefs_found,
                 "links_found": self.links_found,
@@ -242,12 +313,70 @@ class ContextAnalyzerModule(ADTModule):
                 "error": str(e),
                 "success": False,
                 "files_analyzed": self.files_analyzed,
+                "files_skipped": self.files_skipped,
                 "context_ids_found": self.context_ids_found,
                 "xrefs_found": self.xrefs_found,
                 "links_found": self.links_found,
                 "collisions_detected": self.collisions_detected,
             }
 
+    def _execute_streaming(self, args) -> Dict[str, Any]:
+        """
+        Run the analysis, writing each file's results as soon as it is analyzed.
+
+        Only the collision-detection state is kept for the whole run; the
+        collisions and summary are written after the last file.
+
+        Args:
+            args: Arguments passed to process_adoc_files
+
+        Returns:
+            Dictionary with execution results
+        """
+        writer = open_analysis_writer(
+            self.output_format, self.output_file, self.detailed, self.collisions_only
+        )
+        if self.snapshot_file:
+            writer = MultiReportWriter(
+                [writer, SnapshotWriter(self.snapshot_file, "ContextAnalyzer")]
+            )
+        self.analyzer.writer = writer
+        try:
+            process_adoc_files(args, self._process_file_wrapper)
+            with profile_phase("report"):
+                report = self.analyzer.generate_report()
+                write_analysis_summary(writer, self.analyzer, report)
+        finally:
+            self.analyzer.writer = None
+            with profile_phase("report"):
+                writer.close()
+
+        self.files_analyzed = report.total_files_scanned
+        self.files_skipped = report.files_skipped
+        self.context_ids_found = report.total_context_ids
+        self.xrefs_found = report.total_xrefs
+        self.links_found = report.total_links
+        self.collisions_detected = len(report.potential_collisions)
+
+        if self.verbose and self.output_file:
+            print(f"Analysis report saved to {self.output_file}")
+
+        return {
+            "module_name": self.name,
+            "version": self.version,
+            "success": True,
+            "files_analyzed": self.files_analyzed,
+            "files_skipped": self.files_skipped,
+            "context_ids_found": self.context_ids_found,
+            "xrefs_found": self.xrefs_found,
+            "links_found": self.links_found,
+            "collisions_detected": self.collisions_detected,
+            "output_format": self.output_format,
+            "output_file": self.output_file,
+            "output_content": None,
+            "report": None,
+        }
+
     def _process_file_wrapper(self, filepath: str) -> bool:
         """
         Wrapper around the process_context_analyzer_file function.
@@ -307,6 +436,7 @@ class ContextAnalyzerModule(ADTModule):
         if self.verbose:
             print(f"ContextAnalyzer cleanup complete")
             print(f"  Total files analyzed: {self.files_analyzed}")
+            print(f"  Files skipped by prefilter: {self.files_skipped}")
             print(f"  Total context IDs found: {self.context_ids_found}")
             print(f"  Total xrefs found: {self.xrefs_found}")
             print(f"  Total links found: {self.links_found}")
@@ -318,14 +448,32 @@ class ContextAnalyzer:
     """
     Analyzes AsciiDoc documentation to report on context usage
     and potential migration complexity.
+
+    When a report writer is given, each file's results are written as soon
+    as the file is analyzed and only the collision-detection state
+    (all_ids) and running totals are kept; file_analyses, all_xrefs and
+    all_links stay empty.
+
+    Files of at least mmap_threshold bytes are scanned through a memory
+    map, decoding only the lines that can hold a match. Smaller files that
+    contain none of the candidate byte strings are not decoded at all;
+    they are still counted as scanned, with nothing found.
     """
 
-    def __init__(self):
+    # Byte strings every line matched by the analyzer's patterns contains
+    CANDIDATE_NEEDLES = (b'[id="', b"xref:", b"link:", b":context:")
+
+    def __init__(
+        self,
+        writer: Optional[ReportWriter] = None,
+        mmap_threshold: int = MMAP_THRESHOLD,
+    ):
         # Use shared regex patterns
         self.id_with_context_regex = CompiledPatterns.ID_WITH_CONTEXT_REGEX
         self.xref_regex = CompiledPatterns.XREF_BASIC_REGEX
         self.link_regex = CompiledPatterns.LINK_REGEX
         self.context_attr_regex = CompiledPatterns.CONTEXT_ATTR_REGEX
+        self.mmap_threshold = mmap_threshold
 
         # Analysis state
         self.all_ids: Dict[str, List[IDWithContext]] = (
@@ -335,6 +483,16 @@ class ContextAnalyzer:
         self.all_links: List[XrefUsage] = []
         self.file_analyses: List[FileAnalysis] = []
 
+        # Streaming output and the running totals it relies on
+        self.writer = writer
+        self.files_scanned = 0
+        self.files_skipped = 0
+        self.files_with_context_ids = 0
+        self.context_ids_count = 0
+        self.xrefs_count = 0
+        self.links_count = 0
+        self.multi_context_files = 0
+
     def analyze_file(self, filepath: str) -> FileAnalysis:
         """
         Analyze a single AsciiDoc file for context usage.
@@ -346,21 +504,21 @@ class ContextAnalyzer:
             FileAnalysis object with results
         """
         try:
-            lines = read_text_preserve_endings(filepath)
-            content = ''.join(text + ending for text, ending in lines)
+            if os.path.getsize(filepath) >= self.mmap_threshold:
+                lines, context_attributes = self._read_candidate_lines(filepath)
+            else:
+                lines, context_attributes = self._read_lines(filepath)
 
-            # Find context attributes
-            context_attributes = []
-            for match in self.context_attr_regex.finditer(content):
-                context_attributes.append(match.group(1).strip())
+            # Every record of this file shares one path string
+            filepath = intern_value(filepath)
 
             # Find IDs with context
             ids_with_context = []
-            for line_num, (text, _) in enumerate(lines, 1):
+            for line_num, text in lines:
                 for match in self.id_with_context_regex.finditer(text):
                     full_id = match.group(1) + '_' + match.group(2)
                     base_id = match.group(1)
-                    context_value = match.group(2)
+                    context_value = intern_value(match.group(2))
 
                     id_with_context = IDWithContext(
                         id_value=full_id,
@@ -378,7 +536,7 @@ class ContextAnalyzer:
 
             # Find xref usage
             xref_usages = []
-            for line_num, (text, _) in enumerate(lines, 1):
+            for line_num, text in lines:
                 for match in self.xref_regex.finditer(text):
                     # XREF_BASIC_PATTERN captures: ([^#\[]+)(?:#([^#\[]+))?(\[.*?\])
                     # Group 1: file_or_id (before # or [)
@@ -391,7 +549,7 @@ class ContextAnalyzer:
 
                     if second_part:
                         # Format: xref:file.adoc#target_id[text]
-                        target_file = first_part
+                        target_file = intern_value(first_part)
                         target_id = second_part
                     else:
                         # Format: xref:target_id[text]
@@ -406,11 +564,12 @@ class ContextAnalyzer:
                         full_match=full_match,
                     )
                     xref_usages.append(xref_usage)
-                    self.all_xrefs.append(xref_usage)
+                    if self.writer is None:
+                        self.all_xrefs.append(xref_usage)
 
             # Find link usage
             link_usages = []
-            for line_num, (text, _) in enumerate(lines, 1):
+            for line_num, text in lines:
                 for match in self.link_regex.finditer(text):
                     # LINK_PATTERN captures: ([^#\[]+)(?:#([^#\[]+))?(\[.*?\])
                     # Group 1: url_or_file (before # or [)
@@ -423,11 +582,11 @@ class ContextAnalyzer:
 
                     if second_part:
                         # Format: link:url#anchor[text]
-                        target_file = first_part
+                        target_file = intern_value(first_part)
                         target_id = second_part
                     else:
                         # Format: link:url[text]
-                        target_file = first_part
+                        target_file = intern_value(first_part)
                         target_id = ""
 
                     link_usage = XrefUsage(
@@ -438,7 +597,8 @@ class ContextAnalyzer:
                         full_match=full_match,
                     )
                     link_usages.append(link_usage)
-                    self.all_links.append(link_usage)
+                    if self.writer is None:
+                        self.all_links.append(link_usage)
 
             file_analysis = FileAnalysis(
                 filepath=filepath,
@@ -448,7 +608,17 @@ class ContextAnalyzer:
                 link_usages=link_usages,
             )
 
-            self.file_analyses.append(file_analysis)
+            self.files_scanned += 1
+            self.files_with_context_ids += 1 if ids_with_context else 0
+            self.context_ids_count += len(ids_with_context)
+            self.xrefs_count += len(xref_usages)
+            self.links_count += len(link_usages)
+            self.multi_context_files += 1 if len(context_attributes) > 1 else 0
+
+            if self.writer is None:
+                self.file_analyses.append(file_analysis)
+            else:
+                self.writer.write_section(analysis_records(file_analysis))
             return file_analysis
 
         except Exception as e:
@@ -494,6 +664,48 @@ class ContextAnalyzer:
 
         return collisions
 
+    def _read_lines(self, filepath: str) -> Tuple[List[Tuple[int, str]], List[str]]:
+        """
+        Read a file into numbered lines and find its context attributes.
+
+        Returns:
+            (line_number, text) tuples for every line, and the context values;
+            both are empty if the file has none of the candidate byte strings
+        """
+        lines = read_text_preserve_endings(filepath, self.CANDIDATE_NEEDLES)
+        if lines is None:
+            self.files_skipped += 1
+            return [], []
+        content = ''.join(text + ending for text, ending in lines)
+
+        context_attributes = []
+        for match in self.context_attr_regex.finditer(content):
+            context_attributes.append(match.group(1).strip())
+
+        return [(n, text) for n, (text, _) in enumerate(lines, 1)], context_attributes
+
+    def _read_candidate_lines(
+        self, filepath: str
+    ) -> Tuple[List[Tuple[int, str]], List[str]]:
+        """
+        Scan a large file through a memory map for the lines that can match.
+
+        Only those lines are decoded, and context attributes are matched
+        line by line.
+
+        Returns:
+            (line_number, text) tuples for the candidate lines, and the
+            context values
+        """
+        lines = list(iter_matching_lines(filepath, self.CANDIDATE_NEEDLES))
+
+        context_attributes = []
+        for _, text in lines:
+            for match in self.context_attr_regex.finditer(text):
+                context_attributes.append(match.group(1).strip())
+
+        return lines, context_attributes
+
     def generate_report(self) -> AnalysisReport:
         """
         Generate a comprehensive analysis report.
@@ -501,8 +713,27 @@ class ContextAnalyzer:
         Returns:
             AnalysisReport object
         """
+        record_structures(
+            "ContextAnalyzer",
+            file_analyses=self.file_analyses,
+            all_ids=self.all_ids,
+            all_xrefs=self.all_xrefs,
+            all_links=self.all_links,
+        )
         collisions = self.detect_id_collisions()
 
+        if self.writer is not None:
+            return AnalysisReport(
+                total_files_scanned=self.files_scanned,
+                files_with_context_ids=self.files_with_context_ids,
+                total_context_ids=self.context_ids_count,
+                total_xrefs=self.xrefs_count,
+                total_links=self.links_count,
+                potential_collisions=collisions,
+                file_analyses=[],
+                files_skipped=self.files_skipped,
+            )
+
         total_files_scanned = len(self.file_analyses)
         files_with_context_ids = len(
             [f for f in self.file_analyses if f.ids_with_context]
@@ -519,8 +750,33 @@ class ContextAnalyzer:
             total_links=total_links,
             potential_collisions=collisions,
             file_analyses=self.file_analyses,
+            files_skipped=self.files_skipped,
         )
 
+    def risk_counts(self, collisions: List[CollisionReport]) -> Dict[str, int]:
+        """
+        Compute the migration risk levels from the collision-detection state.
+
+        Gives the same counts as the summary of format_text_report without
+        needing the per-file analyses.
+
+        Args:
+            collisions: Collisions returned by detect_id_collisions
+
+        Returns:
+            Dictionary with low_risk, medium_risk and high_risk counts
+        """
+        colliding_files = {
+            id_obj.filepath
+            for collision in collisions
+            for id_obj in self.all_ids.get(collision.base_id, [])
+        }
+        return {
+            "low_risk": self.files_with_context_ids - len(colliding_files),
+            "medium_risk": len(collisions),
+            "high_risk": self.multi_context_files,
+        }
+
     def analyze_directory(self, root_dir: str) -> AnalysisReport:
         """
         Analyze all AsciiDoc files in a directory.
@@ -588,6 +844,7 @@ def format_text_report(
     lines.extend(
         [
             f"Files Scanned: {report.total_files_scanned}",
+            f"Files Skipped by Prefilter: {report.files_skipped}",
             f"Files with Context IDs: {report.files_with_context_ids}",
             f"Total IDs with _{{context}}: {report.total_context_ids}",
             f"Total xrefs found: {report.total_xrefs}",
@@ -647,6 +904,184 @@ def format_text_report(
     return "\n".join(lines)
 
 
+def analysis_records(file_analysis: FileAnalysis):
+    """
+    Flatten the analysis of one file into report records.
+
+    Args:
+        file_analysis: FileAnalysis to flatten
+
+    Yields:
+        (kind, record) pairs: one "file" record, then its "id", "xref" and
+        "link" records
+    """
+    filepath = file_analysis.filepath
+    yield "file", {
+        "file": filepath,
+        "context_attributes": file_analysis.context_attributes,
+        "context_ids": len(file_analysis.ids_with_context),
+        "xrefs": len(file_analysis.xref_usages),
+        "links": len(file_analysis.link_usages),
+    }
+    for id_with_context in file_analysis.ids_with_context:
+        yield "id", {
+            "file": filepath,
+            "line": id_with_context.line_number,
+            "id": id_with_context.id_value,
+            "base_id": id_with_context.base_id,
+            "context": id_with_context.context_value,
+        }
+    for kind, usages in (
+        ("xref", file_analysis.xref_usages),
+        ("link", file_analysis.link_usages),
+    ):
+        for usage in usages:
+            yield kind, {
+                "file": filepath,
+                "line": usage.line_number,
+                "target_id": usage.target_id,
+                "target_file": usage.target_file,
+                "text": usage.full_match,
+            }
+
+
+def write_analysis_summary(
+    writer: ReportWriter, analyzer: ContextAnalyzer, report: AnalysisReport
+) -> None:
+    """
+    Write the collision and summary records that close a streamed report.
+
+    Args:
+        writer: Report writer the per-file records were written to
+        analyzer: ContextAnalyzer holding the collision-detection state
+        report: AnalysisReport returned by analyzer.generate_report()
+    """
+    records = [
+        (
+            "collision",
+            {
+                "base_id": collision.base_id,
+                "files": collision.conflicting_files,
+                "suggestion": collision.suggested_resolution,
+            },
+        )
+        for collision in report.potential_collisions
+    ]
+    summary = {
+        "files_scanned": report.total_files_scanned,
+        "files_with_context_ids": report.files_with_context_ids,
+        "total_context_ids": report.total_context_ids,
+        "total_xrefs": report.total_xrefs,
+        "total_links": report.total_links,
+        "collisions": len(report.potential_collisions),
+    }
+    summary.update(analyzer.risk_counts(report.potential_collisions))
+    records.append(("summary", summary))
+    writer.write_section(records)
+
+
+def save_analysis_snapshot(
+    analyzer: ContextAnalyzer, report: AnalysisReport, snapshot_file: str
+) -> None:
+    """
+    Save a compact snapshot of an in-memory analysis for later comparison.
+
+    Args:
+        analyzer: ContextAnalyzer holding the collision-detection state
+        report: AnalysisReport returned by analyzer.generate_report()
+        snapshot_file: Path of the snapshot to write
+    """
+    with SnapshotWriter(snapshot_file, "ContextAnalyzer") as writer:
+        for file_analysis in report.file_analyses:
+            writer.write_section(analysis_records(file_analysis))
+        write_analysis_summary(writer, analyzer, report)
+
+
+def format_analysis_record(kind: str, record: Dict) -> List[str]:
+    """
+    Format one analysis record for the streamed text report.
+
+    Args:
+        kind: Record type
+        record: Record fields
+
+    Returns:
+        Lines of text for the record (none for xrefs and links)
+    """
+    if kind == "file":
+        return ["", f"{record['file']}:"] if record["context_ids"] else []
+    if kind == "id":
+        return [
+            f"  - [id=\"{record['id']}\"] → [id=\"{record['base_id']}\"] (line {record['line']})"
+        ]
+    if kind == "collision":
+        lines = [f"Base ID '{record['base_id']}'"]
+        lines.extend(f"  - {filepath}" for filepath in record["files"])
+        lines.append(f"  Suggested: {record['suggestion']}")
+        return lines
+    if kind == "summary":
+        return [
+            "",
+            "=== Summary ===",
+            f"Files Scanned: {record['files_scanned']}",
+            f"Files with Context IDs: {record['files_with_context_ids']}",
+            f"Total IDs with _{{context}}: {record['total_context_ids']}",
+            f"Total xrefs found: {record['total_xrefs']}",
+            f"Total links found: {record['total_links']}",
+            f"Potential ID collisions: {record['collisions']}",
+            f"- Low Risk: {record['low_risk']} files (simple context removal)",
+            f"- Medium Risk: {record['medium_risk']} files (potential collisions)",
+            f"- High Risk: {record['high_risk']} files (complex multi-context scenarios)",
+        ]
+    return []
+
+
+def open_analysis_writer(
+    output_format: str,
+    output_file: Optional[str] = None,
+    detailed: bool = False,
+    collisions_only: bool = False,
+) -> ReportWriter:
+    """
+    Open a streaming writer for a ContextAnalyzer report.
+
+    JSON Lines and CSV reports contain every record. The text report lists
+    the files with context IDs as they are analyzed (with --detailed),
+    followed by the collisions and the summary.
+
+    Args:
+        output_format: "text", "jsonl" or "csv"
+        output_file: File to write to (default: standard output)
+        detailed: Whether the text report lists each file's context IDs
+        collisions_only: Whether to write only the collision records
+
+    Returns:
+        ReportWriter for the report
+    """
+    if collisions_only:
+        kinds = {"collision"}
+    elif output_format == "text" and not detailed:
+        kinds = {"collision", "summary"}
+    else:
+        kinds = None
+
+    if output_format == "text":
+        return open_report_writer(
+            "text",
+            output_file,
+            formatter=format_analysis_record,
+            header=["=== Context Migration Analysis Report ==="],
+            headings={
+                "file": ["", "=== Files Requiring Migration ==="],
+                "collision": ["", "=== Potential ID Collisions ==="],
+            },
+            kinds=kinds,
+        )
+    return open_report_writer(
+        output_format, output_file, fieldnames=ANALYSIS_CSV_FIELDS, kinds=kinds
+    )
+
+
 def process_context_analyzer_file(filepath: str, analyzer: ContextAnalyzer):
     """
     Process a single file with the context analyzer.
@@ -670,6 +1105,8 @@ def main(args):
             "detailed": getattr(args, "detailed", False),
             "collisions_only": getattr(args, "collisions_only", False),
             "output_file": getattr(args, "output", None),
+            "snapshot_file": getattr(args, "snapshot", None),
+            "stream": getattr(args, "stream", False),
             "verbose": getattr(args, "verbose", False),
         }
 
@@ -713,16 +1150,40 @@ def main(args):
         def process_file_wrapper(filepath):
             return process_context_analyzer_file(filepath, analyzer)
 
+        output_format = getattr(args, 'format', 'text')
+        detailed = getattr(args, 'detailed', False)
+        collisions_only = getattr(args, 'collisions_only', False)
+        output_file = getattr(args, 'output', None)
+        snapshot_file = getattr(args, 'snapshot', None)
+
         try:
+            if output_format in STREAM_FORMATS or (
+                getattr(args, 'stream', False) and output_format == 'text'
+            ):
+                # Write each file's results as soon as it is analyzed
+                writer = open_analysis_writer(
+                    output_format, output_file, detailed, collisions_only
+                )
+                if snapshot_file:
+                    writer = MultiReportWriter(
+                        [writer, SnapshotWriter(snapshot_file, "ContextAnalyzer")]
+                    )
+                analyzer.writer = writer
+                with writer:
+                    process_adoc_files(args, process_file_wrapper)
+                    report = analyzer.generate_report()
+                    write_analysis_summary(writer, analyzer, report)
+                if output_file:
+                    print(f"Analysis report saved to {output_file}")
+                return
+
             process_adoc_files(args, process_file_wrapper)
             report = analyzer.generate_report()
 
-            # Generate output
-            output_format = getattr(args, 'format', 'text')
-            detailed = getattr(args, 'detailed', False)
-            collisions_only = getattr(args, 'collisions_only', False)
-            output_file = getattr(args, 'output', None)
+            if snapshot_file:
+                save_analysis_snapshot(analyzer, report, snapshot_file)
 
+            # Generate output
             if output_format == 'json':
                 # Convert to JSON-serializable format
                 report_dict = asdict(report)
@@ -747,16 +1208,8 @@ def main(args):
             sys.exit(1)
 
 
-def register_subcommand(subparsers):
-    """Register this plugin as a subcommand."""
-    parser = subparsers.add_parser(
-        "ContextAnalyzer", help=__description__, description=__description__
-    )
-
-    # Add common arguments
-    common_arg_parser(parser)
-
-    # Add plugin-specific arguments
+def add_arguments(parser):
+    """Add ContextAnalyzer-specific options to a subcommand parser."""
     parser.add_argument(
         "--detailed",
         action="store_true",
@@ -771,9 +1224,17 @@ def register_subcommand(subparsers):
 
     parser.add_argument(
         "--format",
-        choices=['text', 'json'],
+        choices=['text', 'json', 'jsonl', 'csv'],
         default='text',
-        help="Output format for the report (default: text)",
+        help="Output format for the report (default: text); jsonl and csv are "
+        "written incrementally as files are analyzed",
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write the text report file by file as files are analyzed instead "
+        "of building it in memory (implied by --format jsonl/csv)",
     )
 
     parser.add_argument(
@@ -782,6 +1243,25 @@ def register_subcommand(subparsers):
         help="Save report to specified file instead of printing to console",
     )
 
+    parser.add_argument(
+        "--snapshot",
+        type=str,
+        help="Also save a compact snapshot of the results for adt-report-diff",
+    )
+
+
+def register_subcommand(subparsers):
+    """Register this plugin as a subcommand."""
+    parser = subparsers.add_parser(
+        "ContextAnalyzer", help=__description__, description=__description__
+    )
+
+    # Add common arguments
+    common_arg_parser(parser)
+
+    # Add plugin-specific arguments
+    add_arguments(parser)
+
     parser.add_argument(
         "--verbose", action="store_true", help="Enable verbose logging output"
     )
@@ -10,25 +10,36 @@ This is Phase 2 of the context migration strategy - performs actual migration.
 
 __description__ = "Migrate AsciiDoc files from context-suffixed IDs to context-free IDs with validation and rollback"
 
-import json
+import hashlib
 import os
-import shutil
+import re
+import stat
 import sys
-import tempfile
-from dataclasses import dataclass, asdict
-from datetime import datetime
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Set, Any
+from typing import Callable, Iterator, List, Dict, Optional, Tuple, Set, Any
 import logging
 
 from ..cli_utils import common_arg_parser
 from ..file_utils import (
     find_adoc_files,
     read_text_preserve_endings,
-    write_text_preserve_endings,
+    write_bytes_atomic,
 )
+from ..profiling import profile_phase, profiled
 from ..workflow_utils import process_adoc_files
 from ..regex_patterns import CompiledPatterns
+from ..report_writers import STREAM_FORMATS, ReportWriter, open_report_writer
+from .backup_store import (
+    BackupEntry,
+    BackupStore,
+    RestoreResult,
+    file_digest,
+    format_restore_report,
+)
+from .migration_journal import MigrationJournal, PlannedFile
 
 # Try to import ADTModule for the new pattern
 try:
@@ -51,6 +62,33 @@ except ImportError:
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Below this many files, starting a process pool costs more than it saves
+MIN_FILES_FOR_POOL = 32
+
+# Columns of the CSV report, shared by all record types
+MIGRATION_CSV_FIELDS = (
+    "file",
+    "line",
+    "status",
+    "old",
+    "new",
+    "id_changes",
+    "xref_changes",
+    "backup",
+    "errors",
+    "broken_xrefs",
+    "warnings",
+    "files_processed",
+    "successful_migrations",
+    "failed_migrations",
+    "total_id_changes",
+    "total_xref_changes",
+    "backup_directory",
+)
+
+# Migrator used by the current worker process, built once by _init_worker
+_worker_migrator: Optional["ContextMigrator"] = None
+
 
 class ContextMigratorModule(ADTModule):
     """
@@ -95,7 +133,11 @@ class ContextMigratorModule(ADTModule):
         self.resolve_collisions = config.get("resolve_collisions", True)
         self.validate_after = config.get("validate_after", False)
         self.output_file = config.get("output_file")
+        self.output_format = config.get("output_format", "text")
+        self.stream = config.get("stream", False)
         self.verbose = config.get("verbose", False)
+        self.workers = config.get("workers")  # None means one per CPU
+        self.rollback = config.get("rollback", False)
 
         # Initialize statistics
         self.files_processed = 0
@@ -107,6 +149,10 @@ class ContextMigratorModule(ADTModule):
         self.validations_passed = 0
         self.validations_failed = 0
 
+        # Streaming report writer, open while execute() runs
+        self.report_writer: Optional[ReportWriter] = None
+        self.migrated_files: List[str] = []
+
         # Initialize migration options
         self.migration_options = MigrationOptions(
             dry_run=self.dry_run,
@@ -114,6 +160,7 @@ class ContextMigratorModule(ADTModule):
             backup_dir=self.backup_dir,
             resolve_collisions=self.resolve_collisions,
             validate_after=self.validate_after,
+            workers=self.workers,
         )
 
         # Initialize migrator
@@ -127,6 +174,7 @@ class ContextMigratorModule(ADTModule):
             print(f"  Resolve collisions: {self.resolve_collisions}")
             print(f"  Validate after: {self.validate_after}")
 
+    @profiled("ContextMigrator")
     def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute the context migration.
@@ -138,6 +186,9 @@ class ContextMigratorModule(ADTModule):
             Dictionary with execution results
         """
         try:
+            if self.rollback:
+                return self._execute_rollback()
+
             # Extract parameters from context
             file_path = context.get("file")
             recursive = context.get("recursive", False)
@@ -161,6 +212,12 @@ class ContextMigratorModule(ADTModule):
             self.backups_created = 0
             self.validations_passed = 0
             self.validations_failed = 0
+            self.migrated_files = []
+
+            if self.output_format in STREAM_FORMATS or (
+                self.stream and self.output_format == "text"
+            ):
+                return self._execute_streaming(args)
 
             # Collect file results
             file_results = []
@@ -171,29 +228,8 @@ class ContextMigratorModule(ADTModule):
                 lambda filepath: self._process_file_wrapper(filepath, file_results),
             )
 
-            # Update statistics
-            self.files_processed = len(file_results)
-            self.successful_migrations = sum(1 for r in file_results if r.success)
-            self.failed_migrations = self.files_processed - self.successful_migrations
-
-            # Calculate totals
-            self.id_changes_made = sum(len(r.id_changes) for r in file_results)
-            self.xref_changes_made = sum(len(r.xref_changes) for r in file_results)
-            self.backups_created = sum(1 for r in file_results if r.backup_path)
-
             # Run validation if requested
-            validation_results = []
-            if self.validate_after and not self.dry_run:
-                for result in file_results:
-                    if result.success:
-                        validation_result = self.migrator.validate_migration(
-                            result.filepath
-                        )
-                        validation_results.append(validation_result)
-                        if validation_result.valid:
-                            self.validations_passed += 1
-                        else:
-                            self.validations_failed += 1
+            validation_results = self._validate_migrated_files()
 
             # Create migration result
             migration_result = MigrationResult(
@@ -205,12 +241,13 @@ class ContextMigratorModule(ADTModule):
                 backup_directory=self.backup_dir,
             )
 
-            # Generate report
-            report_content = format_migration_report(migration_result)
+            with profile_phase("report"):
+                # Generate report
+                report_content = format_migration_report(migration_result)
 
-            # Save report to file if specified
-            if self.output_file:
-                self._save_report_to_file(report_content)
+                # Save report to file if specified
+                if self.output_file:
+                    self._save_report_to_file(report_content)
 
             return {
                 "module_name": self.name,
@@ -251,13 +288,181 @@ class ContextMigratorModule(ADTModule):
                 "validations_failed": self.validations_failed,
             }
 
-    def _process_file_wrapper(self, filepath: str, file_results: List) -> bool:
+    def _execute_streaming(self, args) -> Dict[str, Any]:
+        """
+        Run the migration, writing each file's changes as soon as it is migrated.
+
+        File results are not kept; only the running totals and the paths
+        needed for --validate are.
+
+        Args:
+            args: Arguments passed to process_adoc_files
+
+        Returns:
+            Dictionary with execution results
+        """
+        self.report_writer = open_migration_writer(
+            self.output_format, self.output_file
+        )
+        try:
+            process_adoc_files(
+                args, lambda filepath: self._process_file_wrapper(filepath, None)
+            )
+            validation_results = self._validate_migrated_files()
+            with profile_phase("report"):
+                self.report_writer.write_section(
+                    [
+                        (
+                            "summary",
+                            {
+                                "files_processed": self.files_processed,
+                                "successful_migrations": self.successful_migrations,
+                                "failed_migrations": self.failed_migrations,
+                                "total_id_changes": self.id_changes_made,
+                                "total_xref_changes": self.xref_changes_made,
+                                "backup_directory": self.backup_dir,
+                            },
+                        )
+                    ]
+                )
+        finally:
+            with profile_phase("report"):
+                self.report_writer.close()
+            self.report_writer = None
+
+        if self.verbose and self.output_file:
+            print(f"Migration report saved to {self.output_file}")
+
+        migration_result = MigrationResult(
+            total_files_processed=self.files_processed,
+            successful_migrations=self.successful_migrations,
+            failed_migrations=self.failed_migrations,
+            file_results=[],
+            validation_results=validation_results,
+            backup_directory=self.backup_dir,
+        )
+
+        return {
+            "module_name": self.name,
+            "version": self.version,
+            "success": True,
+            "dry_run": self.dry_run,
+            "files_processed": self.files_processed,
+            "successful_migrations": self.successful_migrations,
+            "failed_migrations": self.failed_migrations,
+            "id_changes_made": self.id_changes_made,
+            "xref_changes_made": self.xref_changes_made,
+            "backups_created": self.backups_created,
+            "validations_passed": self.validations_passed,
+            "validations_failed": self.validations_failed,
+            "backup_directory": self.backup_dir,
+            "output_file": self.output_file,
+            "report_content": None,
+            "migration_result": asdict(migration_result),
+        }
+
+    def _validate_migrated_files(self) -> List["ValidationResult"]:
+        """
+        Validate the successfully migrated files if --validate was requested.
+
+        Returns:
+            List of ValidationResult objects, also streamed to the report
+            writer when one is open
+        """
+        validation_results = []
+        if not self.validate_after or self.dry_run:
+            return validation_results
+
+        for filepath in self.migrated_files:
+            with profile_phase("validate", files=1):
+                validation_result = self.migrator.validate_migration(filepath)
+            if validation_result.valid:
+                self.validations_passed += 1
+            else:
+                self.validations_failed += 1
+
+            if self.report_writer is None:
+                validation_results.append(validation_result)
+            else:
+                self.report_writer.write_section(
+                    [
+                        (
+                            "validation",
+                            {
+                                "file": validation_result.filepath,
+                                "status": (
+                                    "VALID" if validation_result.valid else "INVALID"
+                                ),
+                                "broken_xrefs": validation_result.broken_xrefs,
+                                "warnings": validation_result.warnings,
+                            },
+                        )
+                    ]
+                )
+        return validation_results
+
+    def _record_result(
+        self, result: "FileMigrationResult", file_results: Optional[List]
+    ) -> None:
+        """
+        Add a file result to the statistics and to the report.
+
+        Args:
+            result: Result of migrating one file
+            file_results: List collecting the results, or None when the
+                result is written to the streaming report writer instead
+        """
+        self.files_processed += 1
+        if result.success:
+            self.successful_migrations += 1
+            self.migrated_files.append(result.filepath)
+        else:
+            self.failed_migrations += 1
+        self.id_changes_made += len(result.id_changes)
+        self.xref_changes_made += len(result.xref_changes)
+        if result.backup_path:
+            self.backups_created += 1
+
+        if file_results is None:
+            self.report_writer.write_section(migration_records(result))
+        else:
+            file_results.append(result)
+
+    def _execute_rollback(self) -> Dict[str, Any]:
+        """
+        Restore the files changed by the most recent migration run.
+
+        Returns:
+            Dictionary with rollback results
+        """
+        restore_result = self.migrator.rollback()
+        report_content = format_restore_report(restore_result)
+
+        if self.output_file:
+            self._save_report_to_file(report_content)
+
+        return {
+            "module_name": self.name,
+            "version": self.version,
+            "success": not restore_result.errors,
+            "rollback": True,
+            "files_restored": len(restore_result.restored),
+            "files_unchanged": len(restore_result.unchanged),
+            "errors": restore_result.errors,
+            "backup_directory": self.backup_dir,
+            "output_file": self.output_file,
+            "report_content": report_content if not self.output_file else None,
+        }
+
+    def _process_file_wrapper(
+        self, filepath: str, file_results: Optional[List]
+    ) -> bool:
         """
         Wrapper around the process_context_migrator_file function.
 
         Args:
             filepath: Path to the file to process
-            file_results: List to store file results
+            file_results: List to store file results, or None to stream them
 
         Returns:
             True if processing was successful, False otherwise
@@ -267,7 +472,7 @@ class ContextMigratorModule(ADTModule):
 
         try:
             result = process_context_migrator_file(filepath, self.migrator)
-            file_results.append(result)
+            self._record_result(result, file_results)
             return result.success
 
         except Exception as e:
@@ -281,7 +486,7 @@ class ContextMigratorModule(ADTModule):
                 errors=[str(e)],
                 backup_path="",
             )
-            file_results.append(error_result)
+            self._record_result(error_result, file_results)
             return False
 
     def _save_report_to_file(self, content: str) -> None:
@@ -302,6 +507,8 @@ class ContextMigratorModule(ADTModule):
 
     def cleanup(self) -> None:
         """Clean up module resources."""
+        if self.migrator._backup_store is not None:
+            self.migrator._backup_store.close()
         if self.verbose:
             print(f"ContextMigrator cleanup complete")
             print(f"  Total files processed: {self.files_processed}")
@@ -324,12 +531,121 @@ class MigrationOptions:
     backup_dir: str = ".migration_backups"
     resolve_collisions: bool = True
     validate_after: bool = True
+    workers: Optional[int] = None  # Worker processes for migrate_directory, None means one per CPU
+    resume: bool = False  # Continue an interrupted migrate_directory from its journal
+
+
+@dataclass
+class FilePlan:
+    """Result of the planning pass for a single file."""
+
+    filepath: str
+    content: Optional[str]  # Buffer reused by the apply pass, None if unreadable
+    context_ids: List[Tuple[str, str]] = field(default_factory=list)  # (full_id, base_id)
+    error: Optional[str] = None
+    digest: str = ""  # SHA-256 of the file content
+    ids: List[str] = field(default_factory=list)  # Every ID, with or without context
+
+
+class IDCollisionIndex(set):
+    """
+    Set of taken IDs that remembers, per base ID, where the next free
+    numeric suffix search should start.
+
+    Because IDs are only ever added, every suffix below the remembered one
+    is still taken, so resolve_id_collisions returns the same names as a
+    linear probe from 1 in amortized O(1).
+    """
+
+    def __init__(self, ids=()):
+        super().__init__(ids)
+        self.next_suffix: Dict[str, int] = {}
+
+    def remove(self, item) -> None:
+        super().remove(item)
+        self.next_suffix.clear()
+
+    def discard(self, item) -> None:
+        super().discard(item)
+        self.next_suffix.clear()
+
+    def next_free(self, base_id: str) -> str:
+        """
+        Find the first ``base_id-N`` that is not taken.
+
+        Args:
+            base_id: The colliding base ID
+
+        Returns:
+            The ID with the lowest free numeric suffix
+        """
+        counter = self.next_suffix.get(base_id, 1)
+        while f"{base_id}-{counter}" in self:
+            counter += 1
+        self.next_suffix[base_id] = counter
+        return f"{base_id}-{counter}"
+
+
+# Line-bounded variants of the shared ID, xref and link patterns. The edit
+# engine scans the whole buffer at once, so a match must never cross a line
+# break (the old per-line scan guaranteed that implicitly).
+ID_LINE_REGEX = re.compile(r'\[id="([^"\n]+)"\]')
+ID_WITH_CONTEXT_LINE_REGEX = re.compile(r'\[id="([^"\n]+)_([^"\n]+)"\]')
+XREF_LINE_REGEX = re.compile(r'xref:([^#\[\n]+)(?:#([^#\[\n]+))?(\[.*?\])')
+LINK_LINE_REGEX = re.compile(r'link:([^#\[\n]+)(?:#([^#\[\n]+))?(\[.*?\])')
+
+# A replacement of content[start:end] by a new string
+Edit = Tuple[int, int, str]
+
+
+def apply_edits(content: str, edits: List[Edit]) -> str:
+    """
+    Apply non-overlapping span replacements to a buffer in a single join.
+
+    Args:
+        content: Original content the edit offsets refer to
+        edits: (start, end, replacement) tuples, in any order
+
+    Returns:
+        The content with every span replaced
+    """
+    if not edits:
+        return content
+
+    pieces = []
+    position = 0
+    for start, end, replacement in sorted(edits):
+        pieces.append(content[position:start])
+        pieces.append(replacement)
+        position = end
+    pieces.append(content[position:])
+    return ''.join(pieces)
+
+
+def _newline_offsets(content: str) -> List[int]:
+    """Return the offset of every newline, for mapping match offsets to lines."""
+    offsets = []
+    position = content.find('\n')
+    while position != -1:
+        offsets.append(position)
+        position = content.find('\n', position + 1)
+    return offsets
+
+
+def _overlaps(start: int, end: int, spans: List[Tuple[int, int]]) -> bool:
+    """Check whether [start, end) intersects any span of a sorted span list."""
+    index = bisect_right(spans, (start, end))
+    if index and spans[index - 1][1] > start:
+        return True
+    return index < len(spans) and spans[index][0] < end
 
 
 @dataclass
 class IDChange:
     """Represents a change made to an ID during migration."""
 
+    __slots__ = ("old_id", "new_id", "line_number")
+
     old_id: str
     new_id: str
     line_number: int
@@ -339,6 +655,8 @@ class IDChange:
 class XrefChange:
     """Represents a change made to an xref during migration."""
 
+    __slots__ = ("old_xref", "new_xref", "line_number")
+
     old_xref: str
     new_xref: str
     line_number: int
@@ -397,48 +715,84 @@ class ContextMigrator:
         # Track ID mappings for cross-reference updates
         self.id_mappings: Dict[str, str] = {}  # old_id -> new_id
         self.file_id_map: Dict[str, str] = {}  # id -> filepath
+        self.known_ids: Set[str] = set()  # every ID in the tree after migration
 
-    def create_backup(self, filepath: str) -> str:
+        self._backup_store: Optional[BackupStore] = None
+
+    def create_backup(
+        self, filepath: str, content: Optional[str] = None, digest: str = ""
+    ) -> str:
         """
         Create a backup of the file before migration.
 
+        The content is stored once per distinct hash in the backup store and
+        the file is recorded in this run's manifest, so rollback can replay it.
+        Dry runs change nothing, so they take no backup.
+
         Args:
             filepath: Path to the file to backup
+            content: Content already read from the file, to avoid reading it again
+            digest: SHA-256 of content, if already computed
 
         Returns:
-            Path to the backup file
+            Path to the backup blob, or "" if no backup was taken
         """
-        if not self.options.create_backups:
+        if not self.options.create_backups or self.options.dry_run:
             return ""
 
         try:
-            # Create backup directory if it doesn't exist
-            backup_dir = os.path.abspath(self.options.backup_dir)
-            if not os.path.exists(backup_dir):
-                os.makedirs(backup_dir)
+            data = content.encode("utf-8") if content is not None else None
+            return self.backup_store.backup(filepath, data, digest or None)
 
-            # Create safe backup file path by using just the filename
-            # This avoids path traversal issues with relative paths
-            filename = os.path.basename(filepath)
-            backup_path = os.path.join(backup_dir, filename)
+        except Exception as e:
+            logger.error(f"Failed to create backup for {filepath}: {e}")
+            raise
 
-            # If backup already exists, add a timestamp suffix
-            if os.path.exists(backup_path):
-                from datetime import datetime
+    @property
+    def backup_store(self) -> BackupStore:
+        """Content-addressed store under the backup directory, opened on first use."""
+        if self._backup_store is None:
+            self._backup_store = BackupStore(self.options.backup_dir)
+        return self._backup_store
 
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                name, ext = os.path.splitext(filename)
-                backup_path = os.path.join(backup_dir, f"{name}_{timestamp}{ext}")
+    def rollback(self, manifest_path: Optional[str] = None) -> RestoreResult:
+        """
+        Restore migrated files from the backup store.
 
-            # Copy the file
-            shutil.copy2(filepath, backup_path)
-            logger.debug(f"Created backup: {filepath} -> {backup_path}")
+        If a directory migration was interrupted, only the files it touched
+        are restored, using its journal; otherwise the manifest is replayed.
 
-            return backup_path
+        Args:
+            manifest_path: Manifest to replay (default: the most recent run
+                that changed a file)
 
-        except Exception as e:
-            logger.error(f"Failed to create backup for {filepath}: {e}")
-            raise
+        Returns:
+            RestoreResult listing restored, unchanged and failed files
+        """
+        journal = MigrationJournal.in_directory(self.options.backup_dir)
+        if manifest_path is None and journal.exists():
+            return self._rollback_journal(journal)
+        return self.backup_store.restore(manifest_path)
+
+    def _rollback_journal(self, journal: MigrationJournal) -> RestoreResult:
+        """Restore the files an interrupted migration touched, then drop its journal."""
+        state = journal.load()
+        touched = [
+            BackupEntry(path, entry.before, entry.mode)
+            for path, entry in state.planned.items()
+            if path in state.done or file_digest(path) != entry.before
+        ]
+        logger.info(
+            "Rolling back %d of %d planned files from %s",
+            len(touched),
+            len(state.planned),
+            journal.path,
+        )
+
+        result = self.backup_store.restore_entries(touched, journal.path)
+        if not result.errors:
+            journal.discard()
+        return result
 
     def resolve_id_collisions(self, base_id: str, existing_ids: Set[str]) -> str:
         """
@@ -446,7 +800,8 @@ class ContextMigrator:
 
         Args:
             base_id: The base ID that would cause a collision
-            existing_ids: Set of existing IDs to check against
+            existing_ids: Set of existing IDs to check against; an
+                IDCollisionIndex avoids re-probing taken suffixes
 
         Returns:
             A unique ID (may have numeric suffix)
@@ -457,6 +812,9 @@ class ContextMigrator:
         if not self.options.resolve_collisions:
             return base_id  # Let the collision happen - user will handle it
 
+        if isinstance(existing_ids, IDCollisionIndex):
+            return existing_ids.next_free(base_id)
+
         # Find the next available number
         counter = 1
         while f"{base_id}-{counter}" in existing_ids:
@@ -477,43 +835,8 @@ class ContextMigrator:
         Returns:
             Tuple of (modified_content, list_of_changes)
         """
-        changes = []
-        lines = content.split('\n')
-        existing_ids = set()
-
-        # First pass: collect existing IDs and identify changes needed
-        id_changes_needed = []
-
-        for line_num, line in enumerate(lines, 1):
-            for match in self.id_with_context_regex.finditer(line):
-                full_id = match.group(1) + '_' + match.group(2)
-                base_id = match.group(1)
-
-                # Check if we already have a mapping from directory-level processing
-                if full_id in self.id_mappings:
-                    new_id = self.id_mappings[full_id]
-                else:
-                    # Single file processing - resolve collisions locally
-                    new_id = self.resolve_id_collisions(base_id, existing_ids)
-                    existing_ids.add(new_id)
-
-                    # Track the mapping for xref updates
-                    self.id_mappings[full_id] = new_id
-                    self.file_id_map[new_id] = filepath
-
-                id_changes_needed.append((line_num - 1, match, full_id, new_id))
-
-        # Second pass: apply the changes
-        for line_idx, match, old_id, new_id in id_changes_needed:
-            old_line = lines[line_idx]
-            new_line = old_line.replace(match.group(0), f'[id="{new_id}"]')
-            lines[line_idx] = new_line
-
-            changes.append(
-                IDChange(old_id=old_id, new_id=new_id, line_number=line_idx + 1)
-            )
-
-        return '\n'.join(lines), changes
+        edits, changes = self._collect_id_edits(content, filepath)
+        return apply_edits(content, edits), changes
 
     def update_xrefs_and_links(
         self, content: str, filepath: str
@@ -528,101 +851,146 @@ class ContextMigrator:
         Returns:
             Tuple of (modified_content, list_of_changes)
         """
+        edits, changes = self._collect_xref_edits(content)
+        return apply_edits(content, edits), changes
+
+    def _collect_id_edits(
+        self,
+        content: str,
+        filepath: str,
+        newlines: Optional[List[int]] = None,
+    ) -> Tuple[List[Edit], List[IDChange]]:
+        """
+        Scan the buffer once for context IDs and plan their replacements.
+
+        Resolves each ID through the directory-level mappings, or locally
+        with collision resolution, and records new mappings for the xref pass.
+
+        Args:
+            content: File content to scan
+            filepath: Path to the file being processed
+            newlines: Newline offsets of the content, if already computed
+
+        Returns:
+            Tuple of (edits, list_of_changes) in buffer order
+        """
+        if newlines is None:
+            newlines = _newline_offsets(content)
+
+        edits = []
         changes = []
-        lines = content.split('\n')
+        existing_ids = IDCollisionIndex()
 
-        # Update xrefs
-        for line_num, line in enumerate(lines):
-            # Process xref patterns
-            def replace_xref(match):
-                # XREF_BASIC_PATTERN captures: ([^#\[]+)(?:#([^#\[]+))?(\[.*?\])
-                # Group 1: file_or_id (before # or [)
-                # Group 2: optional_id (after #)
-                # Group 3: link_text (in brackets)
+        for match in ID_WITH_CONTEXT_LINE_REGEX.finditer(content):
+            full_id = match.group(1) + '_' + match.group(2)
+            base_id = match.group(1)
 
-                first_part = match.group(1) if match.group(1) else ""
-                second_part = match.group(2) if match.group(2) else ""
-                link_text = match.group(3) if match.group(3) else ""
+            # Check if we already have a mapping from directory-level processing
+            if full_id in self.id_mappings:
+                new_id = self.id_mappings[full_id]
+            else:
+                # Single file processing - resolve collisions locally
+                new_id = self.resolve_id_collisions(base_id, existing_ids)
+                existing_ids.add(new_id)
 
-                if second_part:
-                    # Format: xref:file.adoc#target_id[text]
-                    target_file = first_part
-                    target_id = second_part
-                else:
-                    # Format: xref:target_id[text]
-                    target_file = ""
-                    target_id = first_part
+                # Track the mapping for xref updates
+                self.id_mappings[full_id] = new_id
+                self.file_id_map[new_id] = filepath
 
-                # Check if this ID has been migrated
-                if target_id in self.id_mappings:
-                    new_id = self.id_mappings[target_id]
-                    old_xref = match.group(0)
-
-                    if target_file:
-                        new_xref = f"xref:{target_file}#{new_id}{link_text}"
-                    else:
-                        new_xref = f"xref:{new_id}{link_text}"
-
-                    changes.append(
-                        XrefChange(
-                            old_xref=old_xref,
-                            new_xref=new_xref,
-                            line_number=line_num + 1,
-                        )
-                    )
+            edits.append((match.start(), match.end(), f'[id="{new_id}"]'))
+            changes.append(
+                IDChange(
+                    old_id=full_id,
+                    new_id=new_id,
+                    line_number=bisect_right(newlines, match.start()) + 1,
+                )
+            )
 
-                    return new_xref
+        return edits, changes
 
-                return match.group(0)
+    def _collect_xref_edits(
+        self,
+        content: str,
+        newlines: Optional[List[int]] = None,
+        reserved: Optional[List[Edit]] = None,
+    ) -> Tuple[List[Edit], List[XrefChange]]:
+        """
+        Scan the buffer once for xrefs and once for links and plan their rewrites.
 
-            # Update links
-            def replace_link(match):
-                # LINK_PATTERN captures: ([^#\[]+)(?:#([^#\[]+))?(\[.*?\])
-                # Group 1: url_or_file (before # or [)
-                # Group 2: optional_anchor (after #)
-                # Group 3: link_text (in brackets)
+        Links that overlap an xref, and references that overlap a reserved
+        span (such as an ID edit), are left alone so all edits can be
+        applied to the original buffer together.
 
-                first_part = match.group(1) if match.group(1) else ""
-                second_part = match.group(2) if match.group(2) else ""
-                link_text = match.group(3) if match.group(3) else ""
+        Args:
+            content: File content to scan
+            newlines: Newline offsets of the content, if already computed
+            reserved: Edits already planned for this buffer
+
+        Returns:
+            Tuple of (edits, list_of_changes) ordered by line, xrefs before links
+        """
+        if newlines is None:
+            newlines = _newline_offsets(content)
+
+        taken = sorted((start, end) for start, end, _ in reserved or [])
+        planned = []  # (line_number, kind, start, end, old, new)
+
+        for kind, prefix, regex in (
+            (0, "xref", XREF_LINE_REGEX),
+            (1, "link", LINK_LINE_REGEX),
+        ):
+            kind_spans = []
+            for match in regex.finditer(content):
+                # Group 1: file, url or ID (before # or [)
+                # Group 2: optional ID or anchor (after #)
+                # Group 3: link text (in brackets)
+                first_part = match.group(1) or ""
+                second_part = match.group(2) or ""
+                link_text = match.group(3) or ""
 
                 if second_part:
-                    # Format: link:url#anchor[text]
-                    target_file = first_part
-                    target_id = second_part
+                    # Format: xref:file.adoc#target_id[text] or link:url#anchor[text]
+                    target_file, target_id = first_part, second_part
+                elif kind == 0:
+                    # Format: xref:target_id[text]
+                    target_file, target_id = "", first_part
                 else:
                     # Format: link:url[text]
-                    target_file = first_part
-                    target_id = ""
-
-                # Check if this ID has been migrated
-                if target_id in self.id_mappings:
-                    new_id = self.id_mappings[target_id]
-                    old_link = match.group(0)
-
-                    if target_file:
-                        new_link = f"link:{target_file}#{new_id}{link_text}"
-                    else:
-                        new_link = f"link:{new_id}{link_text}"
-
-                    changes.append(
-                        XrefChange(
-                            old_xref=old_link,
-                            new_xref=new_link,
-                            line_number=line_num + 1,
-                        )
-                    )
+                    target_file, target_id = first_part, ""
 
-                    return new_link
+                if target_id not in self.id_mappings:
+                    continue
+                if _overlaps(match.start(), match.end(), taken):
+                    continue
 
-                return match.group(0)
+                new_id = self.id_mappings[target_id]
+                if target_file:
+                    new_ref = f"{prefix}:{target_file}#{new_id}{link_text}"
+                else:
+                    new_ref = f"{prefix}:{new_id}{link_text}"
+
+                kind_spans.append((match.start(), match.end()))
+                planned.append(
+                    (
+                        bisect_right(newlines, match.start()) + 1,
+                        kind,
+                        match.start(),
+                        match.end(),
+                        match.group(0),
+                        new_ref,
+                    )
+                )
 
-            # Apply replacements
-            new_line = self.xref_regex.sub(replace_xref, line)
-            new_line = self.link_regex.sub(replace_link, new_line)
-            lines[line_num] = new_line
+            # Later kinds must not touch spans claimed by earlier ones
+            taken = sorted(taken + kind_spans)
 
-        return '\n'.join(lines), changes
+        planned.sort()
+        edits = [(start, end, new) for _, _, start, end, _, new in planned]
+        changes = [
+            XrefChange(old_xref=old, new_xref=new, line_number=line_number)
+            for line_number, _, _, _, old, new in planned
+        ]
+        return edits, changes
 
     def validate_migration(self, filepath: str) -> ValidationResult:
         """
@@ -634,13 +1002,35 @@ class ContextMigrator:
         Returns:
             ValidationResult object
         """
-        warnings = []
-        broken_xrefs = []
-
         try:
             lines = read_text_preserve_endings(filepath)
             content = ''.join(text + ending for text, ending in lines)
+            return self.validate_content(filepath, content)
+
+        except Exception as e:
+            logger.error(f"Error validating {filepath}: {e}")
+            return ValidationResult(
+                filepath=filepath,
+                valid=False,
+                broken_xrefs=[],
+                warnings=[f"Validation error: {e}"],
+            )
+
+    def validate_content(self, filepath: str, content: str) -> ValidationResult:
+        """
+        Validate migrated content that is already in memory.
+
+        Args:
+            filepath: Path of the migrated file
+            content: Migrated file content
+
+        Returns:
+            ValidationResult object
+        """
+        warnings = []
+        broken_xrefs = []
 
+        try:
             # Check for remaining context IDs
             remaining_context_ids = self.id_with_context_regex.findall(content)
             if remaining_context_ids:
@@ -648,8 +1038,8 @@ class ContextMigrator:
                     f"Found {len(remaining_context_ids)} remaining context IDs"
                 )
 
-            # Check for broken xrefs (basic validation)
-            # This is a simplified check - full validation would require cross-file analysis
+            # Check for broken xrefs against the migrated IDs and every other
+            # ID seen while planning
             for match in self.xref_regex.finditer(content):
                 # XREF_BASIC_PATTERN captures: ([^#\[]+)(?:#([^#\[]+))?(\[.*?\])
                 first_part = match.group(1) if match.group(1) else ""
@@ -662,7 +1052,11 @@ class ContextMigrator:
                     # Format: xref:target_id[text]
                     target_id = first_part
 
-                if target_id and target_id not in self.file_id_map:
+                if (
+                    target_id
+                    and target_id not in self.file_id_map
+                    and target_id not in self.known_ids
+                ):
                     broken_xrefs.append(target_id)
 
             return ValidationResult(
@@ -692,7 +1086,6 @@ class ContextMigrator:
             FileMigrationResult object
         """
         backup_path = ""
-        errors = []
 
         try:
             # Create backup
@@ -703,27 +1096,81 @@ class ContextMigrator:
             lines = read_text_preserve_endings(filepath)
             content = ''.join(text + ending for text, ending in lines)
 
-            # Remove context from IDs
-            content, id_changes = self.remove_context_from_ids(content, filepath)
+        except Exception as e:
+            return self._failed_result(filepath, e, backup_path)
+
+        return self.migrate_content(filepath, content, backup_path)
+
+    def _failed_result(
+        self, filepath: str, error: Any, backup_path: str = ""
+    ) -> FileMigrationResult:
+        """Log a migration error and build the failed result for a file."""
+        error_msg = f"Error migrating {filepath}: {error}"
+        logger.error(error_msg)
+        return FileMigrationResult(
+            filepath=filepath,
+            success=False,
+            id_changes=[],
+            xref_changes=[],
+            errors=[error_msg],
+            backup_path=backup_path,
+        )
+
+    def migrate_content(
+        self, filepath: str, content: str, backup_path: str = ""
+    ) -> FileMigrationResult:
+        """
+        Migrate file content that is already in memory and write it back.
+
+        Args:
+            filepath: Path of the file the content was read from
+            content: Original file content
+            backup_path: Backup already created for the file, if any
+
+        Returns:
+            FileMigrationResult object
+        """
+        result, migrated = self._migrate_content(filepath, content, backup_path)
+        if migrated is not None:
+            # Let later validation resolve plain IDs without another read
+            self.known_ids.update(ID_LINE_REGEX.findall(migrated))
+        return result
+
+    def render_content(
+        self, filepath: str, content: str
+    ) -> Tuple[str, List[IDChange], List[XrefChange]]:
+        """
+        Compute the migrated content without writing it.
+
+        Every ID, xref and link edit is planned against the original buffer
+        and the content is rebuilt once.
+
+        Args:
+            filepath: Path of the file the content was read from
+            content: Original file content
+
+        Returns:
+            Tuple of (migrated_content, id_changes, xref_changes)
+        """
+        newlines = _newline_offsets(content)
+        id_edits, id_changes = self._collect_id_edits(content, filepath, newlines)
+        xref_edits, xref_changes = self._collect_xref_edits(
+            content, newlines, reserved=id_edits
+        )
+        return apply_edits(content, id_edits + xref_edits), id_changes, xref_changes
 
-            # Update xrefs and links
-            content, xref_changes = self.update_xrefs_and_links(content, filepath)
+    def _migrate_content(
+        self, filepath: str, content: str, backup_path: str
+    ) -> Tuple[FileMigrationResult, Optional[str]]:
+        """Migrate content and return the result with the migrated content, or None on failure."""
+        try:
+            content, id_changes, xref_changes = self.render_content(filepath, content)
 
             # Write back the modified content (unless dry run)
             if not self.options.dry_run:
-                # Convert back to lines format for writing
-                new_lines = []
-                for line in content.split('\n'):
-                    if (
-                        line or new_lines
-                    ):  # Don't add empty line at the end unless it was there
-                        new_lines.append((line, '\n'))
-
-                # Handle last line without newline
-                if new_lines and content and not content.endswith('\n'):
-                    new_lines[-1] = (new_lines[-1][0], '')
-
-                write_text_preserve_endings(filepath, new_lines)
+                # Replace the file rather than truncate it, so readers never
+                # see a partially written file
+                write_bytes_atomic(filepath, content.encode("utf-8"))
                 logger.info(
                     f"Migrated {filepath}: {len(id_changes)} ID changes, {len(xref_changes)} xref changes"
                 )
@@ -732,36 +1179,77 @@ class ContextMigrator:
                     f"DRY RUN - Would migrate {filepath}: {len(id_changes)} ID changes, {len(xref_changes)} xref changes"
                 )
 
-            return FileMigrationResult(
+            result = FileMigrationResult(
                 filepath=filepath,
                 success=True,
                 id_changes=id_changes,
                 xref_changes=xref_changes,
-                errors=errors,
+                errors=[],
                 backup_path=backup_path,
             )
+            return result, content
 
         except Exception as e:
-            error_msg = f"Error migrating {filepath}: {e}"
-            logger.error(error_msg)
-            errors.append(error_msg)
+            return self._failed_result(filepath, e, backup_path), None
 
-            return FileMigrationResult(
-                filepath=filepath,
-                success=False,
-                id_changes=[],
-                xref_changes=[],
-                errors=errors,
-                backup_path=backup_path,
-            )
+    def plan_file(self, filepath: str) -> FilePlan:
+        """
+        Read a file once and collect its IDs for the planning pass.
+
+        Args:
+            filepath: Path to the file to plan
+
+        Returns:
+            FilePlan holding the file content, its context IDs and all its IDs
+        """
+        try:
+            lines = read_text_preserve_endings(filepath)
+            content = ''.join(text + ending for text, ending in lines)
+        except Exception as e:
+            return FilePlan(filepath, None, error=str(e))
+
+        context_ids = [
+            (match.group(1) + '_' + match.group(2), match.group(1))
+            for match in ID_WITH_CONTEXT_LINE_REGEX.finditer(content)
+        ]
+        # Line endings are preserved, so this is also the hash of the raw bytes
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        ids = ID_LINE_REGEX.findall(content)
+        return FilePlan(filepath, content, context_ids, digest=digest, ids=ids)
+
+    def apply_plan(
+        self, filepath: str, content: str, backup_path: str
+    ) -> Tuple[FileMigrationResult, Optional[ValidationResult]]:
+        """
+        Migrate a planned file from its cached content and validate the result.
+
+        Args:
+            filepath: Path to the file to migrate
+            content: Content read during the planning pass
+            backup_path: Backup already created for the file, if any
+
+        Returns:
+            Tuple of (migration result, validation result or None)
+        """
+        result, migrated = self._migrate_content(filepath, content, backup_path)
+        validation = None
+        if self.options.validate_after and result.success and not self.options.dry_run:
+            validation = self.validate_content(filepath, migrated)
+        return result, validation
 
     def migrate_directory(self, root_dir: str) -> MigrationResult:
         """
         Migrate all AsciiDoc files in a directory.
 
         This method performs a two-pass migration:
-        1. First pass: Analyze all files to collect IDs and plan collision resolution
-        2. Second pass: Apply the migrations with consistent ID mappings
+        1. First pass: Read all files in parallel to collect IDs, then plan
+           collision resolution in file order so the result is deterministic
+        2. Second pass: Apply the migrations in parallel with consistent ID
+           mappings, from the buffers cached in the first pass
+
+        When backups are enabled, the plan is recorded in a write-ahead
+        journal in the backup directory before any file is rewritten, so an
+        interrupted run can be resumed (options.resume) or rolled back.
 
         Args:
             root_dir: Directory to migrate
@@ -770,30 +1258,44 @@ class ContextMigrator:
             MigrationResult object
         """
         try:
-            adoc_files = find_adoc_files(root_dir, recursive=True)
-
-            # First pass: collect all IDs and build global mappings
-            all_base_ids = {}  # base_id -> list of (full_id, filepath)
-            existing_ids = set()
+            workers = self.options.workers or os.cpu_count() or 1
+
+            # The journal relies on the backup store to roll back or to
+            # recognize files rewritten just before an interruption
+            journal = None
+            if self.options.create_backups and not self.options.dry_run:
+                journal = MigrationJournal.in_directory(self.options.backup_dir)
+                if journal.exists():
+                    if self.options.resume:
+                        return self._resume_directory(journal, workers)
+                    raise RuntimeError(
+                        f"An interrupted migration left a journal at {journal.path}; "
+                        "resume it or roll it back first"
+                    )
 
-            for filepath in adoc_files:
-                try:
-                    lines = read_text_preserve_endings(filepath)
-                    content = ''.join(text + ending for text, ending in lines)
+            # Sorted so collision suffixes don't depend on directory listing order
+            adoc_files = sorted(find_adoc_files(root_dir, recursive=True))
 
-                    for match in self.id_with_context_regex.finditer(content):
-                        full_id = match.group(1) + '_' + match.group(2)
-                        base_id = match.group(1)
+            # First pass: read every file once and collect its IDs
+            plans = list(
+                _map_files(
+                    _plan_worker, adoc_files, (self.options, {}, {}, set()), workers
+                )
+            )
 
-                        if base_id not in all_base_ids:
-                            all_base_ids[base_id] = []
-                        all_base_ids[base_id].append((full_id, filepath))
+            # Build global ID mappings with collision resolution
+            all_base_ids = {}  # base_id -> list of (full_id, filepath)
+            existing_ids = IDCollisionIndex()
 
-                except Exception as e:
-                    logger.warning(f"Error analyzing {filepath}: {e}")
+            for plan in plans:
+                if plan.error:
+                    logger.warning(f"Error analyzing {plan.filepath}: {plan.error}")
                     continue
+                for full_id, base_id in plan.context_ids:
+                    if base_id not in all_base_ids:
+                        all_base_ids[base_id] = []
+                    all_base_ids[base_id].append((full_id, plan.filepath))
 
-            # Build global ID mappings with collision resolution
             for base_id, id_list in all_base_ids.items():
                 if len(id_list) == 1:
                     # No collision
@@ -816,34 +1318,51 @@ class ContextMigrator:
                         self.id_mappings[full_id] = new_id
                         self.file_id_map[new_id] = filepath
 
-            # Second pass: apply migrations
-            file_results = []
-            validation_results = []
-
-            for filepath in adoc_files:
-                result = self.migrate_file(filepath)
-                file_results.append(result)
-
-                # Validate if requested and migration was successful
-                if (
-                    self.options.validate_after
-                    and result.success
-                    and not self.options.dry_run
-                ):
-                    validation_result = self.validate_migration(filepath)
-                    validation_results.append(validation_result)
+            # Every ID in the tree as it will be after migration, so xrefs to
+            # plain IDs in other files validate without another scan
+            self.known_ids.update(
+                self.id_mappings.get(id_value, id_value)
+                for plan in plans
+                if not plan.error
+                for id_value in plan.ids
+            )
 
-            successful_migrations = sum(1 for r in file_results if r.success)
-            failed_migrations = len(file_results) - successful_migrations
+            # Backups are taken before any file is rewritten
+            file_results: List[Optional[FileMigrationResult]] = [None] * len(plans)
+            pending = []  # (index, (filepath, content, backup_path))
+            for index, plan in enumerate(plans):
+                if plan.error:
+                    file_results[index] = self._failed_result(plan.filepath, plan.error)
+                    continue
+                try:
+                    backup_path = self.create_backup(
+                        plan.filepath, plan.content, plan.digest
+                    )
+                except Exception as e:
+                    file_results[index] = self._failed_result(plan.filepath, e)
+                    continue
+                pending.append((index, (plan.filepath, plan.content, backup_path)))
+            if self._backup_store is not None:
+                self._backup_store.close()
+
+            if journal is not None:
+                journal.begin(
+                    root_dir,
+                    self.id_mappings,
+                    self.file_id_map,
+                    self.known_ids,
+                    [
+                        PlannedFile(
+                            os.path.abspath(filepath),
+                            plans[index].digest,
+                            stat.S_IMODE(os.stat(filepath).st_mode),
+                        )
+                        for index, (filepath, _, _) in pending
+                    ],
+                )
 
-            return MigrationResult(
-                total_files_processed=len(file_results),
-                successful_migrations=successful_migrations,
-                failed_migrations=failed_migrations,
-                file_results=file_results,
-                validation_results=validation_results,
-                backup_directory=self.options.backup_dir,
-            )
+            # Second pass: apply and validate migrations from the cached buffers
+            return self._apply_pending(file_results, pending, journal, workers)
 
         except Exception as e:
             logger.error(f"Error migrating directory {root_dir}: {e}")
@@ -856,6 +1375,173 @@ class ContextMigrator:
                 backup_directory=self.options.backup_dir,
             )
 
+    def _apply_pending(
+        self,
+        file_results: List[Optional[FileMigrationResult]],
+        pending: List[Tuple[int, Tuple[str, str, str]]],
+        journal: Optional[MigrationJournal],
+        workers: int,
+    ) -> MigrationResult:
+        """
+        Run the apply pass and collect the directory migration result.
+
+        Args:
+            file_results: Results so far, with None for every pending file
+            pending: (result index, (filepath, content, backup_path)) to apply
+            journal: Journal to checkpoint each applied file in, if any
+            workers: Number of worker processes
+
+        Returns:
+            MigrationResult object
+        """
+        validations: List[Optional[ValidationResult]] = [None] * len(file_results)
+        applied = _map_files(
+            _apply_worker,
+            [item for _, item in pending],
+            (self.options, self.id_mappings, self.file_id_map, self.known_ids),
+            workers,
+        )
+        for (index, item), (result, validation) in zip(pending, applied):
+            file_results[index] = result
+            validations[index] = validation
+            if journal is not None and result.success:
+                journal.mark_done(os.path.abspath(item[0]))
+
+        if journal is not None:
+            journal.commit()
+
+        validation_results = [v for v in validations if v is not None]
+
+        successful_migrations = sum(1 for r in file_results if r.success)
+        failed_migrations = len(file_results) - successful_migrations
+
+        return MigrationResult(
+            total_files_processed=len(file_results),
+            successful_migrations=successful_migrations,
+            failed_migrations=failed_migrations,
+            file_results=file_results,
+            validation_results=validation_results,
+            backup_directory=self.options.backup_dir,
+        )
+
+    def _resume_directory(
+        self, journal: MigrationJournal, workers: int
+    ) -> MigrationResult:
+        """
+        Continue an interrupted directory migration from its journal.
+
+        Files marked done are skipped. A file rewritten just before the
+        interruption, but not yet marked done, is recognized by comparing it
+        with the migration of its backed-up original.
+
+        Args:
+            journal: Journal left by the interrupted run
+            workers: Number of worker processes
+
+        Returns:
+            MigrationResult for the files migrated by this run
+        """
+        state = journal.load()
+        self.id_mappings = dict(state.id_mappings)
+        self.file_id_map = dict(state.file_id_map)
+        self.known_ids = set(state.known_ids)
+        remaining = state.remaining
+        logger.info(
+            "Resuming migration of %s: %d of %d files left",
+            state.root_dir,
+            len(remaining),
+            len(state.planned),
+        )
+
+        plans = _map_files(
+            _plan_worker,
+            [entry.path for entry in remaining],
+            (self.options, {}, {}, set()),
+            workers,
+        )
+        file_results: List[Optional[FileMigrationResult]] = [None] * len(remaining)
+        pending = []
+        journal.reopen()
+
+        for index, (entry, plan) in enumerate(zip(remaining, plans)):
+            backup_path = ""
+            if self.options.create_backups:
+                backup_path = self.backup_store.blob_path(entry.before)
+
+            if plan.error:
+                file_results[index] = self._failed_result(entry.path, plan.error)
+            elif plan.digest == entry.before:
+                pending.append((index, (entry.path, plan.content, backup_path)))
+            elif self._already_migrated(entry, plan.content):
+                journal.mark_done(entry.path)
+                file_results[index] = FileMigrationResult(
+                    filepath=entry.path,
+                    success=True,
+                    id_changes=[],
+                    xref_changes=[],
+                    errors=[],
+                    backup_path=backup_path,
+                )
+            else:
+                file_results[index] = self._failed_result(
+                    entry.path,
+                    "file changed since the migration journal was written",
+                    backup_path,
+                )
+
+        return self._apply_pending(file_results, pending, journal, workers)
+
+    def _already_migrated(self, entry: PlannedFile, content: str) -> bool:
+        """Check whether a file not marked done already holds its migrated content."""
+        try:
+            with open(self.backup_store.blob_path(entry.before), "rb") as f:
+                original = f.read().decode("utf-8")
+        except (OSError, UnicodeDecodeError):
+            return False
+        return self.render_content(entry.path, original)[0] == content
+
+
+def _init_worker(
+    options: MigrationOptions,
+    id_mappings: Dict[str, str],
+    file_id_map: Dict[str, str],
+    known_ids: Set[str],
+) -> None:
+    """Build the migrator once per worker process with the planned ID mappings."""
+    global _worker_migrator
+    _worker_migrator = ContextMigrator(options)
+    _worker_migrator.id_mappings = id_mappings
+    _worker_migrator.file_id_map = file_id_map
+    _worker_migrator.known_ids = known_ids
+
+
+def _plan_worker(filepath: str) -> FilePlan:
+    """Run the planning pass for one file in a worker."""
+    return _worker_migrator.plan_file(filepath)
+
+
+def _apply_worker(
+    item: Tuple[str, str, str]
+) -> Tuple[FileMigrationResult, Optional[ValidationResult]]:
+    """Run the apply pass for one planned file in a worker."""
+    return _worker_migrator.apply_plan(*item)
+
+
+def _map_files(
+    func: Callable[[Any], Any], items: List[Any], initargs: tuple, workers: int
+) -> Iterator:
+    """Apply a worker function to all items in order, in a process pool for large batches."""
+    if workers <= 1 or len(items) < MIN_FILES_FOR_POOL:
+        _init_worker(*initargs)
+        yield from map(func, items)
+        return
+
+    chunksize = max(1, len(items) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=initargs
+    ) as executor:
+        yield from executor.map(func, items, chunksize=chunksize)
+
 
 def format_migration_report(result: MigrationResult) -> str:
     """
@@ -934,6 +1620,114 @@ def format_migration_report(result: MigrationResult) -> str:
     return "\n".join(lines)
 
 
+def migration_records(file_result: FileMigrationResult):
+    """
+    Flatten the migration result of one file into report records.
+
+    Args:
+        file_result: FileMigrationResult to flatten
+
+    Yields:
+        (kind, record) pairs: one "file" record, then its "id_change" and
+        "xref_change" records
+    """
+    filepath = file_result.filepath
+    yield "file", {
+        "file": filepath,
+        "status": "SUCCESS" if file_result.success else "FAILED",
+        "id_changes": len(file_result.id_changes),
+        "xref_changes": len(file_result.xref_changes),
+        "backup": file_result.backup_path,
+        "errors": file_result.errors,
+    }
+    for change in file_result.id_changes:
+        yield "id_change", {
+            "file": filepath,
+            "line": change.line_number,
+            "old": change.old_id,
+            "new": change.new_id,
+        }
+    for change in file_result.xref_changes:
+        yield "xref_change", {
+            "file": filepath,
+            "line": change.line_number,
+            "old": change.old_xref,
+            "new": change.new_xref,
+        }
+
+
+def format_migration_record(kind: str, record: Dict) -> List[str]:
+    """
+    Format one migration record for the streamed text report.
+
+    Args:
+        kind: Record type
+        record: Record fields
+
+    Returns:
+        Lines of text for the record
+    """
+    if kind == "file":
+        lines = ["", f"{record['file']}: {record['status']}"]
+        for error in record["errors"]:
+            lines.append(f"  Error: {error}")
+        return lines
+    if kind == "id_change":
+        return [f"  - ID: {record['old']} → {record['new']} (line {record['line']})"]
+    if kind == "xref_change":
+        return [
+            f"  - Xref: {record['old']} → {record['new']} (line {record['line']})"
+        ]
+    if kind == "validation":
+        lines = [f"{record['file']}: {record['status']}"]
+        if record["broken_xrefs"]:
+            lines.append(f"  Broken xrefs: {', '.join(record['broken_xrefs'])}")
+        for warning in record["warnings"]:
+            lines.append(f"  Warning: {warning}")
+        return lines
+    if kind == "summary":
+        return [
+            "",
+            "=== Summary ===",
+            f"Total files processed: {record['files_processed']}",
+            f"Successful migrations: {record['successful_migrations']}",
+            f"Failed migrations: {record['failed_migrations']}",
+            f"ID changes: {record['total_id_changes']}",
+            f"Xref changes: {record['total_xref_changes']}",
+            f"Backup directory: {record['backup_directory']}",
+        ]
+    return []
+
+
+def open_migration_writer(
+    output_format: str, output_file: Optional[str] = None
+) -> ReportWriter:
+    """
+    Open a streaming writer for a ContextMigrator report.
+
+    Args:
+        output_format: "text", "jsonl" or "csv"
+        output_file: File to write to (default: standard output)
+
+    Returns:
+        ReportWriter for the report
+    """
+    if output_format == "text":
+        return open_report_writer(
+            "text",
+            output_file,
+            formatter=format_migration_record,
+            header=["=== Context Migration Report ==="],
+            headings={
+                "file": ["", "=== File Migration Details ==="],
+                "validation": ["", "=== Validation Results ==="],
+            },
+        )
+    return open_report_writer(
+        output_format, output_file, fieldnames=MIGRATION_CSV_FIELDS
+    )
+
+
 def process_context_migrator_file(filepath: str, migrator: ContextMigrator):
     """
     Process a single file with the context migrator.
@@ -960,7 +1754,10 @@ def main(args):
             "resolve_collisions": not getattr(args, "no_collision_resolution", False),
             "validate_after": getattr(args, "validate", False),
             "output_file": getattr(args, "output", None),
+            "output_format": getattr(args, "format", "text"),
+            "stream": getattr(args, "stream", False),
             "verbose": getattr(args, "verbose", False),
+            "rollback": getattr(args, "rollback", False),
         }
 
         module.initialize(config)
@@ -1012,6 +1809,13 @@ def main(args):
         # Create migrator
         migrator = ContextMigrator(options)
 
+        if getattr(args, 'rollback', False):
+            restore_result = migrator.rollback()
+            print(format_restore_report(restore_result))
+            if restore_result.errors:
+                sys.exit(1)
+            return
+
         # Collect all file results
         file_results = []
 
@@ -1071,16 +1875,8 @@ def main(args):
             sys.exit(1)
 
 
-def register_subcommand(subparsers):
-    """Register this plugin as a subcommand."""
-    parser = subparsers.add_parser(
-        "ContextMigrator", help=__description__, description=__description__
-    )
-
-    # Add common arguments
-    common_arg_parser(parser)
-
-    # Add plugin-specific arguments
+def add_arguments(parser):
+    """Add ContextMigrator-specific options to a subcommand parser."""
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -1100,6 +1896,12 @@ def register_subcommand(subparsers):
         help="Directory for backup files (default: .migration_backups)",
     )
 
+    parser.add_argument(
+        "--rollback",
+        action="store_true",
+        help="Restore the files changed by the most recent migration from --backup-dir",
+    )
+
     parser.add_argument(
         "--no-collision-resolution",
         action="store_true",
@@ -1116,6 +1918,34 @@ def register_subcommand(subparsers):
         "--output", type=str, help="Save migration report to specified file"
     )
 
+    parser.add_argument(
+        "--format",
+        choices=['text', 'jsonl', 'csv'],
+        default='text',
+        help="Output format for the migration report (default: text); jsonl "
+        "and csv are written incrementally as files are migrated",
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write the text report file by file as files are migrated instead "
+        "of building it in memory (implied by --format jsonl/csv)",
+    )
+
+
+def register_subcommand(subparsers):
+    """Register this plugin as a subcommand."""
+    parser = subparsers.add_parser(
+        "ContextMigrator", help=__description__, description=__description__
+    )
+
+    # Add common arguments
+    common_arg_parser(parser)
+
+    # Add plugin-specific arguments
+    add_arguments(parser)
+
     parser.add_argument(
         "--verbose", action="store_true", help="Enable verbose logging output"
     )
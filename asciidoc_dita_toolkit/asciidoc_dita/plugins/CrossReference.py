@@ -21,13 +21,25 @@ from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple, Any
 
 from ..cli_utils import common_arg_parser
+from ..compact_records import XrefTable, intern_value
 from ..file_utils import (
+    MMAP_THRESHOLD,
     find_adoc_files,
+    iter_matching_lines,
     read_text_preserve_endings,
     write_text_preserve_endings,
 )
+from ..profiling import profile_file, profile_phase, profiled, record_structures
 from ..workflow_utils import process_adoc_files
 from ..regex_patterns import CompiledPatterns
+from ..report_snapshot import SnapshotWriter
+from ..report_writers import (
+    STREAM_FORMATS,
+    MultiReportWriter,
+    ReportWriter,
+    format_for_path,
+    open_report_writer,
+)
 
 # Try to import ADTModule for the new pattern
 try:
@@ -50,11 +62,42 @@ except ImportError:
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Every xref contains this; files without it are skipped before they are decoded
+PREFILTER = (b"xref:",)
+
+# Columns of the CSV report, shared by all record types
+VALIDATION_CSV_FIELDS = (
+    "file",
+    "line",
+    "xref",
+    "target_id",
+    "target_file",
+    "reason",
+    "old",
+    "new",
+    "message",
+    "files_processed",
+    "xrefs_found",
+    "broken_xrefs",
+    "fixed_xrefs",
+    "warnings",
+    "validation_successful",
+)
+
 
 @dataclass
 class BrokenXref:
     """Represents a broken cross-reference."""
 
+    __slots__ = (
+        "filepath",
+        "line_number",
+        "xref_text",
+        "target_id",
+        "target_file",
+        "reason",
+    )
+
     filepath: str
     line_number: int
     xref_text: str
@@ -67,6 +110,8 @@ class BrokenXref:
 class XrefFix:
     """Represents a fixed cross-reference."""
 
+    __slots__ = ("filepath", "line_number", "old_xref", "new_xref")
+
     filepath: str
     line_number: int
     old_xref: str
@@ -83,6 +128,7 @@ class ValidationReport:
     fixed_xrefs: List[XrefFix]
     warnings: List[str]
     validation_successful: bool
+    files_skipped: int = 0
 
 
 class CrossReferenceModule(ADTModule):
@@ -130,12 +176,18 @@ class CrossReferenceModule(ADTModule):
         self.generate_report = config.get("generate_report", False)
         self.report_file = config.get("report_file")
         self.detailed_report = config.get("detailed_report", False)
+        self.stream_report = config.get("stream_report", False)
+        self.snapshot_file = config.get("snapshot_file")
+        self.report_format = config.get(
+            "report_format", format_for_path(self.report_file)
+        )
         self.recursive = config.get("recursive", False)
         self.directory = config.get("directory", ".")
         self.verbose = config.get("verbose", False)
 
         # Initialize statistics
         self.files_processed = 0
+        self.files_skipped = 0
         self.xrefs_found = 0
         self.broken_xrefs_count = 0
         self.fixed_xrefs_count = 0
@@ -145,6 +197,9 @@ class CrossReferenceModule(ADTModule):
         # Initialize processor (will be set per operation)
         self.processor = None
 
+        # Streaming report writer, open while execute() runs
+        self.report_writer: Optional[ReportWriter] = None
+
         if self.verbose:
             print(f"Initialized CrossReference v{self.version}")
             print(f"  Master file: {self.master_file}")
@@ -156,6 +211,7 @@ class CrossReferenceModule(ADTModule):
             print(f"  Recursive: {self.recursive}")
             print(f"  Directory: {self.directory}")
 
+    @profiled("CrossReference")
     def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute the cross-reference processing.
@@ -174,12 +230,19 @@ class CrossReferenceModule(ADTModule):
 
             # Reset statistics
             self.files_processed = 0
+            self.files_skipped = 0
             self.xrefs_found = 0
             self.broken_xrefs_count = 0
             self.fixed_xrefs_count = 0
             self.warnings_count = 0
             self.master_files_found = 0
 
+            if self.generate_report and (
+                self.report_format in STREAM_FORMATS
+                or (self.stream_report and self.report_format == "text")
+            ):
+                return self._execute_streaming(directory, recursive, master_file)
+
             # Process based on configuration
             if master_file:
                 # Process specific master file
@@ -191,12 +254,18 @@ class CrossReferenceModule(ADTModule):
                 # Look for master.adoc in current directory
                 result = self._process_default_master_file(directory)
 
-            # Generate and save report if requested
-            if self.generate_report and result.get("validation_report"):
-                report_result = self._generate_and_save_report(
-                    result["validation_report"]
-                )
-                result.update(report_result)
+            with profile_phase("report"):
+                # Generate and save report if requested
+                if self.generate_report and result.get("validation_report"):
+                    report_result = self._generate_and_save_report(
+                        result["validation_report"]
+                    )
+                    result.update(report_result)
+
+                if self.snapshot_file and result.get("validation_report"):
+                    save_validation_snapshot(
+                        result["validation_report"], self.snapshot_file
+                    )
 
             return result
 
@@ -217,6 +286,62 @@ class CrossReferenceModule(ADTModule):
                 "master_files_found": self.master_files_found,
             }
 
+    def _execute_streaming(
+        self, directory: str, recursive: bool, master_file: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Process the master files, writing broken and fixed xrefs as they are found.
+
+        The processors do not keep the broken and fixed xrefs; their totals
+        are taken from the report writer.
+
+        Args:
+            directory: Directory to search for master files
+            recursive: Whether to search for master files recursively
+            master_file: Specific master file to process, if any
+
+        Returns:
+            Dictionary with execution results
+        """
+        self.report_writer = open_validation_writer(
+            self.report_format, self.report_file, self.detailed_report
+        )
+        if self.snapshot_file:
+            self.report_writer = MultiReportWriter(
+                [
+                    self.report_writer,
+                    SnapshotWriter(self.snapshot_file, "CrossReference"),
+                ]
+            )
+        try:
+            if master_file:
+                result = self._process_specific_master_file(master_file)
+            elif recursive:
+                result = self._process_recursive_master_files(directory)
+            else:
+                result = self._process_default_master_file(directory)
+
+            report = result.get("validation_report")
+            if report is not None:
+                with profile_phase("report"):
+                    write_validation_summary(self.report_writer, report)
+        finally:
+            with profile_phase("report"):
+                self.report_writer.close()
+            self.report_writer = None
+
+        if self.verbose and self.report_file:
+            print(f"Validation report saved to {self.report_file}")
+
+        result.update(
+            {
+                "report_generated": True,
+                "report_format": self.report_format,
+                "report_file": self.report_file,
+            }
+        )
+        return result
+
     def _process_specific_master_file(self, master_file: str) -> Dict[str, Any]:
         """Process a specific master file."""
         if not os.path.exists(master_file):
@@ -237,7 +362,9 @@ class CrossReferenceModule(ADTModule):
             }
 
         self.master_files_found = 1
-        report = process_master_file(master_file, self.check_only, self.migration_mode)
+        report = process_master_file(
+            master_file, self.check_only, self.migration_mode, self.report_writer
+        )
         self._update_statistics_from_report(report)
 
         return {
@@ -247,6 +374,7 @@ class CrossReferenceModule(ADTModule):
             "operation": "process_specific_master",
             "master_file": master_file,
             "files_processed": self.files_processed,
+            "files_skipped": self.files_skipped,
             "xrefs_found": self.xrefs_found,
             "broken_xrefs_count": self.broken_xrefs_count,
             "fixed_xrefs_count": self.fixed_xrefs_count,
@@ -289,7 +417,7 @@ class CrossReferenceModule(ADTModule):
             if self.verbose:
                 print(f"Processing {master_file}")
             report = process_master_file(
-                master_file, self.check_only, self.migration_mode
+                master_file, self.check_only, self.migration_mode, self.report_writer
             )
             all_reports.append(report)
 
@@ -301,6 +429,7 @@ class CrossReferenceModule(ADTModule):
             fixed_xrefs=[fix for r in all_reports for fix in r.fixed_xrefs],
             warnings=[warning for r in all_reports for warning in r.warnings],
             validation_successful=all(r.validation_successful for r in all_reports),
+            files_skipped=sum(r.files_skipped for r in all_reports),
         )
 
         self._update_statistics_from_report(combined_report)
@@ -312,6 +441,7 @@ class CrossReferenceModule(ADTModule):
             "operation": "process_recursive",
             "directory": directory,
             "files_processed": self.files_processed,
+            "files_skipped": self.files_skipped,
             "xrefs_found": self.xrefs_found,
             "broken_xrefs_count": self.broken_xrefs_count,
             "fixed_xrefs_count": self.fixed_xrefs_count,
@@ -345,7 +475,9 @@ class CrossReferenceModule(ADTModule):
             }
 
         self.master_files_found = 1
-        report = process_master_file(master_file, self.check_only, self.migration_mode)
+        report = process_master_file(
+            master_file, self.check_only, self.migration_mode, self.report_writer
+        )
         self._update_statistics_from_report(report)
 
         return {
@@ -356,6 +488,7 @@ class CrossReferenceModule(ADTModule):
             "master_file": master_file,
             "directory": directory,
             "files_processed": self.files_processed,
+            "files_skipped": self.files_skipped,
             "xrefs_found": self.xrefs_found,
             "broken_xrefs_count": self.broken_xrefs_count,
             "fixed_xrefs_count": self.fixed_xrefs_count,
@@ -368,10 +501,16 @@ class CrossReferenceModule(ADTModule):
     def _update_statistics_from_report(self, report: ValidationReport) -> None:
         """Update module statistics from validation report."""
         self.files_processed = report.total_files_processed
+        self.files_skipped = report.files_skipped
         self.xrefs_found = report.total_xrefs_found
-        self.broken_xrefs_count = len(report.broken_xrefs)
-        self.fixed_xrefs_count = len(report.fixed_xrefs)
         self.warnings_count = len(report.warnings)
+        if self.report_writer is not None:
+            # Streamed records are not kept in the report
+            self.broken_xrefs_count = self.report_writer.counts.get("broken", 0)
+            self.fixed_xrefs_count = self.report_writer.counts.get("fixed", 0)
+        else:
+            self.broken_xrefs_count = len(report.broken_xrefs)
+            self.fixed_xrefs_count = len(report.fixed_xrefs)
 
     def _generate_and_save_report(self, report: ValidationReport) -> Dict[str, Any]:
         """Generate and save validation report."""
@@ -418,6 +557,7 @@ class CrossReferenceModule(ADTModule):
         if self.verbose:
             print(f"CrossReference cleanup complete")
             print(f"  Total files processed: {self.files_processed}")
+            print(f"  Files skipped by prefilter: {self.files_skipped}")
             print(f"  Total xrefs found: {self.xrefs_found}")
             print(f"  Broken xrefs: {self.broken_xrefs_count}")
             print(f"  Fixed xrefs: {self.fixed_xrefs_count}")
@@ -458,9 +598,25 @@ class CrossReferenceProcessor:
     Processes AsciiDoc files to fix cross-references by mapping IDs to files
     and updating xref links to include proper file paths.
     Enhanced with validation, migration awareness, and comprehensive reporting.
+
+    When a report writer is given, broken and fixed xrefs are written to it
+    as they are found instead of being kept in broken_xrefs and fixed_xrefs.
+
+    Files of at least mmap_threshold bytes are scanned through a memory map
+    when they are only read: while building the ID map, and in validation
+    mode. Only the lines that can hold an ID, include or xref are decoded.
+
+    Smaller files without "xref:" are skipped before they are decoded, as
+    they have no xrefs to validate or fix.
     """
 
-    def __init__(self, validation_only: bool = False, migration_mode: bool = False):
+    def __init__(
+        self,
+        validation_only: bool = False,
+        migration_mode: bool = False,
+        writer: Optional[ReportWriter] = None,
+        mmap_threshold: int = MMAP_THRESHOLD,
+    ):
         # Use shared regex patterns
         self.id_regex = CompiledPatterns.ID_REGEX
         self.include_regex = CompiledPatterns.INCLUDE_REGEX
@@ -481,14 +637,17 @@ class CrossReferenceProcessor:
         self.broken_xrefs: List[BrokenXref] = []
         self.fixed_xrefs: List[XrefFix] = []
         self.warnings: List[str] = []
+        self.writer = writer
+        self.broken_count = 0
+        self.mmap_threshold = mmap_threshold
+        self.files_skipped = 0
 
         # Context-aware ID mappings (old_id -> new_id)
         self.context_id_mappings: Dict[str, str] = {}
 
-        # Track all found xrefs for validation
-        self.all_xrefs: List[Tuple[str, int, str, str, str]] = (
-            []
-        )  # (filepath, line_num, full_match, target_id, target_file)
+        # Track all found xrefs for validation, stored column-wise as
+        # (filepath, line_num, full_match, target_id, target_file) rows
+        self.all_xrefs = XrefTable()
 
     def build_id_map(self, file: str, processed_files: Set[str] = None) -> None:
         """
@@ -511,58 +670,65 @@ class CrossReferenceProcessor:
         path = os.path.dirname(file)
 
         try:
-            with open(file, 'r', encoding='utf-8') as f:
-                logger.debug(f"Reading file {file}")
-                lines = f.readlines()
-
-                # Store potential context mappings for second pass
-                temp_context_ids = {}
-
-                # First pass: collect all IDs and potential context mappings
-                for line_num, line in enumerate(lines, 1):
-                    # Look for ID definitions
-                    id_match = self.id_regex.search(line.strip())
-                    include_match = self.include_regex.search(line.strip())
-
-                    if id_match:
-                        id_value = id_match.group(1)
-                        self.id_map[id_value] = file
-                        logger.debug(f"Found ID '{id_value}' in file {file}")
-
-                        # Collect potential context mappings for second pass
-                        if self.migration_mode:
-                            context_match = self.context_id_regex.search(line.strip())
-                            if context_match:
-                                full_id = (
-                                    context_match.group(1)
-                                    + '_'
-                                    + context_match.group(2)
-                                )
-                                base_id = context_match.group(1)
-                                temp_context_ids[full_id] = base_id
-
-                    elif include_match:
-                        include_path = include_match.group()
-                        combined_path = os.path.join(path, include_path)
-                        file_path = os.path.normpath(combined_path)
-
-                        if os.path.exists(file_path):
-                            self.build_id_map(file_path, processed_files)
-                        else:
-                            warning = f"Include file not found: {file_path} (referenced in {file})"
-                            self.warnings.append(warning)
-                            logger.warning(warning)
-
-                # Second pass: apply context mappings where both IDs exist in the same file
-                if self.migration_mode and temp_context_ids:
-                    for full_id, base_id in temp_context_ids.items():
-                        if base_id in self.id_map and self.id_map[base_id] == file:
-                            self.context_id_mappings[full_id] = base_id
-                            logger.debug(f"Context ID mapping: {full_id} -> {base_id}")
-                        else:
-                            logger.debug(
-                                f"No base ID '{base_id}' found for context ID '{full_id}' in file {file}"
+            logger.debug(f"Reading file {file}")
+            if os.path.getsize(file) >= self.mmap_threshold:
+                # Only lines with an ID or an include are used below
+                lines = [
+                    text
+                    for _, text in iter_matching_lines(file, (b'[id="', b"include::"))
+                ]
+            else:
+                with open(file, 'r', encoding='utf-8') as f:
+                    lines = f.readlines()
+
+            # Store potential context mappings for second pass
+            temp_context_ids = {}
+
+            # First pass: collect all IDs and potential context mappings
+            for line_num, line in enumerate(lines, 1):
+                # Look for ID definitions
+                id_match = self.id_regex.search(line.strip())
+                include_match = self.include_regex.search(line.strip())
+
+                if id_match:
+                    id_value = id_match.group(1)
+                    self.id_map[id_value] = file
+                    logger.debug(f"Found ID '{id_value}' in file {file}")
+
+                    # Collect potential context mappings for second pass
+                    if self.migration_mode:
+                        context_match = self.context_id_regex.search(line.strip())
+                        if context_match:
+                            full_id = (
+                                context_match.group(1)
+                                + '_'
+                                + context_match.group(2)
                             )
+                            base_id = context_match.group(1)
+                            temp_context_ids[full_id] = base_id
+
+                elif include_match:
+                    include_path = include_match.group()
+                    combined_path = os.path.join(path, include_path)
+                    file_path = os.path.normpath(combined_path)
+
+                    if os.path.exists(file_path):
+                        self.build_id_map(file_path, processed_files)
+                    else:
+                        warning = f"Include file not found: {file_path} (referenced in {file})"
+                        self.warnings.append(warning)
+                        logger.warning(warning)
+
+            # Second pass: apply context mappings where both IDs exist in the same file
+            if self.migration_mode and temp_context_ids:
+                for full_id, base_id in temp_context_ids.items():
+                    if base_id in self.id_map and self.id_map[base_id] == file:
+                        self.context_id_mappings[full_id] = base_id
+                        logger.debug(f"Context ID mapping: {full_id} -> {base_id}")
+                    else:
+                        logger.debug(
+                            f"No base ID '{base_id}' found for context ID '{full_id}' in file {file}"
+                        )
 
         except Exception as e:
             error_msg = f"Error reading {file}: {e}"
@@ -626,7 +792,7 @@ class CrossReferenceProcessor:
                 target_file=target_file,
                 reason=reason,
             )
-            self.broken_xrefs.append(broken_xref)
+            self.record_broken(broken_xref)
             return False
 
         # If target file is specified, validate it matches
@@ -642,11 +808,26 @@ class CrossReferenceProcessor:
                     target_file=target_file,
                     reason=reason,
                 )
-                self.broken_xrefs.append(broken_xref)
+                self.record_broken(broken_xref)
                 return False
 
         return True
 
+    def record_broken(self, broken_xref: BrokenXref) -> None:
+        """Keep a broken xref, or write it to the report writer."""
+        self.broken_count += 1
+        if self.writer is None:
+            self.broken_xrefs.append(broken_xref)
+        else:
+            self.writer.write("broken", broken_record(broken_xref))
+
+    def record_fix(self, fix: XrefFix) -> None:
+        """Keep a fixed xref, or write it to the report writer."""
+        if self.writer is None:
+            self.fixed_xrefs.append(fix)
+        else:
+            self.writer.write("fixed", fix_record(fix))
+
     def update_xref(self, filepath: str, line_num: int, regex_match) -> str:
         """
         Update a cross-reference link to include the proper file path.
@@ -683,7 +864,7 @@ class CrossReferenceProcessor:
                 target_file="",
                 reason=f"ID '{preferred_id}' not found in documentation",
             )
-            self.broken_xrefs.append(broken_xref)
+            self.record_broken(broken_xref)
 
             return original_xref
 
@@ -698,7 +879,7 @@ class CrossReferenceProcessor:
             old_xref=original_xref,
             new_xref=updated_xref,
         )
-        self.fixed_xrefs.append(fix)
+        self.record_fix(fix)
 
         if self.migration_mode and preferred_id != target_id:
             print(
@@ -724,11 +905,26 @@ class CrossReferenceProcessor:
             filepath: Path to the file to process
         """
         try:
-            lines = read_text_preserve_endings(filepath)
+            if (
+                self.validation_only
+                and os.path.getsize(filepath) >= self.mmap_threshold
+            ):
+                # Read-only: decode just the lines that can hold an xref
+                numbered = list(iter_matching_lines(filepath, (b"xref:",)))
+            else:
+                lines = read_text_preserve_endings(filepath, PREFILTER)
+                if lines is None:
+                    self.files_skipped += 1
+                    logger.debug(f"Skipped file {filepath}: no xrefs")
+                    return
+                numbered = [(n, text) for n, (text, _) in enumerate(lines, 1)]
             logger.debug(f"Processing file {filepath}")
 
+            # Every record of this file shares one path string
+            filepath = intern_value(filepath)
+
             # Track all xrefs for validation
-            for line_num, (text, ending) in enumerate(lines, 1):
+            for line_num, text in numbered:
                 for match in self.xref_regex.finditer(text):
                     target_id = match.group(1)
                     full_match = match.group(0)
@@ -738,7 +934,7 @@ class CrossReferenceProcessor:
 
             if self.validation_only:
                 # Only validate, don't modify
-                for line_num, (text, ending) in enumerate(lines, 1):
+                for line_num, text in numbered:
                     for match in self.xref_regex.finditer(text):
                         target_id = match.group(1)
                         full_match = match.group(0)
@@ -782,7 +978,10 @@ class CrossReferenceProcessor:
         processed_files = set(self.id_map.values())
 
         for filepath in processed_files:
-            self.process_file(filepath)
+            with profile_file(filepath):
+                self.process_file(filepath)
+            if self.writer is not None:
+                self.writer.flush()
 
     def generate_validation_report(self) -> ValidationReport:
         """
@@ -791,13 +990,21 @@ class CrossReferenceProcessor:
         Returns:
             ValidationReport object
         """
+        record_structures(
+            "CrossReference",
+            id_map=self.id_map,
+            all_xrefs=self.all_xrefs,
+            broken_xrefs=self.broken_xrefs,
+            fixed_xrefs=self.fixed_xrefs,
+        )
         return ValidationReport(
             total_files_processed=len(self.processed_files),
             total_xrefs_found=len(self.all_xrefs),
             broken_xrefs=self.broken_xrefs,
             fixed_xrefs=self.fixed_xrefs,
             warnings=self.warnings,
-            validation_successful=len(self.broken_xrefs) == 0,
+            validation_successful=self.broken_count == 0 and not self.broken_xrefs,
+            files_skipped=self.files_skipped,
         )
 
 
@@ -821,7 +1028,10 @@ def find_master_files(root_dir: str) -> List[str]:
 
 
 def process_master_file(
-    filepath: str, validation_only: bool = False, migration_mode: bool = False
+    filepath: str,
+    validation_only: bool = False,
+    migration_mode: bool = False,
+    writer: Optional[ReportWriter] = None,
 ) -> ValidationReport:
     """
     Process a single master.adoc file and fix cross-references.
@@ -830,14 +1040,17 @@ def process_master_file(
         filepath: Path to the master.adoc file to process
         validation_only: If True, only validate without fixing
         migration_mode: If True, use migration-aware processing
+        writer: Optional report writer that broken and fixed xrefs are
+            streamed to instead of being kept in the report
 
     Returns:
         ValidationReport object
     """
-    processor = CrossReferenceProcessor(validation_only, migration_mode)
+    processor = CrossReferenceProcessor(validation_only, migration_mode, writer)
 
     # Build the ID map from the master file
-    processor.build_id_map(filepath)
+    with profile_phase("discovery"):
+        processor.build_id_map(filepath)
 
     if not processor.id_map:
         warning = f"No IDs found in {filepath} or its includes"
@@ -875,6 +1088,7 @@ def format_validation_report(report: ValidationReport, detailed: bool = False) -
     lines.extend(
         [
             f"Files processed: {report.total_files_processed}",
+            f"Files skipped by prefilter: {report.files_skipped}",
             f"Total xrefs found: {report.total_xrefs_found}",
             f"Broken xrefs: {len(report.broken_xrefs)}",
             f"Fixed xrefs: {len(report.fixed_xrefs)}",
@@ -912,6 +1126,142 @@ def format_validation_report(report: ValidationReport, detailed: bool = False) -
     return "\n".join(lines)
 
 
+def broken_record(broken: BrokenXref) -> Dict[str, Any]:
+    """Convert a broken xref into a report record."""
+    return {
+        "file": broken.filepath,
+        "line": broken.line_number,
+        "xref": broken.xref_text,
+        "target_id": broken.target_id,
+        "target_file": broken.target_file,
+        "reason": broken.reason,
+    }
+
+
+def fix_record(fix: XrefFix) -> Dict[str, Any]:
+    """Convert a fixed xref into a report record."""
+    return {
+        "file": fix.filepath,
+        "line": fix.line_number,
+        "old": fix.old_xref,
+        "new": fix.new_xref,
+    }
+
+
+def write_validation_summary(writer: ReportWriter, report: ValidationReport) -> None:
+    """
+    Write the warning and summary records that close a streamed report.
+
+    Args:
+        writer: Report writer the broken and fixed xrefs were written to
+        report: Combined ValidationReport of the run
+    """
+    records = [("warning", {"message": warning}) for warning in report.warnings]
+    records.append(
+        (
+            "summary",
+            {
+                "files_processed": report.total_files_processed,
+                "xrefs_found": report.total_xrefs_found,
+                "broken_xrefs": writer.counts.get("broken", 0),
+                "fixed_xrefs": writer.counts.get("fixed", 0),
+                "warnings": len(report.warnings),
+                "validation_successful": report.validation_successful,
+            },
+        )
+    )
+    writer.write_section(records)
+
+
+def save_validation_snapshot(report: ValidationReport, snapshot_file: str) -> None:
+    """
+    Save a compact snapshot of a validation report for later comparison.
+
+    Args:
+        report: ValidationReport to save
+        snapshot_file: Path of the snapshot to write
+    """
+    with SnapshotWriter(snapshot_file, "CrossReference") as writer:
+        writer.write_section(
+            ("broken", broken_record(broken)) for broken in report.broken_xrefs
+        )
+        writer.write_section(("fixed", fix_record(fix)) for fix in report.fixed_xrefs)
+        write_validation_summary(writer, report)
+
+
+def format_validation_record(kind: str, record: Dict) -> List[str]:
+    """
+    Format one validation record for the streamed text report.
+
+    Args:
+        kind: Record type
+        record: Record fields
+
+    Returns:
+        Lines of text for the record
+    """
+    if kind == "broken":
+        return [
+            f"{record['file']}:{record['line']}",
+            f"  Xref: {record['xref']}",
+            f"  Target ID: {record['target_id']}",
+            f"  Reason: {record['reason']}",
+            "",
+        ]
+    if kind == "fixed":
+        return [
+            f"{record['file']}:{record['line']}",
+            f"  {record['old']} -> {record['new']}",
+            "",
+        ]
+    if kind == "warning":
+        return [f"- {record['message']}"]
+    if kind == "summary":
+        return [
+            "",
+            "=== Summary ===",
+            f"Files processed: {record['files_processed']}",
+            f"Total xrefs found: {record['xrefs_found']}",
+            f"Broken xrefs: {record['broken_xrefs']}",
+            f"Fixed xrefs: {record['fixed_xrefs']}",
+            f"Warnings: {record['warnings']}",
+            f"Validation successful: {'Yes' if record['validation_successful'] else 'No'}",
+        ]
+    return []
+
+
+def open_validation_writer(
+    report_format: str, report_file: Optional[str] = None, detailed: bool = False
+) -> ReportWriter:
+    """
+    Open a streaming writer for a CrossReference validation report.
+
+    Args:
+        report_format: "text", "jsonl" or "csv"
+        report_file: File to write to (default: standard output)
+        detailed: Whether the text report lists fixed xrefs
+
+    Returns:
+        ReportWriter for the report
+    """
+    if report_format == "text":
+        return open_report_writer(
+            "text",
+            report_file,
+            formatter=format_validation_record,
+            header=["=== Cross-Reference Validation Report ==="],
+            headings={
+                "broken": ["", "=== Broken Cross-References ==="],
+                "fixed": ["", "=== Fixed Cross-References ==="],
+                "warning": ["", "=== Warnings ==="],
+            },
+            kinds=None if detailed else {"broken", "warning", "summary"},
+        )
+    return open_report_writer(
+        report_format, report_file, fieldnames=VALIDATION_CSV_FIELDS
+    )
+
+
 def main(args):
     """Legacy main function for backward compatibility."""
     if ADT_MODULE_AVAILABLE:
@@ -927,6 +1277,8 @@ def main(args):
             or getattr(args, "check_only", False),
             "report_file": getattr(args, "report", None),
             "detailed_report": getattr(args, "detailed", False),
+            "stream_report": getattr(args, "stream", False),
+            "snapshot_file": getattr(args, "snapshot", None),
             "recursive": getattr(args, "recursive", False),
             "directory": getattr(args, "directory", "."),
             "verbose": getattr(args, "verbose", False),
@@ -1032,6 +1384,7 @@ def main(args):
                     validation_successful=all(
                         r.validation_successful for r in all_reports
                     ),
+                    files_skipped=sum(r.files_skipped for r in all_reports),
                 )
 
             else:
@@ -1081,16 +1434,8 @@ def main(args):
             sys.exit(1)
 
 
-def register_subcommand(subparsers):
-    """Register this plugin as a subcommand."""
-    parser = subparsers.add_parser(
-        "CrossReference", help=__description__, description=__description__
-    )
-
-    # Add common arguments from the toolkit
-    common_arg_parser(parser)
-
-    # Add plugin-specific arguments
+def add_arguments(parser):
+    """Add CrossReference-specific options to a subcommand parser."""
     parser.add_argument(
         "--master-file", type=str, help="Complete path to your master.adoc file"
     )
@@ -1116,7 +1461,15 @@ def register_subcommand(subparsers):
     parser.add_argument(
         "--report",
         type=str,
-        help="Save validation report to specified file (use .json extension for JSON format)",
+        help="Save validation report to specified file (use .json extension for JSON, "
+        ".jsonl for JSON Lines or .csv for CSV format)",
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write the text report as xrefs are checked instead of building it "
+        "in memory (implied by .jsonl and .csv report files)",
     )
 
     parser.add_argument(
@@ -1125,6 +1478,25 @@ def register_subcommand(subparsers):
         help="Include detailed information in reports",
     )
 
+    parser.add_argument(
+        "--snapshot",
+        type=str,
+        help="Also save a compact snapshot of the results for adt-report-diff",
+    )
+
+
+def register_subcommand(subparsers):
+    """Register this plugin as a subcommand."""
+    parser = subparsers.add_parser(
+        "CrossReference", help=__description__, description=__description__
+    )
+
+    # Add common arguments from the toolkit
+    common_arg_parser(parser)
+
+    # Add plugin-specific arguments
+    add_arguments(parser)
+
     parser.add_argument(
         "--verbose", action="store_true", help="Enable verbose logging output"
     )
@@ -13,10 +13,12 @@ __description__ = "Configure directory scoping for AsciiDoc processing (preview)
 
 import logging
 import os
+import re
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict, Any
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from ..config_utils import (
     save_json_config as save_config_file,
@@ -294,18 +296,19 @@ class DirectoryConfigModule(ADTModule):
     def _load_and_apply_configuration(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Load and apply existing configuration to context."""
         try:
-            config = load_directory_config()
+            compiled = get_compiled_directory_config()
+            config = compiled.config if compiled else None
 
             if config:
                 # Apply directory filters to context
                 directory = context.get("directory", ".")
-                filtered_dirs = apply_directory_filters(directory, config)
+                filtered_dirs = apply_directory_filters(directory, compiled)
 
                 self.directories_processed = len(filtered_dirs)
 
                 # If recursive processing is enabled, get filtered files
                 if context.get("recursive", False):
-                    filtered_files = get_filtered_adoc_files(directory, config)
+                    filtered_files = get_filtered_adoc_files(directory, compiled)
                     self.files_filtered = len(filtered_files)
 
                 if self.verbose:
@@ -406,6 +409,343 @@ def _is_path_under_directory(file_path: str, dir_path: str) -> bool:
         return False
 
 
+def _path_components(path: str) -> Tuple[str, ...]:
+    """
+    Split a normalized absolute path into case-normalized components.
+
+    Args:
+        path: Normalized absolute path
+
+    Returns:
+        Tuple of path components, starting with the drive or root
+    """
+    drive, rest = os.path.splitdrive(os.path.normcase(path))
+    return (drive or os.sep,) + tuple(part for part in rest.split(os.sep) if part)
+
+
+class PathPrefixIndex:
+    """
+    Path-component trie of directories.
+
+    Answers "is this path equal to or under any indexed directory" in
+    O(depth) instead of comparing against every directory in turn.
+    """
+
+    _TERMINAL = object()
+
+    def __init__(self, directories: Iterable[str] = ()):
+        """
+        Build the index.
+
+        Args:
+            directories: Normalized absolute directory paths to index
+        """
+        self._root: Dict[Any, Any] = {}
+        self.size = 0
+        for directory in directories:
+            self.add(directory)
+
+    def __bool__(self) -> bool:
+        return self.size > 0
+
+    def add(self, directory: str) -> None:
+        """
+        Add a directory to the index.
+
+        Args:
+            directory: Normalized absolute directory path
+        """
+        node = self._root
+        for component in _path_components(directory):
+            if self._TERMINAL in node:
+                return  # Already covered by a parent directory
+            node = node.setdefault(component, {})
+        node.clear()  # Subdirectories are covered by this entry now
+        node[self._TERMINAL] = True
+        self.size += 1
+
+    def covers(self, path: str) -> bool:
+        """
+        Check whether a path is equal to or under an indexed directory.
+
+        Args:
+            path: Normalized absolute path to check
+
+        Returns:
+            True if the path is covered by the index, False otherwise
+        """
+        node = self._root
+        for component in _path_components(path):
+            if self._TERMINAL in node:
+                return True
+            node = node.get(component)
+            if node is None:
+                return False
+        return self._TERMINAL in node
+
+
+# Characters that make an includeDirs/excludeDirs entry a glob pattern
+GLOB_CHARACTERS = frozenset("*?[")
+
+
+def is_glob_pattern(entry: str) -> bool:
+    """
+    Check whether an includeDirs/excludeDirs entry is a glob pattern.
+
+    Args:
+        entry: Configuration entry
+
+    Returns:
+        True if the entry contains glob characters, False for literal paths
+    """
+    return any(char in GLOB_CHARACTERS for char in entry)
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """
+    Translate a gitignore-style directory pattern into a regular expression.
+
+    The expression matches repository-relative POSIX paths. ``*`` and ``?``
+    stay within one path component, ``**`` spans any number of components,
+    and a pattern without a slash matches a directory name at any depth.
+
+    Args:
+        pattern: Glob pattern such as ``**/_build/**`` or ``*/snippets/generated``
+
+    Returns:
+        Regular expression source for the pattern
+    """
+    pattern = pattern.replace("\\", "/").strip("/")
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            parts.append("(?:/.*)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 2 :]:
+            end = pattern.index("]", i + 2)
+            content = pattern[i + 1 : end].replace("\\", "\\\\")
+            if content.startswith("!"):
+                content = "^/" + content[1:]
+            parts.append(f"[{content}]")
+            i = end + 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+
+    regex = "".join(parts)
+    if "/" not in pattern:
+        regex = "(?:.*/)?" + regex
+    return regex
+
+
+class DirectoryPatternMatcher:
+    """
+    Glob patterns from the configuration compiled into a single regex.
+
+    Paths are matched relative to the repository root; paths outside the
+    repository never match.
+    """
+
+    def __init__(self, patterns: Iterable[str], repo_root: str):
+        """
+        Compile the patterns.
+
+        Args:
+            patterns: Glob patterns from includeDirs or excludeDirs
+            repo_root: Normalized repository root
+        """
+        self.patterns = list(patterns)
+        self.repo_root = repo_root
+        self._regex = None
+        if self.patterns:
+            self._regex = re.compile(
+                "|".join(f"(?:{_glob_to_regex(p)})" for p in self.patterns)
+            )
+
+    def __bool__(self) -> bool:
+        return self._regex is not None
+
+    def _relative(self, path: str) -> Optional[str]:
+        """Return path relative to the repository root, or None if outside."""
+        try:
+            relative = os.path.relpath(path, self.repo_root)
+        except ValueError:
+            return None  # Different drive on Windows
+        if relative == "." or relative == os.pardir or relative.startswith(
+            os.pardir + os.sep
+        ):
+            return None
+        return relative.replace(os.sep, "/")
+
+    def matches(self, path: str) -> bool:
+        """
+        Check whether a directory matches one of the patterns.
+
+        Args:
+            path: Normalized absolute directory path
+
+        Returns:
+            True if the directory itself matches, False otherwise
+        """
+        if self._regex is None:
+            return False
+        relative = self._relative(path)
+        return relative is not None and self._regex.fullmatch(relative) is not None
+
+    def covers(self, path: str) -> bool:
+        """
+        Check whether a directory or any of its ancestors matches.
+
+        Args:
+            path: Normalized absolute directory path
+
+        Returns:
+            True if the directory is inside a matching directory, False otherwise
+        """
+        if self._regex is None:
+            return False
+        relative = self._relative(path)
+        if relative is None:
+            return False
+        components = relative.split("/")
+        return any(
+            self._regex.fullmatch("/".join(components[:depth]))
+            for depth in range(1, len(components) + 1)
+        )
+
+
+class DirectoryExcludeFilter:
+    """Literal exclude directories and exclude patterns, compiled once."""
+
+    def __init__(self, exclude_dirs: Iterable[str], repo_root: str):
+        """
+        Compile the exclude list.
+
+        Args:
+            exclude_dirs: Exclude entries from the configuration
+            repo_root: Normalized repository root for relative paths
+        """
+        literals = []
+        patterns = []
+        for entry in exclude_dirs:
+            (patterns if is_glob_pattern(entry) else literals).append(entry)
+
+        self.index = PathPrefixIndex(
+            _normalize_path(literal, repo_root) for literal in literals
+        )
+        self.matcher = DirectoryPatternMatcher(patterns, repo_root)
+
+    def __bool__(self) -> bool:
+        return bool(self.index) or bool(self.matcher)
+
+    def excludes_dir(self, path: str) -> bool:
+        """
+        Check a directory during a top-down walk whose ancestors were checked.
+
+        Args:
+            path: Normalized absolute directory path
+
+        Returns:
+            True if the directory should not be entered
+        """
+        return self.index.covers(path) or self.matcher.matches(path)
+
+    def excludes(self, path: str) -> bool:
+        """
+        Check an arbitrary directory, including all of its ancestors.
+
+        Args:
+            path: Normalized absolute directory path
+
+        Returns:
+            True if the directory is excluded
+        """
+        return self.index.covers(path) or self.matcher.covers(path)
+
+    def excludes_file(self, path: str) -> bool:
+        """
+        Check whether a file lies in an excluded directory.
+
+        Args:
+            path: Normalized absolute file path
+
+        Returns:
+            True if the file is excluded
+        """
+        return self.index.covers(path) or self.matcher.covers(os.path.dirname(path))
+
+
+def _find_pattern_dirs(
+    root: str, matcher: DirectoryPatternMatcher, excluded: DirectoryExcludeFilter
+) -> List[str]:
+    """
+    Walk the repository once and collect the topmost directories matching patterns.
+
+    Excluded subtrees and the contents of matching directories are not entered.
+
+    Args:
+        root: Normalized repository root
+        matcher: Include patterns
+        excluded: Exclude filter
+
+    Returns:
+        Sorted list of matching directories
+    """
+    matches = []
+    for dirpath, dirnames, _ in os.walk(root):
+        kept = []
+        for name in dirnames:
+            path = os.path.join(dirpath, name)
+            if os.path.islink(path) or excluded.excludes_dir(path):
+                continue
+            if matcher.matches(path):
+                matches.append(path)
+            else:
+                kept.append(name)
+        dirnames[:] = kept
+    return sorted(matches)
+
+
+def _resolve_include_dirs(
+    include_dirs: List[str], repo_root: str, excluded: DirectoryExcludeFilter
+) -> List[str]:
+    """
+    Normalize literal include directories and expand include patterns.
+
+    Args:
+        include_dirs: Include entries from the configuration
+        repo_root: Normalized repository root for relative paths
+        excluded: Exclude filter used to prune the pattern walk
+
+    Returns:
+        List of normalized include directories, literals first
+    """
+    literals = [entry for entry in include_dirs if not is_glob_pattern(entry)]
+    patterns = [entry for entry in include_dirs if is_glob_pattern(entry)]
+
+    resolved = [_normalize_path(literal, repo_root) for literal in literals]
+    if patterns:
+        resolved.extend(
+            _find_pattern_dirs(
+                repo_root, DirectoryPatternMatcher(patterns, repo_root), excluded
+            )
+        )
+    return resolved
+
+
 def _validate_path_list(
     paths: List[str], base_path: str, description: str
 ) -> List[str]:
@@ -938,13 +1278,117 @@ def load_directory_config() -> Optional[dict]:
     return None
 
 
-def apply_directory_filters(base_path: str, config: Optional[dict]) -> List[str]:
+# Files searched by load_directory_config, in order of precedence
+CONFIG_FILE_PATHS = ("./.adtconfig.json", "~/.adtconfig.json")
+
+
+class CompiledDirectoryConfig:
+    """
+    A directory configuration with its paths normalized and matchers compiled.
+
+    Build one with get_compiled_directory_config() to share it across all
+    plugins in a run; include roots are resolved on first use and reused.
+    """
+
+    def __init__(self, config: dict):
+        """
+        Compile a loaded configuration.
+
+        Args:
+            config: Configuration dictionary as returned by load_directory_config
+        """
+        self.config = config
+        self.repo_root = _normalize_path(config.get("repoRoot", os.getcwd()))
+        self.include_dirs = config.get("includeDirs", [])
+        self.exclude_dirs = config.get("excludeDirs", [])
+        self.excluded = DirectoryExcludeFilter(self.exclude_dirs, self.repo_root)
+        self._include_paths: Optional[List[str]] = None
+        self._include_roots: Optional[Tuple[List[str], int]] = None
+
+    @classmethod
+    def of(cls, config: Union[dict, "CompiledDirectoryConfig"]) -> "CompiledDirectoryConfig":
+        """Return config unchanged if already compiled, otherwise compile it."""
+        return config if isinstance(config, cls) else cls(config)
+
+    @property
+    def include_paths(self) -> List[str]:
+        """Normalized include directories with patterns expanded."""
+        if self._include_paths is None:
+            self._include_paths = _resolve_include_dirs(
+                self.include_dirs, self.repo_root, self.excluded
+            )
+        return self._include_paths
+
+    @property
+    def include_roots(self) -> Tuple[List[str], int]:
+        """Existing include directories reduced to disjoint roots, and the number dropped."""
+        if self._include_roots is None:
+            self._include_roots = _reduce_to_disjoint_roots(
+                [path for path in self.include_paths if os.path.isdir(path)]
+            )
+        return self._include_roots
+
+
+# Compiled configuration shared by every plugin in this process, keyed by the
+# path and modification time of each configuration file
+_compiled_config_cache: Optional[Tuple[tuple, Optional[CompiledDirectoryConfig]]] = None
+_compiled_config_lock = threading.Lock()
+
+
+def _config_cache_key() -> tuple:
+    """Identify the current state of the configuration files on disk."""
+    key = []
+    for config_path in CONFIG_FILE_PATHS:
+        path = os.path.abspath(os.path.expanduser(config_path))
+        try:
+            stat_result = os.stat(path)
+            key.append((path, stat_result.st_mtime_ns, stat_result.st_size))
+        except OSError:
+            key.append((path, None, None))
+    return tuple(key)
+
+
+def get_compiled_directory_config() -> Optional[CompiledDirectoryConfig]:
+    """
+    Load and compile the directory configuration, reusing it while unchanged.
+
+    The cached object is rebuilt when a configuration file is created,
+    removed or modified, or when the working directory changes.
+
+    Returns:
+        CompiledDirectoryConfig if a configuration was found, None otherwise
+    """
+    global _compiled_config_cache
+
+    key = _config_cache_key()
+    with _compiled_config_lock:
+        if _compiled_config_cache is not None and _compiled_config_cache[0] == key:
+            logger.debug("Using cached directory configuration")
+            return _compiled_config_cache[1]
+
+        config = load_directory_config()
+        compiled = CompiledDirectoryConfig(config) if config else None
+        _compiled_config_cache = (key, compiled)
+        return compiled
+
+
+def clear_directory_config_cache() -> None:
+    """Discard the cached compiled directory configuration."""
+    global _compiled_config_cache
+
+    with _compiled_config_lock:
+        _compiled_config_cache = None
+
+
+def apply_directory_filters(
+    base_path: str, config: Union[dict, "CompiledDirectoryConfig", None]
+) -> List[str]:
     """
     Apply directory filters based on configuration.
 
     Args:
         base_path: The base directory path to filter
-        config: Directory configuration
+        config: Directory configuration, raw or compiled
 
     Returns:
         List of filtered directory paths
@@ -956,35 +1400,27 @@ def apply_directory_filters(base_path: str, config: Optional[dict]) -> List[str]
         return [base_path]
 
     try:
-        repo_root = config.get("repoRoot", os.getcwd())
-        include_dirs = config.get("includeDirs", [])
-        exclude_dirs = config.get("excludeDirs", [])
+        compiled = CompiledDirectoryConfig.of(config)
 
         # Normalize paths
         normalized_base = _normalize_path(base_path)
-        normalized_repo = _normalize_path(repo_root)
 
         logger.debug(
-            f"Filtering: base={normalized_base}, repo={normalized_repo}, "
-            f"includes={len(include_dirs)}, excludes={len(exclude_dirs)}"
+            f"Filtering: base={normalized_base}, repo={compiled.repo_root}, "
+            f"includes={len(compiled.include_dirs)}, "
+            f"excludes={len(compiled.exclude_dirs)}"
         )
 
         # Check if base_path is excluded
-        for exclude_dir in exclude_dirs:
-            exclude_path = _normalize_path(exclude_dir, normalized_repo)
-
-            if _is_path_under_directory(normalized_base, exclude_path):
-                logger.warning(
-                    f"Directory {normalized_base} is excluded by configuration"
-                )
-                # Still return the path since there's no alternative
-                return [normalized_base]
+        if compiled.excluded.excludes(normalized_base):
+            logger.warning(f"Directory {normalized_base} is excluded by configuration")
+            # Still return the path since there's no alternative
+            return [normalized_base]
 
         # If include dirs are specified, filter based on them
-        if include_dirs:
+        if compiled.include_dirs:
             filtered_dirs = []
-            for include_dir in include_dirs:
-                include_path = _normalize_path(include_dir, normalized_repo)
+            for include_path in compiled.include_paths:
 
                 # Check if base_path is in or under an included directory
                 if _is_path_under_directory(
@@ -1007,9 +1443,69 @@ def apply_directory_filters(base_path: str, config: Optional[dict]) -> List[str]
         return [_normalize_path(base_path)]
 
 
+def _reduce_to_disjoint_roots(directories: List[str]) -> Tuple[List[str], int]:
+    """
+    Drop directories that are duplicates of, or nested inside, another one.
+
+    Directories are compared by real path so symlinked aliases collapse too.
+
+    Args:
+        directories: Normalized directory paths, in configuration order
+
+    Returns:
+        Tuple of (disjoint directories in configuration order, number dropped)
+    """
+    real_paths = [os.path.realpath(directory) for directory in directories]
+
+    # Visit shallower directories first so parents win over their children
+    order = sorted(
+        range(len(directories)),
+        key=lambda i: (len(_path_components(real_paths[i])), i),
+    )
+    index = PathPrefixIndex()
+    kept = set()
+    for i in order:
+        if not index.covers(real_paths[i]):
+            index.add(real_paths[i])
+            kept.add(i)
+
+    roots = [directory for i, directory in enumerate(directories) if i in kept]
+    return roots, len(directories) - len(roots)
+
+
+def _deduplicate_files(file_paths: List[str]) -> List[str]:
+    """
+    Remove files that were found more than once, keeping the first occurrence.
+
+    Files are identified by device and inode, falling back to the real path
+    when the file cannot be examined.
+
+    Args:
+        file_paths: Discovered file paths
+
+    Returns:
+        File paths with duplicates removed
+    """
+    seen = set()
+    unique = []
+    for file_path in file_paths:
+        try:
+            stat_result = os.stat(file_path)
+            key = (stat_result.st_dev, stat_result.st_ino)
+        except OSError:
+            key = os.path.realpath(file_path)
+        if key not in seen:
+            seen.add(key)
+            unique.append(file_path)
+
+    if len(unique) != len(file_paths):
+        logger.debug(f"Removed {len(file_paths) - len(unique)} duplicate files")
+    return unique
+
+
 def get_filtered_adoc_files(
     directory_path: str,
-    config: Optional[dict],
+    config: Union[dict, "CompiledDirectoryConfig", None],
     find_adoc_files_func: Optional[callable] = None,
 ) -> List[str]:
     """
@@ -1017,7 +1513,7 @@ def get_filtered_adoc_files(
 
     Args:
         directory_path: The directory to search
-        config: Directory configuration
+        config: Directory configuration, raw or compiled
         find_adoc_files_func: Function to find adoc files (optional)
 
     Returns:
@@ -1025,9 +1521,9 @@ def get_filtered_adoc_files(
     """
     logger.debug(f"Getting filtered adoc files from {directory_path}")
 
-    if find_adoc_files_func is None:
-        from ..file_utils import find_adoc_files
+    from ..file_utils import find_adoc_files
 
+    if find_adoc_files_func is None:
         find_adoc_files_func = find_adoc_files
 
     if not config:
@@ -1035,55 +1531,62 @@ def get_filtered_adoc_files(
         return find_adoc_files_func(directory_path, recursive=True)
 
     try:
-        repo_root = config.get("repoRoot", os.getcwd())
-        include_dirs = config.get("includeDirs", [])
-        exclude_dirs = config.get("excludeDirs", [])
-
-        normalized_repo = _normalize_path(repo_root)
+        compiled = CompiledDirectoryConfig.of(config)
+        excluded = compiled.excluded
 
         logger.debug(
-            f"Filtering files: repo={normalized_repo}, "
-            f"includes={len(include_dirs)}, excludes={len(exclude_dirs)}"
+            f"Filtering files: repo={compiled.repo_root}, "
+            f"includes={len(compiled.include_dirs)}, "
+            f"excludes={len(compiled.exclude_dirs)}"
         )
 
+        # The default finder can prune excluded subtrees during the walk;
+        # results from a custom finder are filtered afterwards
+        prune = find_adoc_files_func is find_adoc_files
+
+        def find_files(root: str) -> List[str]:
+            if prune and excluded:
+                if excluded.excludes(_normalize_path(root)):
+                    return []
+                return find_adoc_files_func(
+                    root,
+                    recursive=True,
+                    skip_dir=lambda path: excluded.excludes_dir(os.path.abspath(path)),
+                )
+            return find_adoc_files_func(root, recursive=True)
+
         all_files = []
 
         # If include dirs are specified, only process those
-        if include_dirs:
-            for include_dir in include_dirs:
-                include_path = _normalize_path(include_dir, normalized_repo)
-
-                if os.path.exists(include_path) and os.path.isdir(include_path):
-                    files = find_adoc_files_func(include_path, recursive=True)
-                    all_files.extend(files)
-                    logger.debug(
-                        f"Found {len(files)} files in include directory {include_path}"
-                    )
+        if compiled.include_dirs:
+            roots, skipped = compiled.include_roots
+            if skipped:
+                logger.info(
+                    f"Skipped {skipped} redundant include director"
+                    f"{'y' if skipped == 1 else 'ies'} already covered by another"
+                )
+
+            for include_path in roots:
+                files = find_files(include_path)
+                all_files.extend(files)
+                logger.debug(
+                    f"Found {len(files)} files in include directory {include_path}"
+                )
+
+            if len(roots) > 1:
+                all_files = _deduplicate_files(all_files)
         else:
             # Process all files in the directory path
-            all_files = find_adoc_files_func(directory_path, recursive=True)
+            all_files = find_files(directory_path)
             logger.debug(f"Found {len(all_files)} files in directory {directory_path}")
 
         # Filter out excluded directories
-        if exclude_dirs:
-            filtered_files = []
-            for file_path in all_files:
-                excluded = False
-                normalized_file = _normalize_path(file_path)
-
-                for exclude_dir in exclude_dirs:
-                    exclude_path = _normalize_path(exclude_dir, normalized_repo)
-
-                    if _is_path_under_directory(normalized_file, exclude_path):
-                        excluded = True
-                        logger.debug(
-                            f"File {file_path} excluded by directory {exclude_dir}"
-                        )
-                        break
-
-                if not excluded:
-                    filtered_files.append(file_path)
-
+        if excluded and not prune:
+            filtered_files = [
+                file_path
+                for file_path in all_files
+                if not excluded.excludes_file(_normalize_path(file_path))
+            ]
             logger.debug(f"Exclusion filtering resulted in {len(filtered_files)} files")
             return filtered_files
 
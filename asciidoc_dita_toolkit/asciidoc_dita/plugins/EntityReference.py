@@ -10,17 +10,21 @@ See:
 
 __description__ = "Replace unsupported HTML character entity references in .adoc files with AsciiDoc attribute references."
 
+import codecs
+import os
 import re
+import shutil
 import sys
+import tempfile
+from collections import Counter
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
-from ..file_utils import (
-    common_arg_parser,
-    process_adoc_files,
-    read_text_preserve_endings,
-    write_text_preserve_endings,
-)
+from ..cli_utils import add_prefetch_argument, common_arg_parser
+from ..file_utils import contains_any, read_bytes
+from ..io_pipeline import PipelineWriteError, pipelined_write
+from ..profiling import count_bytes, profile_phase, profiled
+from ..workflow_utils import process_adoc_files
 
 # Try to import ADTModule for the new pattern
 try:
@@ -83,6 +87,28 @@ ENTITY_TO_ASCIIDOC = {
 
 ENTITY_PATTERN = re.compile(r"&([a-zA-Z0-9]+);")
 
+# A line whose stripped text starts with "//": either a single-line comment or
+# a "////" block comment delimiter. Lines may end in \n, \r\n or a bare \r.
+COMMENT_LINE_PATTERN = re.compile(r"(?:\A|(?<=[\r\n]))[^\S\r\n]*//[^\r\n]*")
+
+# Every entity reference contains this byte; files without it are skipped
+# before they are decoded
+PREFILTER = (b"&",)
+
+# Files larger than this are processed in streaming mode with bounded memory
+STREAM_THRESHOLD = 64 * 1024 * 1024
+
+# Size of the chunks read in streaming mode
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Translation table used by the whole-buffer engine: only entities that are
+# actually rewritten (supported XML entities such as "quot" are left alone)
+ENTITY_REPLACEMENTS = {
+    entity: replacement
+    for entity, replacement in ENTITY_TO_ASCIIDOC.items()
+    if entity not in SUPPORTED_ENTITIES
+}
+
 
 class EntityReferenceModule(ADTModule):
     """
@@ -124,18 +150,25 @@ class EntityReferenceModule(ADTModule):
         self.cache_size = config.get("cache_size", 1000)
         self.verbose = config.get("verbose", False)
         self.skip_comments = config.get("skip_comments", True)
+        self.stream_threshold = config.get("stream_threshold", STREAM_THRESHOLD)
+        self.prefetch = config.get("prefetch") or 0  # I/O threads, 0 for none
 
         # Initialize statistics
         self.files_processed = 0
+        self.files_skipped = 0
         self.entities_replaced = 0
         self.warnings_generated = 0
+        self.write_errors: List[str] = []
 
         if self.verbose:
             print(f"Initialized EntityReference v{self.version}")
             print(f"  Timeout: {self.timeout_seconds}s")
             print(f"  Cache size: {self.cache_size}")
             print(f"  Skip comments: {self.skip_comments}")
+            if self.prefetch:
+                print(f"  Prefetch threads: {self.prefetch}")
 
+    @profiled("EntityReference")
     def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute the entity reference replacement.
@@ -163,22 +196,37 @@ class EntityReferenceModule(ADTModule):
 
             # Reset statistics
             self.files_processed = 0
+            self.files_skipped = 0
             self.entities_replaced = 0
             self.warnings_generated = 0
+            self.write_errors = []
 
             # Process files using the existing logic
-            process_adoc_files(args, self._process_file_wrapper)
-
-            return {
+            try:
+                process_adoc_files(args, self._process_file_wrapper, self.prefetch)
+            except PipelineWriteError as e:
+                # With prefetch, files are written after they were reported
+                self.write_errors = e.errors
+                for error in self.write_errors:
+                    print(f"Error writing {error}")
+
+            result = {
                 "module_name": self.name,
                 "version": self.version,
                 "files_processed": self.files_processed,
+                "files_skipped": self.files_skipped,
                 "entities_replaced": self.entities_replaced,
                 "warnings_generated": self.warnings_generated,
-                "success": True,
+                "write_errors": self.write_errors,
+                "success": not self.write_errors,
                 "supported_entities": list(SUPPORTED_ENTITIES),
                 "entity_mappings": len(ENTITY_TO_ASCIIDOC),
             }
+            if self.write_errors:
+                result["error"] = (
+                    f"{len(self.write_errors)} file(s) could not be written"
+                )
+            return result
 
         except Exception as e:
             error_msg = f"Error in EntityReference module: {e}"
@@ -207,10 +255,14 @@ class EntityReferenceModule(ADTModule):
         original_warnings = self.warnings_generated
 
         # Process the file
-        process_file(filepath, self._entity_replacement_callback)
+        scanned = process_file(
+            filepath, self._entity_replacement_callback, self.stream_threshold
+        )
 
         # Update statistics
         self.files_processed += 1
+        if not scanned:
+            self.files_skipped += 1
 
         if self.verbose:
             entities_in_file = self.entities_replaced - original_entities
@@ -236,6 +288,7 @@ class EntityReferenceModule(ADTModule):
         if self.verbose:
             print(f"EntityReference cleanup complete")
             print(f"  Total files processed: {self.files_processed}")
+            print(f"  Files skipped by prefilter: {self.files_skipped}")
             print(f"  Total entities replaced: {self.entities_replaced}")
             print(f"  Total warnings generated: {self.warnings_generated}")
 
@@ -271,39 +324,249 @@ def replace_entities(line, callback=None):
     return ENTITY_PATTERN.sub(repl, line)
 
 
-def process_file(filepath, callback=None):
+def replace_entities_in_text(
+    text: str, callback=None, unknown: Optional[Counter] = None
+) -> str:
+    """
+    Replace entity references in a whole buffer with a single substitution.
+
+    Unlike replace_entities, unknown entities are not printed one by one;
+    they are counted in ``unknown`` so the caller can report them once.
+
+    Args:
+        text: Text to process, may span many lines
+        callback: Optional callback function for tracking replacements
+        unknown: Optional Counter that collects unknown entity names
+
+    Returns:
+        Text with entity references replaced
+    """
+    if "&" not in text:
+        return text
+
+    replacements = ENTITY_REPLACEMENTS
+
+    def repl(match):
+        entity = match.group(1)
+        replacement = replacements.get(entity)
+        if replacement is not None:
+            if callback:
+                callback(entity, True)
+            return replacement
+        if unknown is not None and entity not in SUPPORTED_ENTITIES:
+            unknown[entity] += 1
+        if callback:
+            callback(entity, False)
+        return match.group(0)
+
+    return ENTITY_PATTERN.sub(repl, text)
+
+
+def format_unknown_entities(unknown: Counter) -> List[str]:
+    """
+    Format aggregated unknown-entity counts as warning lines.
+
+    Args:
+        unknown: Counter of unknown entity names
+
+    Returns:
+        One warning line per entity, most frequent first
+    """
+    warnings = []
+    for entity, count in sorted(unknown.items(), key=lambda item: (-item[1], item[0])):
+        suffix = "" if count == 1 else f" ({count} occurrences)"
+        warnings.append(f"Warning: No AsciiDoc attribute for &{entity};{suffix}")
+    return warnings
+
+
+def find_comment_spans(
+    text: str, in_block_comment: bool = False
+) -> Tuple[List[Tuple[int, int]], bool]:
+    """
+    Find single-line (//) and block (////) comment regions in a buffer.
+
+    Args:
+        text: Text to scan, made of complete lines
+        in_block_comment: Whether the text starts inside a block comment
+
+    Returns:
+        Tuple of (list of (start, end) spans to leave untouched, whether the
+        text ends inside a block comment)
+    """
+    spans = []
+    block_start = 0 if in_block_comment else None
+
+    for match in COMMENT_LINE_PATTERN.finditer(text):
+        if match.group(0).strip() == "////":
+            if block_start is None:
+                block_start = match.start()
+            else:
+                spans.append((block_start, match.end()))
+                block_start = None
+        elif block_start is None:
+            spans.append(match.span())
+
+    if block_start is not None:
+        # Unterminated block comment runs to the end of the text
+        spans.append((block_start, len(text)))
+
+    return spans, block_start is not None
+
+
+def replace_outside_comments(
+    text: str,
+    callback=None,
+    unknown: Optional[Counter] = None,
+    in_block_comment: bool = False,
+) -> Tuple[str, bool]:
+    """
+    Replace entity references everywhere except inside comments.
+
+    Args:
+        text: Text to process, made of complete lines
+        callback: Optional callback function for tracking replacements
+        unknown: Optional Counter that collects unknown entity names
+        in_block_comment: Whether the text starts inside a block comment
+
+    Returns:
+        Tuple of (processed text, whether the text ends inside a block comment)
+    """
+    if "&" not in text:
+        # Nothing to replace, but block comment state still has to be tracked
+        if "////" not in text:
+            return text, in_block_comment
+        return text, find_comment_spans(text, in_block_comment)[1]
+
+    spans, in_block_comment = find_comment_spans(text, in_block_comment)
+
+    pieces = []
+    position = 0
+    for start, end in spans:
+        pieces.append(replace_entities_in_text(text[position:start], callback, unknown))
+        pieces.append(text[start:end])
+        position = end
+    pieces.append(replace_entities_in_text(text[position:], callback, unknown))
+
+    return "".join(pieces), in_block_comment
+
+
+def _split_complete_lines(text: str) -> Tuple[str, str]:
+    """
+    Split text into its complete lines and a trailing partial line.
+
+    A trailing bare CR is held back because the next chunk may start with
+    the LF that completes a CRLF ending.
+    """
+    cut = max(text.rfind("\n"), text.rfind("\r", 0, len(text) - 1)) + 1
+    return text[:cut], text[cut:]
+
+
+def process_file_streaming(filepath, callback=None, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Process a large .adoc file in fixed-size chunks with bounded memory.
+
+    Only complete lines are processed; the partial last line of each chunk
+    and the block comment state are carried into the next chunk. Output is
+    written to a temporary file in the same directory, which replaces the
+    original only if something changed.
+
+    Args:
+        filepath: Path to the file to process
+        callback: Optional callback function for tracking replacements
+        chunk_size: Number of bytes to read at a time
+
+    Returns:
+        Counter of unknown entity names found in the file
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    unknown = Counter()
+    in_block_comment = False
+    carry = ""
+    changed = False
+
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with open(filepath, "rb") as src, os.fdopen(fd, "wb") as dst:
+            while True:
+                chunk = src.read(chunk_size)
+                final = not chunk
+                text = carry + decoder.decode(chunk, final=final)
+                if final:
+                    complete, carry = text, ""
+                else:
+                    complete, carry = _split_complete_lines(text)
+
+                if complete:
+                    new_text, in_block_comment = replace_outside_comments(
+                        complete, callback, unknown, in_block_comment
+                    )
+                    changed = changed or new_text != complete
+                    dst.write(new_text.encode("utf-8"))
+
+                if final:
+                    break
+
+        if changed:
+            shutil.copymode(filepath, temp_path)
+            os.replace(temp_path, filepath)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    return unknown
+
+
+def process_file(filepath, callback=None, stream_threshold=STREAM_THRESHOLD):
     """
     Process a single .adoc file, replacing entity references.
     Skip entities within comments (single-line // and block comments ////).
 
+    Files larger than stream_threshold bytes are processed in streaming mode.
+    Other files without an "&" are skipped without being decoded.
+
     Args:
         filepath: Path to the file to process
         callback: Optional callback function for tracking replacements
+        stream_threshold: Size in bytes above which the file is streamed
+
+    Returns:
+        False if the file was skipped by the prefilter, True otherwise
     """
+    scanned = True
     try:
-        lines = read_text_preserve_endings(filepath)
-        new_lines = []
-        in_block_comment = False
-
-        for text, ending in lines:
-            stripped = text.strip()
-
-            # Check for block comment delimiters
-            if stripped == "////":
-                in_block_comment = not in_block_comment
-                new_lines.append((text, ending))
-                continue
-
-            # Skip processing if we're in a block comment or it's a single-line comment
-            if in_block_comment or stripped.startswith("//"):
-                new_lines.append((text, ending))
-            else:
-                new_lines.append((replace_entities(text, callback), ending))
+        if os.path.getsize(filepath) > stream_threshold:
+            unknown = process_file_streaming(filepath, callback)
+        else:
+            data = read_bytes(filepath)
+            scanned = contains_any(data, PREFILTER)
+            if not scanned:
+                print(f"Skipped {filepath} (no entity references)")
+                return scanned
+            content = data.decode("utf-8")
+
+            unknown = Counter()
+            new_content, _ = replace_outside_comments(content, callback, unknown)
+
+            if new_content != content:
+                data = new_content.encode("utf-8")
+                if not pipelined_write(filepath, _write_file, filepath, data):
+                    _write_file(filepath, data)
+
+        for warning in format_unknown_entities(unknown):
+            print(warning)
 
-        write_text_preserve_endings(filepath, new_lines)
         print(f"Processed {filepath} (preserved per-line endings)")
     except Exception as e:
         print(f"Error processing {filepath}: {e}")
+    return scanned
+
+
+def _write_file(filepath, data):
+    with profile_phase("write"):
+        with open(filepath, "wb") as f:
+            f.write(data)
+    count_bytes("write", len(data))
 
 
 def main(args):
@@ -318,6 +581,7 @@ def main(args):
             "timeout_seconds": 30,
             "cache_size": 1000,
             "skip_comments": True,
+            "prefetch": getattr(args, "prefetch", None),
         }
         module.initialize(config)
 
@@ -334,14 +598,22 @@ def main(args):
         # Cleanup
         module.cleanup()
 
+        if result.get("write_errors"):
+            sys.exit(1)
         return result
     else:
         # Fallback to legacy implementation
         process_adoc_files(args, process_file)
 
 
+def add_arguments(parser):
+    """Add EntityReference-specific options to a subcommand parser."""
+    add_prefetch_argument(parser)
+
+
 def register_subcommand(subparsers):
     """Register this plugin as a subcommand."""
     parser = subparsers.add_parser("EntityReference", help=__description__)
     common_arg_parser(parser)
+    add_arguments(parser)
     parser.set_defaults(func=main)
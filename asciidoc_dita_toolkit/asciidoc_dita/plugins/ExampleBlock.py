@@ -14,7 +14,9 @@ from pathlib import Path
 from typing import Optional, List, Dict, Any, Tuple
 
 from ..cli_utils import common_arg_parser
+from ..file_utils import contains_any, read_bytes
 from ..plugin_manager import is_plugin_enabled
+from ..profiling import count_bytes, profile_phase
 from ..workflow_utils import process_adoc_files
 
 # Try to import ADTModule for the new pattern
@@ -38,6 +40,10 @@ except ImportError:
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Every example block delimiter or style marker contains one of these; files
+# with neither are skipped before they are decoded
+PREFILTER = (b"====", b"[example]")
+
 
 class ExampleBlockDetector:
     """
@@ -334,6 +340,7 @@ class ExampleBlockProcessor:
         self.detector = detector
         self.interactive = interactive
         self.quiet_mode = quiet_mode
+        self.files_skipped = 0
         self.comment_template = """//
 // ADT ExampleBlock: Move this example block to the main body of the topic 
 // (before the first section header) for DITA 1.3 compliance.
@@ -655,17 +662,25 @@ def process_example_block_file(filepath: str, processor: ExampleBlockProcessor)
             logger.warning(f"File not found: {filepath}")
             return False
 
-        # Read the file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Files without a delimiter or style marker have no example blocks
+        data = read_bytes(filepath)
+        if not contains_any(data, PREFILTER):
+            processor.files_skipped += 1
+            return True
+
+        # Decode with the newline translation of a text-mode read
+        content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
 
         # Process the content
         modified_content, issues = processor.process_content(content)
 
         # Write back if changed
         if modified_content != content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(modified_content)
+            with profile_phase("write"):
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.write(modified_content)
+                    size = f.tell()
+            count_bytes("write", size)
 
             if issues:
                 print(f"Fixed example block issues in {filepath}:")
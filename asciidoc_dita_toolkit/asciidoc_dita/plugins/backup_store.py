@@ -0,0 +1,330 @@
+"""
+Content-addressed backup store used by the ContextMigrator plugin.
+
+Each backed-up file is stored once under its SHA-256 hash, so identical
+content across files or runs is kept only once. Blobs are created with a
+reflink (copy-on-write clone) where the filesystem supports it, and fall
+back to a plain copy otherwise. Every run appends to its own manifest that
+maps original paths to blob hashes; rollback replays the most recent
+manifest that still differs from the files and rewrites only the files
+whose content differs.
+
+Blobs are never hard links: a hard-linked blob would share an inode with
+the original file, and any tool that later rewrites the file in place
+would silently change the backup too.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import stat
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from ..file_utils import write_bytes_atomic
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+
+logger = logging.getLogger(__name__)
+
+# ioctl request that clones a file's extents on Linux (btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+OBJECTS_DIR = "objects"
+MANIFESTS_DIR = "manifests"
+MANIFEST_SUFFIX = ".jsonl"
+
+
+@dataclass
+class BackupEntry:
+    """A single manifest record: the original file and the blob holding its content."""
+
+    path: str
+    blob: str
+    mode: int
+
+
+@dataclass
+class RestoreResult:
+    """Outcome of replaying a backup manifest."""
+
+    manifest: str
+    restored: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+
+def file_digest(filepath: str) -> Optional[str]:
+    """Return the SHA-256 of a file's content, or None if it does not exist."""
+    try:
+        with open(filepath, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def _reflink(src: str, dst: str) -> bool:
+    """Clone src to dst with copy-on-write, returning False if unsupported."""
+    if fcntl is None:
+        return False
+    try:
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        return True
+    except OSError:
+        if os.path.exists(dst):
+            os.remove(dst)
+        return False
+
+
+class BackupStore:
+    """
+    Deduplicating backup store with per-run manifests.
+
+    Layout under the root directory:
+        objects/ab/cdef...      blob content, named by SHA-256 hash
+        manifests/<run>.jsonl   one BackupEntry per line, in backup order
+    """
+
+    def __init__(self, root: str, use_reflinks: bool = True):
+        self.root = os.path.abspath(root)
+        self.use_reflinks = use_reflinks
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        self.stats: Dict[str, int] = {
+            "reflinked": 0,
+            "copied": 0,
+            "deduplicated": 0,
+        }
+        self._recorded: set = set()
+        self._manifest_file = None
+
+    @property
+    def manifest_path(self) -> str:
+        """Path of the manifest written by this run."""
+        return os.path.join(self.root, MANIFESTS_DIR, self.run_id + MANIFEST_SUFFIX)
+
+    def blob_path(self, digest: str) -> str:
+        """Return where the blob for a content hash is stored."""
+        return os.path.join(self.root, OBJECTS_DIR, digest[:2], digest[2:])
+
+    def backup(
+        self,
+        filepath: str,
+        data: Optional[bytes] = None,
+        digest: Optional[str] = None,
+    ) -> str:
+        """
+        Back up a file and record it in this run's manifest.
+
+        Args:
+            filepath: Path to the file to back up
+            data: File content already read by the caller, if any
+            digest: SHA-256 of data, if the caller already computed it
+
+        Returns:
+            Path to the blob holding the file content
+        """
+        path = os.path.abspath(filepath)
+        if data is None:
+            with open(path, "rb") as f:
+                data = f.read()
+            digest = None
+        if digest is None:
+            digest = hashlib.sha256(data).hexdigest()
+        blob = self.blob_path(digest)
+
+        if os.path.exists(blob):
+            self.stats["deduplicated"] += 1
+        else:
+            self._store_blob(path, blob, data)
+
+        if path not in self._recorded:
+            # Only the first backup of a file in a run is its original state
+            self._recorded.add(path)
+            entry = BackupEntry(path, digest, stat.S_IMODE(os.stat(path).st_mode))
+            self._append(entry)
+
+        logger.debug("Backed up %s -> %s", path, blob)
+        return blob
+
+    def _store_blob(self, path: str, blob: str, data: bytes) -> None:
+        """Create a blob, preferring a reflink and falling back to a copy."""
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        temp_blob = f"{blob}.{os.getpid()}.tmp"
+
+        # data may have been read earlier by the caller, so a clone of a file
+        # that has since changed size is replaced by a copy of data
+        if (
+            self.use_reflinks
+            and _reflink(path, temp_blob)
+            and os.path.getsize(temp_blob) == len(data)
+        ):
+            self.stats["reflinked"] += 1
+        else:
+            with open(temp_blob, "wb") as f:
+                f.write(data)
+            self.stats["copied"] += 1
+
+        os.replace(temp_blob, blob)
+
+    def _append(self, entry: BackupEntry) -> None:
+        """Append an entry to this run's manifest, creating it on first use."""
+        if self._manifest_file is None:
+            os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+            self._manifest_file = open(self.manifest_path, "a", encoding="utf-8")
+        self._manifest_file.write(
+            json.dumps({"path": entry.path, "blob": entry.blob, "mode": entry.mode})
+            + "\n"
+        )
+        self._manifest_file.flush()
+
+    def close(self) -> None:
+        """Close this run's manifest."""
+        if self._manifest_file is not None:
+            self._manifest_file.close()
+            self._manifest_file = None
+
+    def list_manifests(self) -> List[str]:
+        """Return all manifests in the store, oldest first."""
+        directory = os.path.join(self.root, MANIFESTS_DIR)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(
+            os.path.join(directory, name)
+            for name in os.listdir(directory)
+            if name.endswith(MANIFEST_SUFFIX)
+        )
+
+    def load_manifest(self, manifest_path: str) -> List[BackupEntry]:
+        """
+        Read the entries of a manifest.
+
+        Args:
+            manifest_path: Path to the manifest file
+
+        Returns:
+            List of BackupEntry objects in backup order
+        """
+        entries = []
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    entries.append(
+                        BackupEntry(record["path"], record["blob"], record["mode"])
+                    )
+        return entries
+
+    def restore(self, manifest_path: Optional[str] = None) -> RestoreResult:
+        """
+        Roll files back to the state recorded in a manifest.
+
+        Files whose current content already matches the backup are left
+        untouched; the others are replaced from the blob, which is verified
+        against its hash first.
+
+        Args:
+            manifest_path: Manifest to replay (default: latest_manifest())
+
+        Returns:
+            RestoreResult listing restored, unchanged and failed files
+        """
+        if manifest_path is None:
+            manifest_path = self.latest_manifest()
+
+        return self.restore_entries(self.load_manifest(manifest_path), manifest_path)
+
+    def latest_manifest(self) -> str:
+        """
+        Return the most recent manifest with a file that no longer matches it.
+
+        A run that changed nothing, such as a re-run over migrated files,
+        records the files as they already are; replaying it would restore
+        nothing, so such manifests are passed over. If every manifest
+        matches, the most recent one is returned.
+
+        Returns:
+            Path to the manifest to replay
+        """
+        manifests = self.list_manifests()
+        if not manifests:
+            raise FileNotFoundError(f"No backup manifests found in {self.root}")
+
+        for manifest_path in reversed(manifests):
+            entries = self.load_manifest(manifest_path)
+            if any(file_digest(entry.path) != entry.blob for entry in entries):
+                return manifest_path
+        return manifests[-1]
+
+    def restore_entries(self, entries: List[BackupEntry], source: str) -> RestoreResult:
+        """
+        Restore a set of manifest entries from their blobs.
+
+        Args:
+            entries: Entries to restore
+            source: Manifest or journal the entries came from, for reporting
+
+        Returns:
+            RestoreResult listing restored, unchanged and failed files
+        """
+        self.close()
+        result = RestoreResult(manifest=source)
+
+        for entry in entries:
+            try:
+                with open(self.blob_path(entry.blob), "rb") as f:
+                    data = f.read()
+                if hashlib.sha256(data).hexdigest() != entry.blob:
+                    raise ValueError("backup blob content does not match its hash")
+
+                try:
+                    with open(entry.path, "rb") as f:
+                        current = f.read()
+                except FileNotFoundError:
+                    current = None
+
+                if current == data:
+                    result.unchanged.append(entry.path)
+                    continue
+
+                write_bytes_atomic(entry.path, data)
+                os.chmod(entry.path, entry.mode)
+                result.restored.append(entry.path)
+
+            except (OSError, ValueError) as e:
+                result.errors.append(f"{entry.path}: {e}")
+
+        return result
+
+
+def format_restore_report(result: RestoreResult) -> str:
+    """
+    Format a rollback result as a short human-readable report.
+
+    Args:
+        result: RestoreResult to format
+
+    Returns:
+        Formatted text report
+    """
+    lines = [
+        "=== Context Migration Rollback ===",
+        f"Manifest: {result.manifest}",
+        f"Files restored: {len(result.restored)}",
+        f"Files already unchanged: {len(result.unchanged)}",
+        f"Errors: {len(result.errors)}",
+    ]
+    for error in result.errors:
+        lines.append(f"  Error: {error}")
+    return "\n".join(lines)
+
+
+def register_subcommand(subparsers):
+    """This module doesn't register as a subcommand - it's a helper module."""
+    pass
@@ -0,0 +1,387 @@
+"""
+Non-interactive batch engine for the ContentType plugin.
+
+This module tags many files at once without per-file console output.
+Detection runs in a process pool, the resulting rewrites are collected and
+written together, and a single summary is produced at the end.
+
+The same engine also produces a dry-run classification report (CSV or
+JSON Lines) that records what the detector would suggest for each file.
+"""
+
+import csv
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field, fields
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from .content_type_detector import ContentTypeConfig, ContentTypeDetector
+from .content_type_processor import ContentTypeProcessor
+from .ui_interface import BatchUI
+
+
+logger = logging.getLogger(__name__)
+
+# Below this many files, starting a process pool costs more than it saves
+MIN_FILES_FOR_POOL = 32
+
+# Processor used by the current worker process, built once by _init_worker
+_worker_processor: Optional[ContentTypeProcessor] = None
+
+
+@dataclass
+class BatchFileResult:
+    """Planned outcome for a single file in a batch run."""
+
+    filepath: str
+    content_type: Optional[str]
+    reason: str  # 'existing', 'converted', 'filename', 'content', 'title', 'default', 'empty', 'error'
+    lines: Optional[List[Tuple[str, str]]] = None  # New content, None if unchanged
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchSummary:
+    """Aggregated result of a batch run."""
+
+    files_processed: int = 0
+    files_changed: int = 0
+    attributes_added: int = 0
+    attributes_updated: int = 0
+    by_type: Dict[str, int] = field(default_factory=dict)
+    by_reason: Dict[str, int] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+    write_errors: List[str] = field(default_factory=list)  # Failed background writes
+
+
+@dataclass
+class ClassificationRecord:
+    """Dry-run classification of a single file."""
+
+    filepath: str
+    existing_type: Optional[str]
+    suggested_type: Optional[str]
+    confidence: float
+    source: Optional[str]  # 'filename', 'content', 'title' or None
+    reason: str
+    read_ms: float
+    detect_ms: float
+    error: Optional[str] = None
+
+
+@dataclass
+class ReportSummary:
+    """Totals for a classification report run."""
+
+    files_classified: int = 0
+    errors: int = 0
+    wall_seconds: float = 0.0
+    detect_seconds: float = 0.0
+
+
+REPORT_FORMATS = ("csv", "jsonl")
+REPORT_FIELDS = [f.name for f in fields(ClassificationRecord)]
+
+
+def _init_worker(config: ContentTypeConfig) -> None:
+    """Build the detector and processor once per worker process."""
+    global _worker_processor
+    _worker_processor = ContentTypeProcessor(ContentTypeDetector(config), BatchUI())
+
+
+def _plan_file(filepath: str) -> BatchFileResult:
+    """
+    Decide what content type a file gets and compute its new content.
+
+    Mirrors the decisions ContentTypeProcessor makes with a BatchUI, but
+    without UI calls or writing to disk.
+
+    Args:
+        filepath: Path to the file to plan
+
+    Returns:
+        BatchFileResult describing the planned change
+    """
+    processor = _worker_processor
+
+    try:
+        lines = processor.file_reader(filepath)
+    except (OSError, UnicodeDecodeError) as e:
+        return BatchFileResult(filepath, None, "error", error=f"{filepath}: {e}")
+
+    if not lines:
+        return BatchFileResult(filepath, None, "empty")
+
+    original = list(lines)
+    analysis = processor.get_file_analysis(filepath, lines)
+    existing = analysis['existing_attribute']
+    detection = analysis['detection_result']
+
+    if existing and existing.value.strip():
+        content_type = existing.value.strip()
+        reason = "existing" if existing.attribute_type == 'current' else "converted"
+    else:
+        content_type = processor.ui.prompt_content_type(detection)
+        reason = detection.source if detection.suggested_type else "default"
+
+    if existing:
+        lines = processor.update_existing_attribute(lines, existing, content_type)
+    else:
+        lines = processor.add_new_attribute(lines, content_type)
+
+    return BatchFileResult(
+        filepath, content_type, reason, lines if lines != original else None
+    )
+
+
+def _classify_file(filepath: str) -> ClassificationRecord:
+    """
+    Classify a file without changing it, timing the read and detection steps.
+
+    Args:
+        filepath: Path to the file to classify
+
+    Returns:
+        ClassificationRecord for the file
+    """
+    processor = _worker_processor
+
+    start = time.perf_counter()
+    try:
+        lines = processor.file_reader(filepath)
+    except (OSError, UnicodeDecodeError) as e:
+        elapsed = (time.perf_counter() - start) * 1000
+        return ClassificationRecord(
+            filepath, None, None, 0.0, None, "", elapsed, 0.0, error=str(e)
+        )
+    read_done = time.perf_counter()
+
+    analysis = processor.get_file_analysis(filepath, lines)
+    detect_done = time.perf_counter()
+
+    existing = analysis['existing_attribute']
+    detection = analysis['detection_result']
+    return ClassificationRecord(
+        filepath=filepath,
+        existing_type=existing.value.strip() if existing else None,
+        suggested_type=detection.suggested_type,
+        confidence=detection.confidence,
+        source=detection.source,
+        reason="; ".join(detection.reasoning),
+        read_ms=(read_done - start) * 1000,
+        detect_ms=(detect_done - read_done) * 1000,
+    )
+
+
+def _map_files(
+    func: Callable[[str], object],
+    filepaths: List[str],
+    config: ContentTypeConfig,
+    workers: int,
+) -> Iterator:
+    """Apply a worker function to all files, in a process pool for large batches."""
+    if workers <= 1 or len(filepaths) < MIN_FILES_FOR_POOL:
+        _init_worker(config)
+        yield from map(func, filepaths)
+        return
+
+    chunksize = max(1, len(filepaths) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(config,)
+    ) as executor:
+        yield from executor.map(func, filepaths, chunksize=chunksize)
+
+
+def run_content_type_batch(
+    filepaths: Iterable[str],
+    config: Optional[ContentTypeConfig] = None,
+    workers: Optional[int] = None,
+    dry_run: bool = False,
+    prefetch: int = 0,
+) -> BatchSummary:
+    """
+    Assign content types to many files without prompting.
+
+    Args:
+        filepaths: Files to process
+        config: Optional configuration for content type detection
+        workers: Number of worker processes (default: CPU count)
+        dry_run: If True, plan the changes but don't write them
+        prefetch: Number of background writer threads (0 writes directly);
+            files whose background write fails are not counted as changed
+
+    Returns:
+        BatchSummary with counts per content type and per reason
+    """
+    from ..file_utils import write_text_preserve_endings
+    from ..io_pipeline import io_pipeline
+
+    config = config or ContentTypeConfig.get_default()
+    filepaths = list(filepaths)
+    workers = workers or os.cpu_count() or 1
+
+    summary = BatchSummary()
+    rewrites = []
+
+    for result in _map_files(_plan_file, filepaths, config, workers):
+        summary.files_processed += 1
+        summary.by_reason[result.reason] = summary.by_reason.get(result.reason, 0) + 1
+        if result.error:
+            summary.errors.append(result.error)
+            continue
+        if result.content_type:
+            summary.by_type[result.content_type] = (
+                summary.by_type.get(result.content_type, 0) + 1
+            )
+        if result.lines is not None:
+            rewrites.append(result)
+
+    logger.debug("Planned %d rewrites for %d files", len(rewrites), len(filepaths))
+
+    pipeline = io_pipeline(prefetch) if prefetch and not dry_run else nullcontext()
+    written = []
+    with pipeline as active:
+        for result in sorted(rewrites, key=lambda r: r.filepath):
+            if not dry_run:
+                try:
+                    write_text_preserve_endings(result.filepath, result.lines)
+                except OSError as e:
+                    summary.errors.append(f"{result.filepath}: {e}")
+                    continue
+            written.append(result)
+
+    if active is not None:
+        # Background writes have finished; drop the files that failed
+        failed = set(active.failed_paths)
+        written = [result for result in written if result.filepath not in failed]
+        summary.write_errors = list(active.errors)
+        summary.errors.extend(active.errors)
+
+    for result in written:
+        summary.files_changed += 1
+        if result.reason in ("existing", "converted"):
+            summary.attributes_updated += 1
+        else:
+            summary.attributes_added += 1
+
+    return summary
+
+
+def format_batch_summary(summary: BatchSummary) -> str:
+    """
+    Format a batch summary as a short human-readable report.
+
+    Args:
+        summary: BatchSummary to format
+
+    Returns:
+        Formatted text summary
+    """
+
+    def _counts(counts: Dict[str, int]) -> str:
+        if not counts:
+            return "none"
+        ordered = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        return ", ".join(f"{name} {count}" for name, count in ordered)
+
+    lines = [
+        f"ContentType batch: {summary.files_processed} files, "
+        f"{summary.files_changed} changed "
+        f"({summary.attributes_added} added, {summary.attributes_updated} updated), "
+        f"{len(summary.errors)} errors",
+        f"  By type: {_counts(summary.by_type)}",
+        f"  By reason: {_counts(summary.by_reason)}",
+    ]
+    for error in summary.errors:
+        lines.append(f"  Error: {error}")
+
+    return "\n".join(lines)
+
+
+def run_content_type_report(
+    filepaths: Iterable[str],
+    stream: TextIO,
+    report_format: str = "csv",
+    config: Optional[ContentTypeConfig] = None,
+    workers: Optional[int] = None,
+) -> ReportSummary:
+    """
+    Write a dry-run classification report without modifying any file.
+
+    Records are written in input order as soon as they are available, so
+    the report can be streamed for very large trees.
+
+    Args:
+        filepaths: Files to classify
+        stream: Text stream to write the report to
+        report_format: 'csv' or 'jsonl'
+        config: Optional configuration for content type detection
+        workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        ReportSummary with file counts and timings
+    """
+    if report_format not in REPORT_FORMATS:
+        raise ValueError(
+            f"Unsupported report format '{report_format}', "
+            f"expected one of: {', '.join(REPORT_FORMATS)}"
+        )
+
+    config = config or ContentTypeConfig.get_default()
+    filepaths = list(filepaths)
+    workers = workers or os.cpu_count() or 1
+
+    writer = None
+    if report_format == "csv":
+        writer = csv.DictWriter(stream, fieldnames=REPORT_FIELDS)
+        writer.writeheader()
+
+    summary = ReportSummary()
+    start = time.perf_counter()
+
+    for record in _map_files(_classify_file, filepaths, config, workers):
+        summary.files_classified += 1
+        summary.detect_seconds += record.detect_ms / 1000
+        if record.error:
+            summary.errors += 1
+
+        row = asdict(record)
+        row["read_ms"] = round(record.read_ms, 3)
+        row["detect_ms"] = round(record.detect_ms, 3)
+        if writer:
+            writer.writerow(row)
+        else:
+            stream.write(json.dumps(row) + "\n")
+
+    summary.wall_seconds = time.perf_counter() - start
+    return summary
+
+
+def format_report_summary(summary: ReportSummary) -> str:
+    """
+    Format report totals as a one-line throughput summary.
+
+    Args:
+        summary: ReportSummary to format
+
+    Returns:
+        Formatted text summary
+    """
+    rate = (
+        summary.files_classified / summary.wall_seconds if summary.wall_seconds else 0.0
+    )
+    return (
+        f"ContentType report: {summary.files_classified} files classified "
+        f"in {summary.wall_seconds:.2f}s ({rate:.0f} files/s), "
+        f"detection {summary.detect_seconds * 1000:.1f}ms total, "
+        f"{summary.errors} errors"
+    )
+
+
+def register_subcommand(subparsers):
+    """This module doesn't register as a subcommand - it's a helper module."""
+    pass
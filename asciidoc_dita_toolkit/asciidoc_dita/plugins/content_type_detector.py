@@ -85,6 +85,7 @@ class DetectionResult:
     suggested_type: Optional[str]
     confidence: float
     reasoning: List[str]
+    source: Optional[str] = None  # 'filename', 'content' or 'title'
 
 
 class ContentTypeDetector:
@@ -92,6 +93,20 @@ class ContentTypeDetector:
 
     def __init__(self, config: Optional[ContentTypeConfig] = None):
         self.config = config or ContentTypeConfig.get_default()
+
+        # Compile configured patterns once so repeated detection doesn't
+        # depend on the re module's cache
+        self.title_regexes = {
+            content_type: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for content_type, patterns in self.config.title_patterns.items()
+        }
+        self.content_regexes = {
+            content_type: [re.compile(pattern, re.MULTILINE) for pattern in patterns]
+            for content_type, patterns in self.config.content_patterns.items()
+        }
+        self.title_prefix_regex = re.compile(r'^[=# ]+')
+        self.definition_list_regex = re.compile(r'::\s*$', re.MULTILINE)
+
         logger.debug("ContentTypeDetector initialized with config: %s", self.config)
 
     def detect_from_filename(self, filename: str) -> Optional[str]:
@@ -176,15 +191,15 @@ class ContentTypeDetector:
 
         title = title.strip()
         # Remove title prefix (= or #) and clean up
-        title = re.sub(r'^[=# ]+', '', title).strip()
+        title = self.title_prefix_regex.sub('', title).strip()
 
         reasoning = []
 
-        for content_type, patterns in self.config.title_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, title, re.IGNORECASE):
+        for content_type, regexes in self.title_regexes.items():
+            for regex in regexes:
+                if regex.search(title):
                     reasoning.append(
-                        f"Title matches {content_type.lower()} pattern: {pattern}"
+                        f"Title matches {content_type.lower()} pattern: {regex.pattern}"
                     )
                     logger.debug("Title suggests content type: %s", content_type)
                     return DetectionResult(content_type, 0.8, reasoning)
@@ -209,35 +224,35 @@ class ContentTypeDetector:
         reasoning = []
 
         # Check assembly indicators first (most specific)
-        assembly_patterns = self.config.content_patterns.get("ASSEMBLY", [])
-        for pattern in assembly_patterns:
-            if re.search(pattern, content, re.MULTILINE):
-                reasoning.append(f"Found assembly pattern: {pattern}")
+        assembly_regexes = self.content_regexes.get("ASSEMBLY", [])
+        for regex in assembly_regexes:
+            if regex.search(content):
+                reasoning.append(f"Found assembly pattern: {regex.pattern}")
                 logger.debug("Content suggests ASSEMBLY type")
                 return DetectionResult("ASSEMBLY", 0.9, reasoning)
 
         # Check procedure indicators
-        procedure_patterns = self.config.content_patterns.get("PROCEDURE", [])
+        procedure_regexes = self.content_regexes.get("PROCEDURE", [])
         procedure_matches = 0
-        for pattern in procedure_patterns:
-            if re.search(pattern, content, re.MULTILINE):
+        for regex in procedure_regexes:
+            if regex.search(content):
                 procedure_matches += 1
-                reasoning.append(f"Found procedure pattern: {pattern}")
+                reasoning.append(f"Found procedure pattern: {regex.pattern}")
 
         if procedure_matches >= 2:  # Multiple procedure indicators
             logger.debug("Content suggests PROCEDURE type")
             return DetectionResult("PROCEDURE", 0.8, reasoning)
 
         # Check reference indicators
-        reference_patterns = self.config.content_patterns.get("REFERENCE", [])
+        reference_regexes = self.content_regexes.get("REFERENCE", [])
         reference_matches = 0
-        for pattern in reference_patterns:
-            if re.search(pattern, content, re.MULTILINE):
+        for regex in reference_regexes:
+            if regex.search(content):
                 reference_matches += 1
-                reasoning.append(f"Found reference pattern: {pattern}")
+                reasoning.append(f"Found reference pattern: {regex.pattern}")
 
         # Count definition lists (::)
-        definition_count = len(re.findall(r'::\s*$', content, re.MULTILINE))
+        definition_count = len(self.definition_list_regex.findall(content))
         if definition_count > 3:
             reasoning.append(f"Found {definition_count} definition lists")
             reference_matches += 1
@@ -271,12 +286,13 @@ class ContentTypeDetector:
         filename_type = self.detect_from_filename(filename)
         if filename_type:
             return DetectionResult(
-                filename_type, 0.95, [f"Detected from filename prefix"]
+                filename_type, 0.95, [f"Detected from filename prefix"], "filename"
             )
 
         # Try content analysis (high confidence)
         content_result = self.detect_from_content(content)
         if content_result.suggested_type:
+            content_result.source = "content"
             return content_result
 
         # Try title analysis (medium confidence)
@@ -286,6 +302,7 @@ class ContentTypeDetector:
             else DetectionResult(None, 0.0, ["No title"])
         )
         if title_result.suggested_type:
+            title_result.source = "title"
             return title_result
 
         # No suggestion found
@@ -0,0 +1,185 @@
+"""
+Write-ahead journal for ContextMigrator directory migrations.
+
+Before any file is rewritten, the journal records the global ID mappings
+and, for every file in the run, the hash of its content before migration.
+Each file is then marked done as soon as its rewrite has been applied.
+Because the mappings fully determine the edits for a file, an interrupted
+run can be resumed from the last checkpoint, or rolled back by restoring
+only the files that were actually touched.
+
+The journal is removed once the run completes.
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_NAME = "journal.jsonl"
+
+
+@dataclass
+class PlannedFile:
+    """Journal record of a file that the migration is going to rewrite."""
+
+    path: str
+    before: str  # SHA-256 of the content before migration
+    mode: int
+
+
+@dataclass
+class JournalState:
+    """Contents of a journal left behind by an interrupted migration."""
+
+    root_dir: str
+    id_mappings: Dict[str, str]
+    file_id_map: Dict[str, str]
+    known_ids: Set[str] = field(default_factory=set)
+    planned: Dict[str, PlannedFile] = field(default_factory=dict)
+    done: set = field(default_factory=set)
+
+    @property
+    def remaining(self) -> List[PlannedFile]:
+        """Planned files that have not been marked done, in plan order."""
+        return [entry for path, entry in self.planned.items() if path not in self.done]
+
+
+class MigrationJournal:
+    """Append-only JSON Lines journal of a single directory migration."""
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self._file = None
+
+    @classmethod
+    def in_directory(cls, directory: str) -> "MigrationJournal":
+        """Return the journal kept in a backup directory."""
+        return cls(os.path.join(directory, JOURNAL_NAME))
+
+    def exists(self) -> bool:
+        """Check whether an interrupted migration left this journal behind."""
+        return os.path.exists(self.path)
+
+    def begin(
+        self,
+        root_dir: str,
+        id_mappings: Dict[str, str],
+        file_id_map: Dict[str, str],
+        known_ids: Iterable[str],
+        planned: List[PlannedFile],
+    ) -> None:
+        """
+        Record the migration plan and make it durable before any file changes.
+
+        Args:
+            root_dir: Directory being migrated
+            id_mappings: Global old ID -> new ID mappings
+            file_id_map: New ID -> file path mappings
+            known_ids: Every ID in the tree after migration, for validation
+            planned: Files the migration is going to rewrite
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._write(
+            {
+                "op": "begin",
+                "root": os.path.abspath(root_dir),
+                "id_mappings": id_mappings,
+                "file_id_map": file_id_map,
+                "known_ids": sorted(known_ids),
+            }
+        )
+        for entry in planned:
+            self._write(
+                {
+                    "op": "plan",
+                    "path": entry.path,
+                    "before": entry.before,
+                    "mode": entry.mode,
+                }
+            )
+        self._sync()
+
+    def reopen(self) -> None:
+        """Continue appending to an existing journal when resuming."""
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def mark_done(self, path: str) -> None:
+        """Record that a planned file has been rewritten."""
+        self._write({"op": "done", "path": path})
+
+    def commit(self) -> None:
+        """Finish the migration and remove the journal."""
+        self.close()
+        self.discard()
+
+    def discard(self) -> None:
+        """Remove the journal without replaying it."""
+        self.close()
+        if self.exists():
+            os.remove(self.path)
+
+    def close(self) -> None:
+        """Flush and close the journal file."""
+        if self._file is not None:
+            self._sync()
+            self._file.close()
+            self._file = None
+
+    def load(self) -> JournalState:
+        """
+        Read the journal of an interrupted migration.
+
+        A truncated last line, left by a crash mid-write, is ignored.
+
+        Returns:
+            JournalState with the mappings, planned files and completed files
+        """
+        state: Optional[JournalState] = None
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(
+                        "Ignoring incomplete journal record in %s", self.path
+                    )
+                    continue
+                op = record.get("op")
+                if op == "begin":
+                    state = JournalState(
+                        record["root"],
+                        record["id_mappings"],
+                        record["file_id_map"],
+                        set(record.get("known_ids", [])),
+                    )
+                elif state is None:
+                    raise ValueError(f"Journal {self.path} has no begin record")
+                elif op == "plan":
+                    state.planned[record["path"]] = PlannedFile(
+                        record["path"], record["before"], record["mode"]
+                    )
+                elif op == "done":
+                    state.done.add(record["path"])
+
+        if state is None:
+            raise ValueError(f"Journal {self.path} has no begin record")
+        return state
+
+    def _write(self, record: Dict) -> None:
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+
+def register_subcommand(subparsers):
+    """This module doesn't register as a subcommand - it's a helper module."""
+    pass
@@ -0,0 +1,512 @@
+"""
+profiling.py - Optional per-phase timing and cProfile support.
+
+When profiling is enabled, the shared processing paths record how long each
+phase of a run takes:
+
+- discovery: finding the files to process
+- scan: the per-file work of a plugin, excluding reading and writing
+- read / write: file I/O, with the number of bytes transferred
+- report: building and writing reports
+- <Module>.execute: a module's execute() as a whole
+
+Phases nest; each phase's self time excludes the phases inside it, so the
+self times add up to the total run time. Each file handed to a plugin's
+per-file callback is also timed on its own, with the bytes it read and
+wrote. At the end of the run a per-phase summary, the slowest files and a
+per-file latency histogram are printed to stderr, and if a file name is
+given, a cProfile dump of the run is written to it for inspection with
+pstats or snakeviz.
+
+Profiling is enabled with the --profile option of the plugin subcommands,
+or for any entry point with the ADT_PROFILE environment variable:
+
+    adt EntityReference -r --profile
+    adt CrossReference --profile run.prof
+    ADT_PROFILE=1 adt ContextAnalyzer -r
+    ADT_PROFILE=run.prof adt ContextAnalyzer -r
+    adt ExampleBlock -r --profile --profile-top 25
+    adt CrossReference --memory-profile
+
+When profiling is disabled, profile_phase() returns a shared no-op context
+manager and count_bytes() returns immediately, so instrumented code pays
+no more than a global lookup.
+
+With --memory-profile or ADT_MEMORY_PROFILE, allocations are traced with
+tracemalloc as well, and the summary adds the peak memory of each phase,
+the size of the plugins' large data structures and the top allocation
+sites; see memory_profiling.py.
+
+Work done in worker processes (ContentType batch mode, parallel
+ContextMigrator runs) is timed as a whole by the phase that waits for it.
+"""
+
+import bisect
+import cProfile
+import functools
+import heapq
+import itertools
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO
+
+from .memory_profiling import MemoryTracker, format_bytes
+
+PROFILE_ENV_VAR = "ADT_PROFILE"
+PROFILE_TOP_ENV_VAR = "ADT_PROFILE_TOP"
+MEMORY_PROFILE_ENV_VAR = "ADT_MEMORY_PROFILE"
+
+# Number of slowest files listed in the summary
+DEFAULT_TOP_FILES = 10
+
+# Upper bounds, in seconds, of the per-file latency histogram buckets
+LATENCY_BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5)
+
+# Values of --profile / ADT_PROFILE that ask for the summary only
+SUMMARY_VALUES = {"1", "true", "yes", "on", "summary"}
+DISABLED_VALUES = {"", "0", "false", "no", "off"}
+
+# Phases entered once per file; allocation sites are not sampled after them
+PER_FILE_PHASES = {"scan", "read", "write"}
+
+_NULL_PHASE = nullcontext()
+
+# The profiler of the current run, or None when profiling is disabled
+_active: Optional["Profiler"] = None
+
+
+@dataclass
+class PhaseStats:
+    """Accumulated measurements of one phase."""
+
+    name: str
+    calls: int = 0
+    seconds: float = 0.0  # Inclusive time
+    self_seconds: float = 0.0  # Time not spent in nested phases
+    bytes: int = 0
+    files: int = 0
+    peak_memory: int = 0  # Largest traced memory in one call, if measured
+
+
+@dataclass
+class FileTiming:
+    """Wall time and I/O of one file handed to a per-file callback."""
+
+    path: str
+    seconds: float
+    bytes_read: int = 0
+    bytes_written: int = 0
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 1:
+        return f"{seconds * 1000:g}ms"
+    return f"{seconds:g}s"
+
+
+class FileTimings:
+    """
+    Per-file latency histogram and the slowest files of a run.
+
+    Only the histogram counts and the `top` slowest files are kept, so
+    memory stays constant however many files are processed.
+    """
+
+    def __init__(self, top: int = DEFAULT_TOP_FILES):
+        self.top = top
+        self.files = 0
+        self.seconds = 0.0
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self._slowest: List[tuple] = []  # Min-heap of (seconds, seq, timing)
+        self._seq = itertools.count()
+
+    def add(self, timing: FileTiming) -> None:
+        """Record the timing of one file."""
+        self.files += 1
+        self.seconds += timing.seconds
+        self.counts[bisect.bisect_right(LATENCY_BUCKETS, timing.seconds)] += 1
+
+        if self.top <= 0:
+            return
+        entry = (timing.seconds, next(self._seq), timing)
+        if len(self._slowest) < self.top:
+            heapq.heappush(self._slowest, entry)
+        elif entry[0] > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def slowest(self) -> List[FileTiming]:
+        """Return the slowest files, slowest first."""
+        return [entry[2] for entry in sorted(self._slowest, reverse=True)]
+
+    def format(self) -> List[str]:
+        """Format the slowest files and the latency histogram as lines."""
+        lines = [f"=== Slowest Files (top {len(self._slowest)} of {self.files}) ==="]
+        for timing in self.slowest():
+            lines.append(
+                f"{timing.seconds:>9.3f}s {timing.bytes_read:>10} B read "
+                f"{timing.bytes_written:>10} B written  {timing.path}"
+            )
+
+        lines.extend(["", "=== File Latency Histogram ==="])
+        widest = max(self.counts) or 1
+        last = max(i for i, count in enumerate(self.counts) if count)
+        for i, count in enumerate(self.counts[: last + 1]):
+            if i < len(LATENCY_BUCKETS):
+                label = f"< {_format_seconds(LATENCY_BUCKETS[i])}"
+            else:
+                label = f">= {_format_seconds(LATENCY_BUCKETS[-1])}"
+            bar = "#" * max(1 if count else 0, round(count / widest * 40))
+            lines.append(f"{label:>9} {count:>8}  {bar}")
+        lines.append(f"Mean: {self.seconds / self.files * 1000:.2f}ms per file")
+        return lines
+
+
+class Profiler:
+    """
+    Collects phase timings for one run, and optionally a cProfile profile
+    and memory measurements.
+
+    Phases are tracked per thread, so nested phases in worker threads are
+    attributed correctly; the totals are shared.
+    """
+
+    def __init__(
+        self,
+        dump_file: Optional[str] = None,
+        top_files: int = DEFAULT_TOP_FILES,
+        memory: bool = False,
+    ):
+        self.dump_file = dump_file
+        self.phases: Dict[str, PhaseStats] = {}
+        self.file_timings = FileTimings(top_files)
+        self.memory: Optional[MemoryTracker] = MemoryTracker() if memory else None
+        self.started = 0.0
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._cprofile: Optional[cProfile.Profile] = None
+
+    def _stats(self, name: str) -> PhaseStats:
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = PhaseStats(name)
+        return stats
+
+    @contextmanager
+    def phase(self, name: str, files: int = 0) -> Iterator[None]:
+        """
+        Time a phase of the run.
+
+        Args:
+            name: Phase name; repeated phases are accumulated
+            files: Number of files the phase handles
+        """
+        stack = self._stack()
+        memory = self.memory
+        if memory is not None:
+            memory.enter(stack)
+        frame = [0.0, 0]  # Time spent in nested phases, peak memory
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1][0] += elapsed
+            peak = 0
+            if memory is not None:
+                peak = memory.exit(frame, stack)
+                if name not in PER_FILE_PHASES:
+                    memory.take_sites(stack)
+            with self._lock:
+                stats = self._stats(name)
+                stats.calls += 1
+                stats.seconds += elapsed
+                stats.self_seconds += elapsed - frame[0]
+                stats.files += files
+                stats.peak_memory = max(stats.peak_memory, peak)
+
+    def _stack(self) -> List[list]:
+        return self._local.__dict__.setdefault("stack", [])
+
+    def record_structures(self, owner: str, structures: Dict[str, Any]) -> None:
+        """Measure plugin data structures if memory is being profiled."""
+        if self.memory is not None:
+            self.memory.record_structures(owner, structures, self._stack())
+
+    @contextmanager
+    def file(self, path: str) -> Iterator[None]:
+        """
+        Time the processing of one file as a "scan" phase, and record its
+        wall time and the bytes read and written meanwhile.
+
+        Args:
+            path: Path of the file being processed
+        """
+        timing = FileTiming(path, 0.0)
+        previous = getattr(self._local, "file", None)
+        self._local.file = timing
+        start = time.perf_counter()
+        try:
+            with self.phase("scan", files=1):
+                yield
+        finally:
+            timing.seconds = time.perf_counter() - start
+            self._local.file = previous
+            with self._lock:
+                self.file_timings.add(timing)
+
+    def count_bytes(self, name: str, nbytes: int) -> None:
+        """Add transferred bytes to a phase, and to the file being processed."""
+        timing = getattr(self._local, "file", None)
+        if timing is not None:
+            if name == "read":
+                timing.bytes_read += nbytes
+            elif name == "write":
+                timing.bytes_written += nbytes
+        with self._lock:
+            self._stats(name).bytes += nbytes
+
+    def start(self) -> None:
+        """Start the run clock, cProfile and allocation tracing as requested."""
+        if self.memory is not None:
+            self.memory.start()
+        self.started = time.perf_counter()
+        if self.dump_file:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def stop(self) -> None:
+        """Stop the run clock and write the cProfile dump, if any."""
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.dump_file)
+        self.elapsed = time.perf_counter() - self.started
+        if self.memory is not None:
+            self.memory.stop()
+
+    def format_summary(self) -> str:
+        """
+        Format the per-phase summary.
+
+        Returns:
+            Formatted text table, slowest phases first
+        """
+        header = (
+            f"{'Phase':<28}{'Calls':>8}{'Time':>11}{'Self':>11}{'Self %':>8}"
+            f"{'Files':>8}{'Bytes':>12}"
+        )
+        if self.memory is not None:
+            header += f"{'Peak memory':>14}"
+        lines = [
+            "=== Profile Summary ===",
+            f"Total run time: {self.elapsed:.3f}s",
+            "",
+            header,
+        ]
+        phases = sorted(self.phases.values(), key=lambda s: -s.self_seconds)
+        for stats in phases:
+            share = stats.self_seconds / self.elapsed * 100 if self.elapsed else 0.0
+            line = (
+                f"{stats.name:<28}{stats.calls:>8}{stats.seconds:>10.3f}s"
+                f"{stats.self_seconds:>10.3f}s{share:>7.1f}%"
+                f"{stats.files or '':>8}{stats.bytes or '':>12}"
+            )
+            if self.memory is not None:
+                line += f"{format_bytes(stats.peak_memory):>14}"
+            lines.append(line)
+
+        read = self.phases.get("read")
+        if read and read.bytes and read.seconds:
+            rate = read.bytes / (1024 * 1024) / read.seconds
+            lines.extend(["", f"Read throughput: {rate:.1f} MB/s"])
+        if self.file_timings.files:
+            lines.append("")
+            lines.extend(self.file_timings.format())
+        if self.memory is not None:
+            lines.append("")
+            lines.extend(self.memory.format())
+        if self.dump_file:
+            lines.extend(["", f"cProfile data written to {self.dump_file}"])
+        return "\n".join(lines)
+
+    def report(self, stream: Optional[TextIO] = None) -> None:
+        """Print the summary, to stderr by default."""
+        print(self.format_summary(), file=stream or sys.stderr)
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Return the profiler of the current run, or None if profiling is off."""
+    return _active
+
+
+def profile_phase(name: str, files: int = 0):
+    """
+    Time a phase if profiling is enabled.
+
+    Args:
+        name: Phase name
+        files: Number of files the phase handles
+
+    Returns:
+        Context manager; a shared no-op one when profiling is disabled
+    """
+    if _active is None:
+        return _NULL_PHASE
+    return _active.phase(name, files)
+
+
+def profile_file(path: str):
+    """
+    Time the processing of one file if profiling is enabled.
+
+    Args:
+        path: Path of the file being processed
+
+    Returns:
+        Context manager; a shared no-op one when profiling is disabled
+    """
+    if _active is None:
+        return _NULL_PHASE
+    return _active.file(path)
+
+
+def count_bytes(name: str, nbytes: int) -> None:
+    """Add transferred bytes to a phase if profiling is enabled."""
+    if _active is not None:
+        _active.count_bytes(name, nbytes)
+
+
+def record_structures(owner: str, **structures: Any) -> None:
+    """
+    Measure a plugin's large data structures if memory is being profiled.
+
+    Plugins call this once their structures are complete, before building
+    a report from them. The size kept for each structure is the largest
+    measured during the run.
+
+    Args:
+        owner: Plugin or class the structures belong to
+        **structures: Structure name -> object, such as id_map=self.id_map
+    """
+    if _active is not None and _active.memory is not None:
+        _active.record_structures(owner, structures)
+
+
+def parse_profile_option(
+    value: Optional[str], top_files: int = DEFAULT_TOP_FILES, memory: bool = False
+) -> Optional[Profiler]:
+    """
+    Create a profiler from a --profile or ADT_PROFILE value.
+
+    Args:
+        value: None or a disabled value for no profiling, "1"/"summary" for
+            the phase summary, anything else is the cProfile dump file
+        top_files: Number of slowest files to list in the summary
+        memory: Whether to profile memory; implies the summary
+
+    Returns:
+        A new Profiler, or None if profiling is not requested
+    """
+    if value is None or value.strip().lower() in DISABLED_VALUES:
+        return Profiler(top_files=top_files, memory=True) if memory else None
+    if value.strip().lower() in SUMMARY_VALUES:
+        return Profiler(top_files=top_files, memory=memory)
+    return Profiler(dump_file=value, top_files=top_files, memory=memory)
+
+
+def _enabled_in_environment(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() not in DISABLED_VALUES
+
+
+@contextmanager
+def profiling_session(
+    option: Optional[str] = None,
+    stream: Optional[TextIO] = None,
+    top_files: Optional[int] = None,
+    memory: Optional[bool] = None,
+) -> Iterator[Optional[Profiler]]:
+    """
+    Profile a run if the option or the ADT_PROFILE variable asks for it.
+
+    The summary is printed when the run ends, also if it fails. Nested
+    sessions reuse the outer profiler.
+
+    Args:
+        option: Value of the --profile option; ADT_PROFILE is used if None
+        stream: Where to print the summary (default: stderr)
+        top_files: Number of slowest files to list; ADT_PROFILE_TOP or
+            DEFAULT_TOP_FILES is used if None
+        memory: Whether to profile memory (--memory-profile);
+            ADT_MEMORY_PROFILE is used if None or False
+
+    Yields:
+        The active Profiler, or None if profiling is disabled
+    """
+    global _active
+
+    if _active is not None:
+        yield _active
+        return
+
+    if option is None:
+        option = os.environ.get(PROFILE_ENV_VAR)
+    if top_files is None:
+        try:
+            top_files = int(os.environ.get(PROFILE_TOP_ENV_VAR, DEFAULT_TOP_FILES))
+        except ValueError:
+            top_files = DEFAULT_TOP_FILES
+    memory = bool(memory) or _enabled_in_environment(MEMORY_PROFILE_ENV_VAR)
+    profiler = parse_profile_option(option, top_files, memory)
+    if profiler is None:
+        yield None
+        return
+
+    _active = profiler
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        _active = None
+        profiler.report(stream)
+
+
+def profiled(name: str) -> Callable:
+    """
+    Decorator that times a module's execute() as the phase "<name>.execute".
+
+    When no run is being profiled and ADT_PROFILE or ADT_MEMORY_PROFILE is
+    set, as when modules are driven by the module sequencer, the call starts
+    its own session.
+
+    Args:
+        name: Module name used in the phase name
+    """
+    phase_name = f"{name}.execute"
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active is not None:
+                with _active.phase(phase_name):
+                    return func(*args, **kwargs)
+            if not (
+                _enabled_in_environment(PROFILE_ENV_VAR)
+                or _enabled_in_environment(MEMORY_PROFILE_ENV_VAR)
+            ):
+                return func(*args, **kwargs)
+            with profiling_session() as profiler:
+                with profiler.phase(phase_name):
+                    return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
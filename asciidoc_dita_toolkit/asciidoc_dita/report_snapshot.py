@@ -0,0 +1,357 @@
+"""
+Compact machine-readable snapshots of analysis runs, and a tool to diff them.
+
+A snapshot stores what dashboards and CI need from a ContextAnalyzer or
+CrossReference run: the summary totals, the context IDs, the potential ID
+collisions and the broken xrefs. It is compact JSON: every string (file
+paths, IDs, xref text) is stored once in a string table, and table rows are
+lists of integers that index into it.
+
+Snapshots are written by SnapshotWriter, a ReportWriter that takes the same
+(kind, record) pairs as the streaming reports, so they can be produced
+alongside a streamed report or from the in-memory analysis state.
+
+Two snapshots can be compared without reprocessing the documentation:
+
+    adt-report-diff old.snapshot.json new.snapshot.json
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .report_writers import ReportWriter
+
+SNAPSHOT_FORMAT = "adt-report-snapshot"
+SNAPSHOT_VERSION = 1
+
+# Column types: "s" string, "i" integer, "S" list of strings
+# Record kind -> (table name, ((column, type), ...))
+SNAPSHOT_TABLES = {
+    "id": (
+        "context_ids",
+        (("file", "s"), ("line", "i"), ("id", "s"), ("base_id", "s"), ("context", "s")),
+    ),
+    "collision": ("collisions", (("base_id", "s"), ("files", "S"))),
+    "broken": (
+        "broken_xrefs",
+        (
+            ("file", "s"),
+            ("line", "i"),
+            ("xref", "s"),
+            ("target_id", "s"),
+            ("target_file", "s"),
+            ("reason", "s"),
+        ),
+    ),
+}
+
+
+class StringTable:
+    """Assigns each distinct string a stable index, in order of first use."""
+
+    __slots__ = ("strings", "_index")
+
+    def __init__(self, strings: Sequence[str] = ()):
+        self.strings: List[str] = list(strings)
+        self._index: Dict[str, int] = {s: i for i, s in enumerate(self.strings)}
+
+    def add(self, value: str) -> int:
+        """Return the index of a string, adding it on first use."""
+        index = self._index.get(value)
+        if index is None:
+            index = len(self.strings)
+            self.strings.append(value)
+            self._index[value] = index
+        return index
+
+
+@dataclass
+class ReportSnapshot:
+    """Decoded contents of a snapshot file."""
+
+    tool: str
+    created: str
+    summary: Dict[str, Any] = field(default_factory=dict)
+    tables: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+
+    def rows(self, table: str) -> List[Dict[str, Any]]:
+        """Return the rows of a table, or an empty list if the run had none."""
+        return self.tables.get(table, [])
+
+
+class SnapshotWriter(ReportWriter):
+    """
+    Collects report records into a compact snapshot, saved on close().
+
+    Only the record kinds in SNAPSHOT_TABLES and the "summary" records are
+    kept, already encoded as integer rows; everything else is only counted.
+    """
+
+    def __init__(self, path: str, tool: str):
+        super().__init__(None, kinds=set(SNAPSHOT_TABLES) | {"summary"})
+        self.path = path
+        self.tool = tool
+        self.strings = StringTable()
+        self.summary: Dict[str, Any] = {}
+        self.rows: Dict[str, List[list]] = {}
+
+    def _write_record(self, kind: str, record: Dict) -> None:
+        if kind == "summary":
+            self.summary.update(record)
+            return
+
+        table, columns = SNAPSHOT_TABLES[kind]
+        row = []
+        for name, column_type in columns:
+            value = record.get(name)
+            if column_type == "i":
+                row.append(value)
+            elif column_type == "S":
+                row.append([self.strings.add(str(item)) for item in value or ()])
+            else:
+                row.append(self.strings.add("" if value is None else str(value)))
+        self.rows.setdefault(table, []).append(row)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        """Write the snapshot file."""
+        schema = {table: columns for table, columns in SNAPSHOT_TABLES.values()}
+        data = {
+            "format": SNAPSHOT_FORMAT,
+            "version": SNAPSHOT_VERSION,
+            "tool": self.tool,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "summary": self.summary,
+            "strings": self.strings.strings,
+            "tables": {
+                table: {"columns": [list(c) for c in schema[table]], "rows": rows}
+                for table, rows in self.rows.items()
+            },
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+
+def load_snapshot(path: str) -> ReportSnapshot:
+    """
+    Load a snapshot file written by SnapshotWriter.
+
+    Args:
+        path: Path to the snapshot file
+
+    Returns:
+        ReportSnapshot with the string table resolved
+
+    Raises:
+        ValueError: If the file is not a snapshot or has an unsupported version
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    if data.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(f"{path} is not a report snapshot")
+    if data.get("version", 0) > SNAPSHOT_VERSION:
+        raise ValueError(
+            f"{path} uses snapshot version {data['version']}, "
+            f"newer than the supported version {SNAPSHOT_VERSION}"
+        )
+
+    strings = data["strings"]
+    tables = {}
+    for table, content in data.get("tables", {}).items():
+        columns = content["columns"]
+        decoded = []
+        for row in content["rows"]:
+            record = {}
+            for (name, column_type), value in zip(columns, row):
+                if column_type == "i":
+                    record[name] = value
+                elif column_type == "S":
+                    record[name] = [strings[i] for i in value]
+                else:
+                    record[name] = strings[value]
+            decoded.append(record)
+        tables[table] = decoded
+
+    return ReportSnapshot(
+        tool=data.get("tool", ""),
+        created=data.get("created", ""),
+        summary=data.get("summary", {}),
+        tables=tables,
+    )
+
+
+@dataclass
+class SnapshotDiff:
+    """Differences between two snapshots of the same documentation."""
+
+    old_tool: str
+    new_tool: str
+    new_broken_xrefs: List[Dict[str, Any]] = field(default_factory=list)
+    resolved_broken_xrefs: List[Dict[str, Any]] = field(default_factory=list)
+    new_collisions: List[Dict[str, Any]] = field(default_factory=list)
+    resolved_collisions: List[Dict[str, Any]] = field(default_factory=list)
+    summary_changes: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)
+
+    @property
+    def has_regressions(self) -> bool:
+        """Whether the new run has broken xrefs or collisions the old one had not."""
+        return bool(self.new_broken_xrefs or self.new_collisions)
+
+
+def _broken_key(row: Dict[str, Any]) -> Tuple:
+    # Line numbers shift with unrelated edits, so they are not part of the key
+    return (row["file"], row["xref"], row["target_id"], row["reason"])
+
+
+def _collision_key(row: Dict[str, Any]) -> Tuple:
+    return (row["base_id"], tuple(sorted(row["files"])))
+
+
+def _added(rows: List[Dict], other: List[Dict], key) -> List[Dict]:
+    """Return the rows whose key occurs more often in rows than in other."""
+    remaining = Counter(key(row) for row in other)
+    added = []
+    for row in rows:
+        row_key = key(row)
+        if remaining[row_key]:
+            remaining[row_key] -= 1
+        else:
+            added.append(row)
+    return added
+
+
+def diff_snapshots(old: ReportSnapshot, new: ReportSnapshot) -> SnapshotDiff:
+    """
+    Compare two snapshots.
+
+    Broken xrefs are matched by file, xref text, target and reason, ignoring
+    line numbers. Collisions are matched by base ID and the set of files
+    involved, so a collision that gains a file is reported as new.
+
+    Args:
+        old: Snapshot of the earlier run
+        new: Snapshot of the later run
+
+    Returns:
+        SnapshotDiff listing added and resolved problems and changed totals
+    """
+    old_broken, new_broken = old.rows("broken_xrefs"), new.rows("broken_xrefs")
+    old_collisions, new_collisions = old.rows("collisions"), new.rows("collisions")
+
+    summary_changes = {}
+    for key in sorted(set(old.summary) | set(new.summary)):
+        before, after = old.summary.get(key), new.summary.get(key)
+        if before != after:
+            summary_changes[key] = (before, after)
+
+    return SnapshotDiff(
+        old_tool=old.tool,
+        new_tool=new.tool,
+        new_broken_xrefs=_added(new_broken, old_broken, _broken_key),
+        resolved_broken_xrefs=_added(old_broken, new_broken, _broken_key),
+        new_collisions=_added(new_collisions, old_collisions, _collision_key),
+        resolved_collisions=_added(old_collisions, new_collisions, _collision_key),
+        summary_changes=summary_changes,
+    )
+
+
+def format_snapshot_diff(diff: SnapshotDiff) -> str:
+    """
+    Format a snapshot diff as a human-readable report.
+
+    Args:
+        diff: SnapshotDiff to format
+
+    Returns:
+        Formatted text report
+    """
+    lines = ["=== Report Snapshot Diff ===", ""]
+    if diff.old_tool != diff.new_tool:
+        lines.extend(
+            [f"Warning: comparing a {diff.old_tool} run to a {diff.new_tool} run", ""]
+        )
+
+    lines.extend(
+        [
+            f"New broken xrefs: {len(diff.new_broken_xrefs)}",
+            f"Resolved broken xrefs: {len(diff.resolved_broken_xrefs)}",
+            f"New collisions: {len(diff.new_collisions)}",
+            f"Resolved collisions: {len(diff.resolved_collisions)}",
+            "",
+        ]
+    )
+
+    if diff.new_broken_xrefs:
+        lines.append("=== New Broken Cross-References ===")
+        for broken in diff.new_broken_xrefs:
+            lines.append(f"{broken['file']}:{broken['line']}")
+            lines.append(f"  Xref: {broken['xref']}")
+            lines.append(f"  Reason: {broken['reason']}")
+        lines.append("")
+
+    if diff.new_collisions:
+        lines.append("=== New Potential ID Collisions ===")
+        for collision in diff.new_collisions:
+            lines.append(f"Base ID '{collision['base_id']}'")
+            for filepath in collision["files"]:
+                lines.append(f"  - {filepath}")
+        lines.append("")
+
+    if diff.summary_changes:
+        lines.append("=== Summary Changes ===")
+        for key, (before, after) in diff.summary_changes.items():
+            lines.append(f"{key}: {before} -> {after}")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point: compare two report snapshots."""
+    parser = argparse.ArgumentParser(
+        prog="adt-report-diff",
+        description="Compare two ContextAnalyzer or CrossReference report snapshots",
+    )
+    parser.add_argument("old", help="Snapshot of the earlier run")
+    parser.add_argument("new", help="Snapshot of the later run")
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format for the diff (default: text)",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 if the new run has new broken xrefs or collisions",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        diff = diff_snapshots(load_snapshot(args.old), load_snapshot(args.new))
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    if args.format == "json":
+        print(json.dumps(asdict(diff), indent=2))
+    else:
+        print(format_snapshot_diff(diff))
+
+    return 1 if args.fail_on_regression and diff.has_regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
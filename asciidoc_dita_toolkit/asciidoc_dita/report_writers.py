@@ -0,0 +1,267 @@
+"""
+Incremental report writers shared by the analysis plugins.
+
+The text, JSON and CSV reports built by format_text_report(),
+format_migration_report() and format_validation_report() need every result
+in memory before the first line is written. The writers in this module
+instead take one flat record at a time, as (kind, record) pairs, and write
+them to the output as soon as each file has been processed:
+
+- TextReportWriter: human-readable lines produced by a plugin formatter
+- JsonLinesReportWriter: one JSON object per line, tagged with its "type"
+- CsvReportWriter: one row per record, with a "type" column
+
+Plugins emit the per-file records first and the summary records (totals,
+collisions) last, so only the state needed for those summaries has to be
+kept for the whole run.
+"""
+
+import csv
+import json
+import sys
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, TextIO, Tuple
+
+# Report formats that are written incrementally
+STREAM_FORMATS = ("jsonl", "csv")
+
+# A single report record: its kind and its fields
+Record = Tuple[str, Dict]
+
+# Formats a record as zero or more lines of text
+RecordFormatter = Callable[[str, Dict], List[str]]
+
+
+class ReportWriter(ABC):
+    """
+    Base class for writers that stream report records to a text stream.
+
+    Writers count every record they are given by kind, including the ones
+    excluded by the kinds filter, so callers can take totals from
+    writer.counts instead of keeping the records themselves.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        close_stream: bool = False,
+        kinds: Optional[Iterable[str]] = None,
+    ):
+        self.stream = stream
+        self.close_stream = close_stream
+        self.kinds = set(kinds) if kinds is not None else None
+        self.counts: Dict[str, int] = {}
+
+    def write(self, kind: str, record: Dict) -> None:
+        """
+        Write a single record.
+
+        Args:
+            kind: Record type, such as "file", "broken" or "summary"
+            record: Record fields
+        """
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        if self.kinds is None or kind in self.kinds:
+            self._write_record(kind, record)
+
+    def write_section(self, records: Iterable[Record]) -> None:
+        """
+        Write the records of one file and flush them to the output.
+
+        Args:
+            records: (kind, record) pairs to write
+        """
+        for kind, record in records:
+            self.write(kind, record)
+        self.flush()
+
+    def flush(self) -> None:
+        """Push the records written so far to the output."""
+        self.stream.flush()
+
+    def close(self) -> None:
+        """Flush the output, closing it if the writer opened it."""
+        if self.close_stream:
+            self.stream.close()
+        else:
+            self.flush()
+
+    @abstractmethod
+    def _write_record(self, kind: str, record: Dict) -> None:
+        """Write a record that passed the kinds filter."""
+        pass
+
+    def __enter__(self) -> "ReportWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class TextReportWriter(ReportWriter):
+    """
+    Writes records as human-readable lines produced by a formatter.
+
+    The header is written when the writer is created; a heading registered
+    for a record kind is written just before the first record of that kind.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        formatter: RecordFormatter,
+        header: Sequence[str] = (),
+        headings: Optional[Dict[str, Sequence[str]]] = None,
+        **kwargs,
+    ):
+        super().__init__(stream, **kwargs)
+        self.formatter = formatter
+        self.headings = dict(headings or {})
+        for line in header:
+            self.stream.write(line + "\n")
+
+    def _write_record(self, kind: str, record: Dict) -> None:
+        for line in self.headings.pop(kind, ()):
+            self.stream.write(line + "\n")
+        for line in self.formatter(kind, record):
+            self.stream.write(line + "\n")
+
+
+class JsonLinesReportWriter(ReportWriter):
+    """Writes each record as one JSON object per line."""
+
+    def _write_record(self, kind: str, record: Dict) -> None:
+        row = {"type": kind}
+        row.update(record)
+        self.stream.write(json.dumps(row) + "\n")
+
+
+class CsvReportWriter(ReportWriter):
+    """
+    Writes each record as one CSV row.
+
+    Every row has the same columns: "type" followed by the given field
+    names. Fields a record does not have are left empty, and list values
+    are joined with ";".
+    """
+
+    def __init__(self, stream: TextIO, fieldnames: Sequence[str], **kwargs):
+        super().__init__(stream, **kwargs)
+        self.fieldnames = ["type"] + [name for name in fieldnames if name != "type"]
+        self._writer = csv.DictWriter(
+            self.stream, fieldnames=self.fieldnames, extrasaction="ignore"
+        )
+        self._writer.writeheader()
+
+    def _write_record(self, kind: str, record: Dict) -> None:
+        row = {"type": kind}
+        for name, value in record.items():
+            if isinstance(value, (list, tuple)):
+                value = ";".join(str(item) for item in value)
+            row[name] = value
+        self._writer.writerow(row)
+
+
+class MultiReportWriter(ReportWriter):
+    """Sends every record to several writers, such as a report and a snapshot."""
+
+    def __init__(self, writers: Sequence[ReportWriter]):
+        super().__init__(None)
+        self.writers = list(writers)
+
+    def _write_record(self, kind: str, record: Dict) -> None:
+        for writer in self.writers:
+            writer.write(kind, record)
+
+    def flush(self) -> None:
+        for writer in self.writers:
+            writer.flush()
+
+    def close(self) -> None:
+        """Close every writer, then raise the first error any of them raised."""
+        error = None
+        for writer in self.writers:
+            try:
+                writer.close()
+            except Exception as e:
+                if error is None:
+                    error = e
+        if error is not None:
+            raise error
+
+
+def format_for_path(path: Optional[str], default: str = "text") -> str:
+    """
+    Pick a report format from an output file extension.
+
+    Args:
+        path: Output file path, or None for console output
+        default: Format to use when the extension is not recognized
+
+    Returns:
+        One of "json", "jsonl", "csv" or the default
+    """
+    if path:
+        lowered = path.lower()
+        for extension, report_format in (
+            (".jsonl", "jsonl"),
+            (".json", "json"),
+            (".csv", "csv"),
+        ):
+            if lowered.endswith(extension):
+                return report_format
+    return default
+
+
+def open_report_writer(
+    report_format: str,
+    output_file: Optional[str] = None,
+    fieldnames: Sequence[str] = (),
+    formatter: Optional[RecordFormatter] = None,
+    header: Sequence[str] = (),
+    headings: Optional[Dict[str, Sequence[str]]] = None,
+    kinds: Optional[Iterable[str]] = None,
+) -> ReportWriter:
+    """
+    Create a streaming writer for a report format.
+
+    Args:
+        report_format: "text", "jsonl" or "csv"
+        output_file: File to write to (default: standard output)
+        fieldnames: CSV columns, used by the "csv" format
+        formatter: Record formatter, used by the "text" format
+        header: Lines written first, used by the "text" format
+        headings: Lines written before the first record of a kind, used by
+            the "text" format
+        kinds: Record kinds to write (default: all)
+
+    Returns:
+        ReportWriter for the requested format
+    """
+    if report_format not in STREAM_FORMATS + ("text",):
+        raise ValueError(f"Unsupported streaming report format: {report_format}")
+    if report_format == "text" and formatter is None:
+        raise ValueError("The text report format requires a record formatter")
+
+    if output_file:
+        newline = "" if report_format == "csv" else None
+        stream = open(output_file, "w", encoding="utf-8", newline=newline)
+        close_stream = True
+    else:
+        stream = sys.stdout
+        close_stream = False
+
+    if report_format == "jsonl":
+        return JsonLinesReportWriter(stream, close_stream=close_stream, kinds=kinds)
+    if report_format == "csv":
+        return CsvReportWriter(
+            stream, fieldnames, close_stream=close_stream, kinds=kinds
+        )
+    return TextReportWriter(
+        stream,
+        formatter,
+        header,
+        headings,
+        close_stream=close_stream,
+        kinds=kinds,
+    )
@@ -12,6 +12,7 @@ import os
 import sys
 
 from .plugin_manager import is_plugin_enabled
+from .profiling import profiling_session
 
 PLUGIN_DIR = os.path.join(os.path.dirname(__file__), "plugins")
 
@@ -111,7 +112,12 @@ def main():
     # Each plugin's register_subcommand sets a 'func' attribute
     if hasattr(args, "func"):
         try:
-            args.func(args)
+            with profiling_session(
+                getattr(args, "profile", None),
+                top_files=getattr(args, "profile_top", None),
+                memory=getattr(args, "memory_profile", False),
+            ):
+                args.func(args)
         except Exception as e:
             print(f"Error executing command: {e}", file=sys.stderr)
             sys.exit(1)
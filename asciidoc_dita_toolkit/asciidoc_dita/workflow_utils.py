@@ -21,18 +21,25 @@ Usage Examples:
     # - Process single file if args.file is specified
     # - Use DirectoryConfig filtering if plugin is enabled
     # - Fall back to recursive/non-recursive directory scanning
+
+    # On a network filesystem, read ahead and write in the background
+    process_adoc_files(args, my_process_file, prefetch=8)
 """
 
 import logging
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, List
 
+from .io_pipeline import PipelineWriteError, io_pipeline
 from .plugin_manager import is_plugin_enabled
+from .profiling import get_profiler, profile_phase
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
-def process_adoc_files(args: Any, process_file_func: Callable[[str], None]) -> None:
+def process_adoc_files(
+    args: Any, process_file_func: Callable[[str], None], prefetch: int = 0
+) -> None:
     """
     Batch processing pattern for .adoc files with optional directory configuration.
 
@@ -47,6 +54,14 @@ def process_adoc_files(args: Any, process_file_func: Callable[[str], None]) -> N
     Args:
         args: Parsed command line arguments (must have 'file', 'directory', 'recursive' attributes)
         process_file_func: Function that takes a file path and processes it
+        prefetch: If positive, run the files through an io_pipeline with this
+            many I/O threads: upcoming files are read in the background and
+            writes are queued, for filesystems where I/O latency dominates
+
+    Raises:
+        PipelineWriteError: With prefetch, if any queued write failed. It is
+            raised after all files were processed and all other writes
+            finished; files processed before a failure are not rolled back
 
     Examples:
         >>> class Args:
@@ -62,14 +77,65 @@ def process_adoc_files(args: Any, process_file_func: Callable[[str], None]) -> N
         >>> process_adoc_files(args, processor)
         # Processes all .adoc files in docs/ recursively
     """
+    with profile_phase("discovery"):
+        adoc_files = _discover_adoc_files(args)
+
+    if prefetch > 0 and len(adoc_files) > 1:
+        with io_pipeline(prefetch) as pipeline:
+            _process_files(pipeline.prefetch(adoc_files), process_file_func)
+        if pipeline.errors:
+            raise PipelineWriteError(pipeline.errors)
+    else:
+        _process_files(adoc_files, process_file_func)
+
+
+def _process_files(filepaths: Iterable[str], process_file_func: Callable) -> None:
+    profiler = get_profiler()
+    if profiler is None:
+        for filepath in filepaths:
+            process_file_func(filepath)
+        return
+
+    # Each file is timed on its own; reads and writes inside the callback
+    # are timed as their own phases
+    for filepath in filepaths:
+        with profiler.file(filepath):
+            process_file_func(filepath)
+
+
+def collect_adoc_files(args: Any) -> List[str]:
+    """
+    Return the files process_adoc_files() would process, without processing them.
+
+    For plugins that process the files together rather than one at a time.
+
+    Args:
+        args: Parsed command line arguments (must have 'file', 'directory', 'recursive' attributes)
+
+    Returns:
+        List of .adoc file paths
+    """
+    with profile_phase("discovery"):
+        return _discover_adoc_files(args)
+
+
+def _discover_adoc_files(args: Any) -> List[str]:
+    """
+    Find the files process_adoc_files() should process.
+
+    Args:
+        args: Parsed command line arguments (must have 'file', 'directory', 'recursive' attributes)
+
+    Returns:
+        List of .adoc file paths
+    """
     from .file_utils import is_valid_adoc_file, find_adoc_files
 
     if args.file:
         if is_valid_adoc_file(args.file):
-            process_file_func(args.file)
-        else:
-            logger.error(f"{args.file} is not a valid .adoc file or is a symlink.")
-        return
+            return [args.file]
+        logger.error(f"{args.file} is not a valid .adoc file or is a symlink.")
+        return []
 
     # Initialize adoc_files to avoid UnboundLocalError
     adoc_files = []
@@ -86,12 +152,13 @@ def process_adoc_files(args: Any, process_file_func: Callable[[str], None]) -> N
     if is_plugin_enabled("DirectoryConfig"):
         try:
             from .plugins.DirectoryConfig import (
-                load_directory_config,
+                get_compiled_directory_config,
                 get_filtered_adoc_files,
                 apply_directory_filters,
             )
 
-            config = load_directory_config()
+            # Loaded and compiled once, then shared by every plugin in the run
+            config = get_compiled_directory_config()
             if config:
                 # Use configuration-aware file discovery
                 logger.info("Using directory configuration")
@@ -100,7 +167,7 @@ def process_adoc_files(args: Any, process_file_func: Callable[[str], None]) -> N
                 )
                 if adoc_files:
                     directories = apply_directory_filters(directory_path, config)
-                    excluded_count = len(config.get('excludeDirs', []))
+                    excluded_count = len(config.exclude_dirs)
                     dir_text = "directory" if len(directories) == 1 else "directories"
                     exclude_text = (
                         f", excluding {excluded_count}" if excluded_count > 0 else ""
@@ -128,5 +195,4 @@ def process_adoc_files(args: Any, process_file_func: Callable[[str], None]) -> N
         # Legacy behavior: process all files in directory
         adoc_files = fallback_to_legacy()
 
-    for filepath in adoc_files:
-        process_file_func(filepath)
+    return adoc_files
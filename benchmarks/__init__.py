@@ -0,0 +1,5 @@
+"""
+Benchmark suite for the AsciiDoc DITA Toolkit plugins.
+
+See benchmarks/README.md for usage.
+"""
@@ -0,0 +1,215 @@
+"""
+Deterministic synthetic AsciiDoc corpus generator for the benchmark suite.
+
+The generated tree looks like a typical modular documentation set:
+
+    master.adoc                      top-level book, includes the assembly chain
+    assemblies/assembly_<level>.adoc each assembly includes the next level and
+                                     a share of the modules
+    modules/group_<n>/module_<i>.adoc topics with IDs, sections, xrefs,
+                                     entities and example blocks
+    _build/html/...                  generated copies that DirectoryConfig
+                                     filtering is expected to exclude
+
+The same CorpusSpec always produces byte-identical files.
+"""
+
+import os
+import random
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List
+
+# Entities that EntityReference rewrites, plus ones it keeps as they are
+ENTITIES = [
+    "&copy;",
+    "&trade;",
+    "&reg;",
+    "&mdash;",
+    "&ndash;",
+    "&hellip;",
+    "&rsquo;",
+    "&amp;",
+    "&lt;",
+]
+
+WORDS = (
+    "configure install cluster operator node storage network policy "
+    "deploy service route secret volume resource namespace upgrade "
+    "monitor alert metric log audit token certificate registry image "
+    "build pipeline trigger webhook console command option default value"
+).split()
+
+CONTENT_TYPES = ["CONCEPT", "PROCEDURE", "REFERENCE", "ASSEMBLY"]
+
+CONTEXTS = ["install", "upgrade", "admin"]
+
+
+@dataclass
+class CorpusSpec:
+    """Shape of a generated corpus."""
+
+    files: int = 200  # Number of module files
+    file_size: int = 4096  # Approximate size of each module in bytes
+    include_depth: int = 3  # Length of the assembly include chain
+    xref_density: float = 0.5  # Average xrefs per paragraph
+    context_id_ratio: float = 0.5  # Share of IDs with a _{context} suffix
+    entity_density: float = 0.3  # Average entities per paragraph
+    generated_dirs: float = 0.1  # Share of modules copied under _build/
+    seed: int = 42
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the spec as a plain dictionary, for result metadata."""
+        return asdict(self)
+
+
+@dataclass
+class CorpusInfo:
+    """Summary of a generated corpus."""
+
+    root: str
+    master: str
+    modules: List[str] = field(default_factory=list)
+    assemblies: List[str] = field(default_factory=list)
+    generated: List[str] = field(default_factory=list)
+    total_bytes: int = 0
+
+    @property
+    def files(self) -> List[str]:
+        """All .adoc files in the corpus, including excluded generated ones."""
+        return [self.master] + self.assemblies + self.modules + self.generated
+
+
+def _module_id(index: int, with_context: bool) -> str:
+    return f"module_{index}_{{context}}" if with_context else f"module_{index}"
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(6, 14))]
+    words[0] = words[0].capitalize()
+    return " ".join(words) + "."
+
+
+def _paragraph(rng: random.Random, spec: CorpusSpec, module_ids: List[str]) -> str:
+    sentences = [_sentence(rng) for _ in range(rng.randint(2, 4))]
+
+    entities = int(spec.entity_density) + (
+        1 if rng.random() < spec.entity_density % 1 else 0
+    )
+    for _ in range(entities):
+        i = rng.randrange(len(sentences))
+        sentences[i] = sentences[i][:-1] + f" {rng.choice(ENTITIES)} term."
+
+    xrefs = int(spec.xref_density) + (1 if rng.random() < spec.xref_density % 1 else 0)
+    for _ in range(xrefs):
+        target = rng.choice(module_ids)
+        sentences.append(f"See xref:{target}[{target.split('_')[1]}] for details.")
+
+    return " ".join(sentences)
+
+
+def _module_content(
+    rng: random.Random, spec: CorpusSpec, index: int, module_ids: List[str]
+) -> str:
+    lines = [
+        f":_mod-docs-content-type: {rng.choice(CONTENT_TYPES)}",
+        f'[id="{module_ids[index]}"]',
+        f"= Module {index}: {_sentence(rng)[:-1]}",
+        "",
+    ]
+    if "{context}" in module_ids[index]:
+        lines[0:0] = [f":context: {rng.choice(CONTEXTS)}"]
+
+    size = sum(len(line) + 1 for line in lines)
+    section = 0
+    while size < spec.file_size:
+        if size > spec.file_size // 3 and rng.random() < 0.25:
+            section += 1
+            suffix = "_{context}" if rng.random() < spec.context_id_ratio else ""
+            block = [
+                f'[id="module_{index}_section_{section}{suffix}"]',
+                f"== Section {section}",
+                "",
+            ]
+            if rng.random() < 0.3:
+                block.extend(["====", _paragraph(rng, spec, module_ids), "====", ""])
+        else:
+            block = [_paragraph(rng, spec, module_ids), ""]
+        lines.extend(block)
+        size += sum(len(line) + 1 for line in block)
+
+    return "\n".join(lines) + "\n"
+
+
+def _write(path: str, content: str) -> int:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(content)
+    return len(content.encode("utf-8"))
+
+
+def generate_corpus(root: str, spec: CorpusSpec = None) -> CorpusInfo:
+    """
+    Generate a synthetic documentation tree.
+
+    Args:
+        root: Directory to create the corpus in (created if missing)
+        spec: Shape of the corpus (default: CorpusSpec())
+
+    Returns:
+        CorpusInfo describing the generated files
+    """
+    spec = spec or CorpusSpec()
+    rng = random.Random(spec.seed)
+    root = os.path.abspath(root)
+    os.makedirs(root, exist_ok=True)
+
+    module_ids = [
+        _module_id(i, rng.random() < spec.context_id_ratio) for i in range(spec.files)
+    ]
+    info = CorpusInfo(root=root, master=os.path.join(root, "master.adoc"))
+
+    # Modules, grouped in directories of up to 50 files
+    module_paths = []
+    for i in range(spec.files):
+        relative = os.path.join("modules", f"group_{i // 50}", f"module_{i}.adoc")
+        path = os.path.join(root, relative)
+        info.total_bytes += _write(path, _module_content(rng, spec, i, module_ids))
+        info.modules.append(path)
+        module_paths.append(relative)
+
+    # Assembly chain: each level includes its share of modules and the next level
+    depth = max(spec.include_depth, 1)
+    share = -(-len(module_paths) // depth) if module_paths else 0
+    for level in range(depth, 0, -1):
+        included = module_paths[(level - 1) * share : level * share]
+        lines = [
+            ":_mod-docs-content-type: ASSEMBLY",
+            f'[id="assembly_{level}"]',
+            f"= Assembly {level}",
+            "",
+        ]
+        lines.extend(f"include::../{path}[]\n" for path in included)
+        if level < depth:
+            lines.append(f"include::assembly_{level + 1}.adoc[]\n")
+        path = os.path.join(root, "assemblies", f"assembly_{level}.adoc")
+        info.total_bytes += _write(path, "\n".join(lines) + "\n")
+        info.assemblies.insert(0, path)
+
+    master = [
+        '[id="master"]',
+        "= Synthetic Benchmark Guide",
+        "",
+        "include::assemblies/assembly_1.adoc[]",
+        "",
+    ]
+    info.total_bytes += _write(info.master, "\n".join(master))
+
+    # Generated build output, excluded by DirectoryConfig filtering
+    for i in range(int(spec.files * spec.generated_dirs)):
+        source = info.modules[rng.randrange(len(info.modules))]
+        path = os.path.join(root, "_build", "html", f"group_{i // 50}", f"copy_{i}.adoc")
+        with open(source, "r", encoding="utf-8") as f:
+            info.total_bytes += _write(path, f.read())
+        info.generated.append(path)
+
+    return info
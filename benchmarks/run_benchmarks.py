@@ -0,0 +1,576 @@
+#!/usr/bin/env python3
+"""
+Benchmark the directory processing path of each plugin on a synthetic corpus.
+
+Each benchmark gets a fresh copy of the generated corpus (copying is not
+timed), runs with the copy as the working directory, and processes it the
+way the CLI does: directory ".", recursive. Timings are repeated and the
+median is reported. Results are written as JSON and can be compared with a
+stored baseline:
+
+    python -m benchmarks.run_benchmarks --output results.json
+    python -m benchmarks.run_benchmarks --update-baseline
+    python -m benchmarks.run_benchmarks --fail-on-regression --tolerance 0.25
+
+With --memory, each benchmark also gets one untimed run with allocation
+tracing, recording its peak traced memory and the sizes of the plugin data
+structures; peaks are compared with the baseline like timings.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager, redirect_stdout
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Allow running as a script from the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from asciidoc_dita_toolkit.asciidoc_dita.memory_profiling import (  # noqa: E402
+    format_bytes,
+)
+from asciidoc_dita_toolkit.asciidoc_dita.profiling import (  # noqa: E402
+    profiling_session,
+)
+from benchmarks.corpus import CorpusSpec, generate_corpus  # noqa: E402
+
+RESULTS_FORMAT = "adt-benchmark-results"
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of one benchmark."""
+
+    name: str
+    repeats: int
+    median: float
+    minimum: float
+    maximum: float
+    files: int
+    bytes: int
+    details: Dict[str, Any] = field(default_factory=dict)
+    peak_memory: Optional[int] = None  # Bytes, with --memory
+    structures: Dict[str, int] = field(default_factory=dict)  # Name -> bytes
+
+    @property
+    def mb_per_second(self) -> float:
+        """Throughput based on the median time."""
+        return self.bytes / (1024 * 1024) / self.median if self.median else 0.0
+
+
+@dataclass
+class Comparison:
+    """A benchmark's median time, and peak memory, compared with the baseline."""
+
+    name: str
+    baseline: float
+    current: float
+    ratio: float
+    regression: bool
+    memory_ratio: Optional[float] = None
+    memory_regression: bool = False
+
+
+# Benchmarks -----------------------------------------------------------------
+#
+# Each benchmark runs in the corpus copy and returns a small dictionary of
+# details (counts reported by the plugin) that ends up in the results file.
+
+
+def bench_entity_reference() -> Dict[str, Any]:
+    from asciidoc_dita_toolkit.asciidoc_dita.plugins.EntityReference import (
+        EntityReferenceModule,
+    )
+
+    module = EntityReferenceModule()
+    module.initialize({})
+    result = module.execute({"directory": ".", "recursive": True})
+    return {
+        "files_processed": result["files_processed"],
+        "entities_replaced": result["entities_replaced"],
+    }
+
+
+def bench_content_type() -> Dict[str, Any]:
+    from asciidoc_dita_toolkit.asciidoc_dita.plugins.ContentType import (
+        ContentTypeModule,
+    )
+
+    module = ContentTypeModule()
+    module.initialize({"batch_mode": True, "quiet_mode": True})
+    result = module.execute({"directory": ".", "recursive": True})
+    return {"files_processed": result["files_processed"]}
+
+
+def bench_context_analyzer() -> Dict[str, Any]:
+    from asciidoc_dita_toolkit.asciidoc_dita.plugins.ContextAnalyzer import (
+        ContextAnalyzerModule,
+    )
+
+    module = ContextAnalyzerModule()
+    module.initialize({})
+    result = module.execute({"directory": ".", "recursive": True})
+    return {
+        "files_analyzed": result["files_analyzed"],
+        "context_ids_found": result["context_ids_found"],
+        "collisions_detected": result["collisions_detected"],
+    }
+
+
+def bench_context_migrator() -> Dict[str, Any]:
+    from asciidoc_dita_toolkit.asciidoc_dita.plugins.ContextMigrator import (
+        ContextMigratorModule,
+    )
+
+    module = ContextMigratorModule()
+    module.initialize({"create_backups": False})
+    result = module.execute({"directory": ".", "recursive": True})
+    return {
+        "files_processed": result["files_processed"],
+        "successful_migrations": result["successful_migrations"],
+    }
+
+
+def bench_cross_reference() -> Dict[str, Any]:
+    from asciidoc_dita_toolkit.asciidoc_dita.plugins.CrossReference import (
+        CrossReferenceModule,
+    )
+
+    module = CrossReferenceModule()
+    module.initialize({"master_file": "master.adoc"})
+    result = module.execute({"directory": ".", "recursive": True})
+    return {
+        "files_processed": result["files_processed"],
+        "fixed_xrefs_count": result["fixed_xrefs_count"],
+    }
+
+
+def bench_cross_reference_validate() -> Dict[str, Any]:
+    from asciidoc_dita_toolkit.asciidoc_dita.plugins.CrossReference import (
+        CrossReferenceModule,
+    )
+
+    module = CrossReferenceModule()
+    module.initialize({"master_file": "master.adoc", "check_only": True})
+    result = module.execute({"directory": ".", "recursive": True})
+    return {
+        "files_processed": result["files_processed"],
+        "broken_xrefs_count": result["broken_xrefs_count"],
+    }
+
+
+def bench_example_block() -> Dict[str, Any]:
+    # ExampleBlock has no module class; use its batch processor directly
+    from asciidoc_dita_toolkit.asciidoc_dita.plugins.ExampleBlock import (
+        create_processor,
+        process_example_block_file,
+    )
+    from asciidoc_dita_toolkit.asciidoc_dita.workflow_utils import process_adoc_files
+
+    class Args:
+        file = None
+        directory = "."
+        recursive = True
+
+    processor = create_processor(batch_mode=True, quiet_mode=True)
+    processed = []
+    process_adoc_files(
+        Args(),
+        lambda filepath: processed.append(
+            process_example_block_file(filepath, processor)
+        ),
+    )
+    return {"files_processed": len(processed)}
+
+
+def bench_directory_config() -> Dict[str, Any]:
+    from asciidoc_dita_toolkit.asciidoc_dita.plugins.DirectoryConfig import (
+        get_filtered_adoc_files,
+    )
+
+    config = {
+        "repoRoot": os.getcwd(),
+        "includeDirs": [],
+        "excludeDirs": ["_build"],
+    }
+    files = get_filtered_adoc_files(".", config)
+    return {"files_found": len(files)}
+
+
+BENCHMARKS: Dict[str, Callable[[], Dict[str, Any]]] = {
+    "EntityReference": bench_entity_reference,
+    "ContentType": bench_content_type,
+    "ContextAnalyzer": bench_context_analyzer,
+    "ContextMigrator": bench_context_migrator,
+    "CrossReference": bench_cross_reference,
+    "CrossReference.validate": bench_cross_reference_validate,
+    "ExampleBlock": bench_example_block,
+    "DirectoryConfig.filter": bench_directory_config,
+}
+
+
+# Runner ---------------------------------------------------------------------
+
+
+@contextmanager
+def working_directory(path: str):
+    """Temporarily change the working directory."""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def measure_memory(
+    benchmark: Callable[[], Dict[str, Any]], work_dir: str
+) -> Tuple[int, Dict[str, int]]:
+    """
+    Run a benchmark once with allocation tracing, in an existing corpus copy.
+
+    Returns:
+        Peak traced memory, and the size of each plugin data structure
+    """
+    with working_directory(work_dir), redirect_stdout(io.StringIO()):
+        with profiling_session(stream=io.StringIO(), memory=True) as profiler:
+            benchmark()
+    memory = profiler.memory
+    structures = {name: size.bytes for name, size in memory.structures.items()}
+    return memory.peak, structures
+
+
+def run_benchmark(
+    name: str,
+    corpus_root: str,
+    scratch_dir: str,
+    repeats: int,
+    total_bytes: int,
+    memory: bool = False,
+) -> BenchmarkResult:
+    """
+    Run one benchmark several times, each on a fresh copy of the corpus.
+
+    Args:
+        name: Benchmark name, a key of BENCHMARKS
+        corpus_root: Directory holding the pristine corpus
+        scratch_dir: Directory for the per-run copies
+        repeats: Number of timed runs
+        total_bytes: Corpus size, recorded with the result
+        memory: Whether to add an untimed run measuring memory
+
+    Returns:
+        BenchmarkResult with the timings of all runs
+    """
+    benchmark = BENCHMARKS[name]
+    timings = []
+    details: Dict[str, Any] = {}
+    files = 0
+    peak_memory = None
+    structures: Dict[str, int] = {}
+
+    for run in range(repeats + memory):
+        work_dir = os.path.join(scratch_dir, f"{name}-{run}")
+        shutil.copytree(corpus_root, work_dir)
+        files = sum(
+            1
+            for _, _, names in os.walk(work_dir)
+            for filename in names
+            if filename.endswith(".adoc")
+        )
+        try:
+            if run == repeats:
+                peak_memory, structures = measure_memory(benchmark, work_dir)
+                continue
+            with working_directory(work_dir), redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                details = benchmark()
+                timings.append(time.perf_counter() - start)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    return BenchmarkResult(
+        name=name,
+        repeats=repeats,
+        median=statistics.median(timings),
+        minimum=min(timings),
+        maximum=max(timings),
+        files=files,
+        bytes=total_bytes,
+        details=details,
+        peak_memory=peak_memory,
+        structures=structures,
+    )
+
+
+def run_benchmarks(
+    spec: CorpusSpec, names: List[str], repeats: int = 3, memory: bool = False
+) -> Dict[str, Any]:
+    """
+    Generate a corpus and run the selected benchmarks on it.
+
+    Args:
+        spec: Shape of the synthetic corpus
+        names: Benchmarks to run, keys of BENCHMARKS
+        repeats: Number of timed runs per benchmark
+        memory: Whether to also measure each benchmark's memory
+
+    Returns:
+        Results dictionary, ready to be saved as JSON
+    """
+    scratch_dir = tempfile.mkdtemp(prefix="adt-bench-")
+    try:
+        info = generate_corpus(os.path.join(scratch_dir, "corpus"), spec)
+        results = [
+            run_benchmark(
+                name, info.root, scratch_dir, repeats, info.total_bytes, memory
+            )
+            for name in names
+        ]
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    return {
+        "format": RESULTS_FORMAT,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": spec.to_dict(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+
+
+def compare_results(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = 0.2,
+    memory_tolerance: float = 0.2,
+) -> List[Comparison]:
+    """
+    Compare median timings, and peak memory, with a baseline.
+
+    A benchmark regresses when its median is more than `tolerance` (a
+    fraction, 0.2 meaning 20%) slower than the baseline median. Peak memory
+    is compared the same way when both sides measured it. Benchmarks
+    missing from either side are not compared.
+
+    Args:
+        results: Results dictionary from run_benchmarks()
+        baseline: Results dictionary loaded from the baseline file
+        tolerance: Allowed slowdown before a benchmark counts as a regression
+        memory_tolerance: Allowed growth of the peak memory
+
+    Returns:
+        List of Comparison, in the order of the current results
+    """
+    comparisons = []
+    for name, result in results["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or not previous["median"]:
+            continue
+        ratio = result["median"] / previous["median"]
+        comparison = Comparison(
+            name=name,
+            baseline=previous["median"],
+            current=result["median"],
+            ratio=ratio,
+            regression=ratio > 1 + tolerance,
+        )
+        if result.get("peak_memory") and previous.get("peak_memory"):
+            comparison.memory_ratio = result["peak_memory"] / previous["peak_memory"]
+            comparison.memory_regression = (
+                comparison.memory_ratio > 1 + memory_tolerance
+            )
+        comparisons.append(comparison)
+    return comparisons
+
+
+def format_results(
+    results: Dict[str, Any], comparisons: Optional[List[Comparison]] = None
+) -> str:
+    """
+    Format benchmark results, and the baseline comparison if any, as a table.
+
+    Args:
+        results: Results dictionary from run_benchmarks()
+        comparisons: Optional output of compare_results()
+
+    Returns:
+        Formatted text report
+    """
+    by_name = {comparison.name: comparison for comparison in comparisons or []}
+    memory = any(r.get("peak_memory") for r in results["results"].values())
+    corpus = results["corpus"]
+    header = f"{'Benchmark':<26}{'Median':>10}{'Min':>10}{'Max':>10}{'MB/s':>8}"
+    if memory:
+        header += f"{'Peak':>12}"
+    lines = [
+        "=== Benchmark Results ===",
+        f"Corpus: {corpus['files']} modules of ~{corpus['file_size']} bytes, "
+        f"include depth {corpus['include_depth']}, seed {corpus['seed']}",
+        "",
+        header + f"{'Baseline':>11}",
+    ]
+    for name, result in results["results"].items():
+        seconds = result["median"]
+        throughput = result["bytes"] / (1024 * 1024) / seconds if seconds else 0.0
+        line = (
+            f"{name:<26}{seconds:>9.3f}s{result['minimum']:>9.3f}s"
+            f"{result['maximum']:>9.3f}s{throughput:>8.1f}"
+        )
+        if memory:
+            line += f"{format_bytes(result.get('peak_memory') or 0):>12}"
+        comparison = by_name.get(name)
+        if comparison:
+            flag = "  REGRESSION" if comparison.regression else ""
+            line += f"{comparison.ratio:>10.2f}x{flag}"
+            if comparison.memory_ratio is not None:
+                flag = "  MEMORY REGRESSION" if comparison.memory_regression else ""
+                line += f"  memory {comparison.memory_ratio:.2f}x{flag}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """
+    Load a results or baseline file.
+
+    Raises:
+        ValueError: If the file is not a benchmark results file
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("format") != RESULTS_FORMAT:
+        raise ValueError(f"{path} is not a benchmark results file")
+    return data
+
+
+def save_results(results: Dict[str, Any], path: str) -> None:
+    """Write a results dictionary as JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    defaults = CorpusSpec()
+    parser = argparse.ArgumentParser(
+        description="Benchmark the AsciiDoc DITA Toolkit plugins on a synthetic corpus"
+    )
+    corpus = parser.add_argument_group("corpus")
+    corpus.add_argument("--files", type=int, default=defaults.files)
+    corpus.add_argument("--file-size", type=int, default=defaults.file_size)
+    corpus.add_argument("--include-depth", type=int, default=defaults.include_depth)
+    corpus.add_argument("--xref-density", type=float, default=defaults.xref_density)
+    corpus.add_argument(
+        "--context-id-ratio", type=float, default=defaults.context_id_ratio
+    )
+    corpus.add_argument(
+        "--entity-density", type=float, default=defaults.entity_density
+    )
+    corpus.add_argument("--seed", type=int, default=defaults.seed)
+
+    parser.add_argument(
+        "--only",
+        action="append",
+        choices=sorted(BENCHMARKS),
+        help="Run only this benchmark (can be repeated)",
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=3, help="Timed runs per benchmark (default: 3)"
+    )
+    parser.add_argument("--output", "-o", help="Write results as JSON to this file")
+    parser.add_argument(
+        "--baseline",
+        default=DEFAULT_BASELINE,
+        help="Baseline results to compare with (default: benchmarks/baseline.json)",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Save the results as the new baseline",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown against the baseline, as a fraction (default: 0.2)",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Also measure each benchmark's peak memory in an untimed run",
+    )
+    parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed peak memory growth against the baseline (default: 0.2)",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help=(
+            "Exit with status 1 if a benchmark is slower, or uses more memory, "
+            "than the tolerances allow"
+        ),
+    )
+    args = parser.parse_args(argv)
+
+    spec = CorpusSpec(
+        files=args.files,
+        file_size=args.file_size,
+        include_depth=args.include_depth,
+        xref_density=args.xref_density,
+        context_id_ratio=args.context_id_ratio,
+        entity_density=args.entity_density,
+        seed=args.seed,
+    )
+    results = run_benchmarks(
+        spec, args.only or list(BENCHMARKS), args.repeats, args.memory
+    )
+
+    comparisons = None
+    if not args.update_baseline and os.path.exists(args.baseline):
+        try:
+            baseline = load_results(args.baseline)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        if baseline.get("corpus") != results["corpus"]:
+            print(
+                "Warning: baseline was recorded with a different corpus",
+                file=sys.stderr,
+            )
+        comparisons = compare_results(
+            results, baseline, args.tolerance, args.memory_tolerance
+        )
+
+    print(format_results(results, comparisons))
+
+    if args.output:
+        save_results(results, args.output)
+    if args.update_baseline:
+        save_results(results, args.baseline)
+        print(f"\nBaseline saved to {args.baseline}")
+
+    if args.fail_on_regression and any(
+        c.regression or c.memory_regression for c in comparisons or []
+    ):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
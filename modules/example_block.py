@@ -116,6 +116,7 @@ class ExampleBlockModule(ADTModule):
             return {
                 "module_name": self.name,
                 "files_processed": files_processed,
+                "files_skipped": processor.files_skipped,
                 "example_blocks_processed": example_blocks_processed,
                 "batch_mode": self.batch_mode,
                 "success": True,
@@ -12,6 +12,9 @@ import os
 import sys
 from pathlib import Path
 
+from asciidoc_dita_toolkit.asciidoc_dita.cli_utils import add_profile_argument
+from asciidoc_dita_toolkit.asciidoc_dita.profiling import profiling_session
+
 from .module_sequencer import ModuleSequencer
 
 
@@ -399,6 +402,12 @@ def create_legacy_subcommand(subparsers, name, plugin_info):
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable verbose output"
     )
+    add_profile_argument(parser)
+
+    # Let the plugin add its own options, if it declares any
+    add_arguments = getattr(plugin_info["plugin"], "add_arguments", None)
+    if callable(add_arguments):
+        add_arguments(parser)
 
     # Set the function to call
     def run_legacy_plugin(args):
@@ -435,6 +444,7 @@ def create_new_plugin_subcommand(subparsers, name, plugin_info):
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable verbose output"
     )
+    add_profile_argument(parser)
 
     # Set the function to call
     def run_new_plugin(args):
@@ -579,7 +589,12 @@ def main(args=None):
     # Execute the selected command
     if hasattr(parsed_args, "func"):
         try:
-            parsed_args.func(parsed_args)
+            with profiling_session(
+                getattr(parsed_args, "profile", None),
+                top_files=getattr(parsed_args, "profile_top", None),
+                memory=getattr(parsed_args, "memory_profile", False),
+            ):
+                parsed_args.func(parsed_args)
         except Exception as e:
             print(f"Error executing command: {e}", file=sys.stderr)
             sys.exit(1)
@@ -26,6 +26,10 @@ from asciidoc_dita_toolkit.asciidoc_dita.plugins.DirectoryConfig import (
     load_directory_config,
     apply_directory_filters,
     get_filtered_adoc_files,
+    DirectoryPatternMatcher,
+    PathPrefixIndex,
+    clear_directory_config_cache,
+    get_compiled_directory_config,
 )
 from asciidoc_dita_toolkit.asciidoc_dita.config_utils import (
     load_json_config as load_config_file,
@@ -233,6 +237,205 @@ class TestDirectoryFiltering(unittest.TestCase):
                 ]
                 self.assertGreater(len(warning_calls), 0)
 
+    def _make_tree(self, root, relative_files):
+        """Create empty .adoc files under root and return their paths."""
+        paths = []
+        for relative in relative_files:
+            path = os.path.join(root, relative)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write("= Test\n")
+            paths.append(path)
+        return paths
+
+    def test_path_prefix_index(self):
+        """Test that the prefix index matches whole path components only."""
+        index = PathPrefixIndex(["/repo/docs/drafts", "/repo/tmp", "/repo/tmp/nested"])
+
+        self.assertEqual(index.size, 2)
+        self.assertTrue(index.covers("/repo/docs/drafts"))
+        self.assertTrue(index.covers("/repo/docs/drafts/a/b.adoc"))
+        self.assertTrue(index.covers("/repo/tmp/nested/c.adoc"))
+        self.assertFalse(index.covers("/repo/docs/drafts2/a.adoc"))
+        self.assertFalse(index.covers("/repo/docs"))
+        self.assertFalse(PathPrefixIndex())
+
+    def test_get_filtered_adoc_files_prunes_excluded_dirs(self):
+        """Test that excluded subtrees are never walked."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            kept = self._make_tree(tmpdir, ["docs/a.adoc", "docs/drafts/b.adoc"])
+            self._make_tree(tmpdir, ["drafts/c.adoc", "drafts/deep/d.adoc"])
+            config = {
+                "repoRoot": tmpdir,
+                "includeDirs": [],
+                "excludeDirs": ["drafts"],
+            }
+
+            walked = []
+            real_walk = os.walk
+
+            def recording_walk(top, *args, **kwargs):
+                for entry in real_walk(top, *args, **kwargs):
+                    walked.append(os.path.normpath(entry[0]))
+                    yield entry
+
+            cwd = os.getcwd()
+            os.chdir(tmpdir)
+            try:
+                with patch("os.walk", recording_walk):
+                    files = get_filtered_adoc_files(".", config)
+            finally:
+                os.chdir(cwd)
+
+            self.assertEqual(
+                sorted(os.path.normpath(os.path.join(tmpdir, f)) for f in files), sorted(kept)
+            )
+            self.assertNotIn("drafts", walked)
+            self.assertNotIn(os.path.join("drafts", "deep"), walked)
+            self.assertIn(os.path.join("docs", "drafts"), walked)
+
+    def test_directory_pattern_matcher(self):
+        """Test gitignore-style directory patterns."""
+        matcher = DirectoryPatternMatcher(
+            ["**/_build/**", "*/snippets/generated", "tmp?"], "/repo"
+        )
+
+        self.assertTrue(matcher.matches("/repo/_build"))
+        self.assertTrue(matcher.matches("/repo/a/b/_build"))
+        self.assertTrue(matcher.matches("/repo/guide/snippets/generated"))
+        self.assertFalse(matcher.matches("/repo/a/b/snippets/generated"))
+        self.assertTrue(matcher.matches("/repo/deep/tmp1"))
+        self.assertFalse(matcher.matches("/repo/tmp12"))
+        self.assertFalse(matcher.matches("/elsewhere/_build"))
+        self.assertTrue(matcher.covers("/repo/a/_build/html/x"))
+        self.assertFalse(matcher.covers("/repo/a/build/html"))
+
+    def test_get_filtered_adoc_files_with_patterns(self):
+        """Test include and exclude patterns during discovery."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            kept = self._make_tree(
+                tmpdir, ["guides/one/a.adoc", "guides/two/sub/b.adoc"]
+            )
+            self._make_tree(
+                tmpdir,
+                [
+                    "guides/one/_build/c.adoc",
+                    "guides/two/snippets/generated/d.adoc",
+                    "other/e.adoc",
+                ],
+            )
+            config = {
+                "repoRoot": tmpdir,
+                "includeDirs": ["guides/*"],
+                "excludeDirs": ["**/_build/**", "guides/*/snippets/generated"],
+            }
+
+            cwd = os.getcwd()
+            os.chdir(tmpdir)
+            try:
+                files = get_filtered_adoc_files(".", config)
+                custom = get_filtered_adoc_files(
+                    ".",
+                    config,
+                    lambda root, recursive: [
+                        os.path.join(dirpath, name)
+                        for dirpath, _, names in os.walk(root)
+                        for name in names
+                    ],
+                )
+                filtered_dirs = apply_directory_filters(tmpdir, config)
+            finally:
+                os.chdir(cwd)
+
+            self.assertEqual(sorted(files), sorted(kept))
+            self.assertEqual(sorted(custom), sorted(kept))
+            self.assertEqual(
+                filtered_dirs,
+                [os.path.join(tmpdir, "guides", "one"), os.path.join(tmpdir, "guides", "two")],
+            )
+
+    def test_get_filtered_adoc_files_overlapping_includes(self):
+        """Test that nested and aliased include directories are walked once."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = self._make_tree(
+                tmpdir, ["docs/a.adoc", "docs/guide/b.adoc", "other/c.adoc"]
+            )
+            os.symlink(os.path.join(tmpdir, "docs"), os.path.join(tmpdir, "alias"))
+            config = {
+                "repoRoot": tmpdir,
+                "includeDirs": ["docs/guide", "docs", "alias", "docs/"],
+                "excludeDirs": [],
+            }
+            walked_roots = []
+
+            def finder(root, recursive):
+                walked_roots.append(root)
+                return [
+                    os.path.join(dirpath, name)
+                    for dirpath, _, names in os.walk(root)
+                    for name in names
+                ]
+
+            with patch(
+                'asciidoc_dita_toolkit.asciidoc_dita.plugins.DirectoryConfig.logger'
+            ) as mock_logger:
+                files = get_filtered_adoc_files(tmpdir, config, finder)
+
+            self.assertEqual(walked_roots, [os.path.join(tmpdir, "docs")])
+            self.assertEqual(sorted(files), sorted(paths[:2]))
+            self.assertIn("Skipped 3 redundant", str(mock_logger.info.call_args))
+
+            # Hard links in disjoint roots are reported once
+            os.link(paths[2], os.path.join(tmpdir, "docs", "c.adoc"))
+            config["includeDirs"] = ["docs", "other"]
+            files = get_filtered_adoc_files(tmpdir, config, finder)
+            self.assertEqual(len(files), 3)
+
+    def test_compiled_config_cached_until_file_changes(self):
+        """Test that the compiled configuration is reused until its file changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._make_tree(tmpdir, ["docs/a.adoc", "drafts/b.adoc"])
+            config_path = os.path.join(tmpdir, ".adtconfig.json")
+            config = {"repoRoot": tmpdir, "includeDirs": [], "excludeDirs": ["drafts"]}
+            with open(config_path, "w") as f:
+                json.dump(config, f)
+
+            cwd = os.getcwd()
+            os.chdir(tmpdir)
+            clear_directory_config_cache()
+            try:
+                with patch.dict(os.environ, {"HOME": tmpdir}):
+                    first = get_compiled_directory_config()
+                    second = get_compiled_directory_config()
+                    files = get_filtered_adoc_files(".", first)
+
+                    config["excludeDirs"] = ["docs", "drafts"]
+                    with open(config_path, "w") as f:
+                        json.dump(config, f)
+                    os.utime(config_path, ns=(1, 1))
+                    third = get_compiled_directory_config()
+            finally:
+                os.chdir(cwd)
+                clear_directory_config_cache()
+
+            self.assertIs(first, second)
+            self.assertEqual([os.path.normpath(f) for f in files], [os.path.join("docs", "a.adoc")])
+            self.assertIsNot(third, first)
+            self.assertEqual(third.exclude_dirs, ["docs", "drafts"])
+            self.assertTrue(third.excluded.excludes(os.path.join(tmpdir, "docs")))
+
+    def test_get_filtered_adoc_files_custom_finder(self):
+        """Test that results from a custom finder are filtered by the index."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = self._make_tree(tmpdir, ["docs/a.adoc", "temp/b.adoc"])
+            config = {"repoRoot": tmpdir, "includeDirs": [], "excludeDirs": ["temp"]}
+
+            files = get_filtered_adoc_files(
+                tmpdir, config, lambda root, recursive: list(paths)
+            )
+
+            self.assertEqual(files, [paths[0]])
+
 
 class TestDirectoryConfigFixtures(unittest.TestCase):
     """Test cases using fixture files."""
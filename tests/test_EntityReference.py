@@ -22,7 +22,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from asciidoc_dita_toolkit.asciidoc_dita.plugins.EntityReference import (
     process_file,
+    process_file_streaming,
     replace_entities,
+    replace_entities_in_text,
+    replace_outside_comments,
 )
 from tests.asciidoc_testkit import (
     get_same_dir_fixture_pairs,
@@ -96,6 +99,132 @@ class TestEntityReference(unittest.TestCase):
         result = replace_entities(text)
         self.assertEqual(result, text)
 
+    def test_whole_buffer_replacement_counts_unknown(self):
+        """Test that the buffer engine aggregates unknown entities silently."""
+        from collections import Counter
+
+        unknown = Counter()
+        calls = []
+        with patch("builtins.print") as mock_print:
+            result = replace_entities_in_text(
+                "&copy; &foo;\n&quot; &foo; &bar;\nplain",
+                lambda entity, replaced: calls.append((entity, replaced)),
+                unknown,
+            )
+
+        mock_print.assert_not_called()
+        self.assertEqual(result, "{copy} &foo;\n&quot; &foo; &bar;\nplain")
+        self.assertEqual(unknown, Counter({"foo": 2, "bar": 1}))
+        self.assertEqual(calls[0], ("copy", True))
+        self.assertEqual(len(calls), 5)
+
+    def test_process_file_aggregates_warnings(self):
+        """Test that process_file reports each unknown entity once with a count."""
+        import tempfile
+
+        content = "&foo; &copy;\r\n// &foo;\r\n////\r\n&copy;\r\n////\r\n&foo;\r\n"
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "test.adoc")
+            with open(path, "w", newline="") as f:
+                f.write(content)
+
+            with patch("builtins.print") as mock_print:
+                process_file(path)
+
+            with open(path, newline="") as f:
+                result = f.read()
+
+        self.assertEqual(
+            result,
+            "&foo; {copy}\r\n// &foo;\r\n////\r\n&copy;\r\n////\r\n&foo;\r\n",
+        )
+        printed = [call.args[0] for call in mock_print.call_args_list]
+        self.assertIn("Warning: No AsciiDoc attribute for &foo; (2 occurrences)", printed)
+        self.assertEqual(sum("Warning" in line for line in printed), 1)
+
+    def test_replace_outside_comment_spans(self):
+        """Test span-based comment masking with mixed and bare CR line endings."""
+        text = "&copy;\r  // &copy;\r////\n&copy;\r\n ////\n&copy;\n////\n&trade;"
+        result, in_block = replace_outside_comments(text)
+
+        self.assertEqual(
+            result, "{copy}\r  // &copy;\r////\n&copy;\r\n ////\n{copy}\n////\n&trade;"
+        )
+        self.assertTrue(in_block)
+
+        # Block comment state carries over into the next piece of text
+        result, in_block = replace_outside_comments("&copy;\n////\n&copy;\n", in_block_comment=True)
+        self.assertEqual(result, "&copy;\n////\n{copy}\n")
+        self.assertFalse(in_block)
+
+    def test_streaming_matches_in_memory(self):
+        """Test that chunked streaming gives the same result as whole-file processing."""
+        import tempfile
+
+        content = (
+            "Caf\u00e9 &copy; &foo;\r\n// &copy;\r\n////\r&copy;\r////\n"
+            "&mdash; &amp; \u65e5\u672c\n&trade;"
+        ) * 20
+        with tempfile.TemporaryDirectory() as temp_dir:
+            expected_path = os.path.join(temp_dir, "expected.adoc")
+            with open(expected_path, "w", encoding="utf-8", newline="") as f:
+                f.write(content)
+            with patch("builtins.print"):
+                process_file(expected_path)
+            with open(expected_path, encoding="utf-8", newline="") as f:
+                expected = f.read()
+
+            path = os.path.join(temp_dir, "streamed.adoc")
+            for chunk_size in (1, 2, 5, 64):
+                with self.subTest(chunk_size=chunk_size):
+                    with open(path, "w", encoding="utf-8", newline="") as f:
+                        f.write(content)
+                    unknown = process_file_streaming(path, chunk_size=chunk_size)
+                    with open(path, encoding="utf-8", newline="") as f:
+                        self.assertEqual(f.read(), expected)
+                    self.assertEqual(unknown["foo"], 20)
+
+            self.assertEqual(sorted(os.listdir(temp_dir)), ["expected.adoc", "streamed.adoc"])
+
+    def test_process_file_streams_above_threshold(self):
+        """Test that process_file switches to streaming for large files."""
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "big.adoc")
+            with open(path, "w", newline="") as f:
+                f.write("&copy;\n")
+
+            with patch(
+                "asciidoc_dita_toolkit.asciidoc_dita.plugins.EntityReference.process_file_streaming",
+                wraps=process_file_streaming,
+            ) as mock_stream, patch("builtins.print"):
+                process_file(path, stream_threshold=0)
+
+            mock_stream.assert_called_once()
+            with open(path, newline="") as f:
+                self.assertEqual(f.read(), "{copy}\n")
+
+    def test_process_file_skips_files_without_ampersand(self):
+        """Test that files without an "&" are skipped before decoding."""
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "plain.adoc")
+            # Not valid UTF-8, so decoding the file would report an error
+            with open(path, "wb") as f:
+                f.write(b"Caf\xe9 {copy}\r\n")
+
+            with patch("builtins.print") as mock_print:
+                self.assertFalse(process_file(path))
+                with open(path, "ab") as f:
+                    f.write(b"&copy;\n")
+                self.assertTrue(process_file(path))
+
+        printed = [call.args[0] for call in mock_print.call_args_list]
+        self.assertTrue(printed[0].startswith("Skipped"))
+        self.assertTrue(printed[1].startswith("Error processing"))
+
     def test_fixture_based_tests(self):
         """Run tests based on fixture files if they exist."""
         if os.path.exists(FIXTURE_DIR):
@@ -0,0 +1,119 @@
+"""
+Test suite for the benchmark suite's corpus generator and baseline comparison.
+
+To run: python3 -m pytest tests/test_benchmarks.py -v
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    from benchmarks.corpus import CorpusSpec, generate_corpus
+    from benchmarks.run_benchmarks import RESULTS_FORMAT, compare_results
+except ImportError as e:
+    print(f"Warning: Could not import benchmarks: {e}")
+    generate_corpus = None
+
+
+def read_tree(root):
+    """Return {relative path: content} for every file under root."""
+    contents = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            with open(path, 'rb') as f:
+                contents[os.path.relpath(path, root)] = f.read()
+    return contents
+
+
+@unittest.skipIf(generate_corpus is None, "benchmarks could not be imported")
+class TestBenchmarkCorpus(unittest.TestCase):
+    """Test cases for the synthetic corpus generator."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_same_spec_gives_identical_corpus(self):
+        """Test that generation is deterministic for a given seed."""
+        spec = CorpusSpec(files=12, file_size=1024, include_depth=2)
+        generate_corpus(os.path.join(self.temp_dir, 'a'), spec)
+        generate_corpus(os.path.join(self.temp_dir, 'b'), spec)
+        generate_corpus(
+            os.path.join(self.temp_dir, 'c'),
+            CorpusSpec(files=12, file_size=1024, include_depth=2, seed=7),
+        )
+
+        first = read_tree(os.path.join(self.temp_dir, 'a'))
+        self.assertEqual(first, read_tree(os.path.join(self.temp_dir, 'b')))
+        self.assertNotEqual(first, read_tree(os.path.join(self.temp_dir, 'c')))
+
+    def test_corpus_follows_spec(self):
+        """Test the include chain, context IDs and generated copies."""
+        spec = CorpusSpec(files=20, include_depth=4, context_id_ratio=1.0)
+        info = generate_corpus(self.temp_dir, spec)
+
+        self.assertEqual(len(info.modules), 20)
+        self.assertEqual(len(info.assemblies), 4)
+        self.assertEqual(len(info.generated), 2)
+        self.assertEqual(
+            sum(os.path.getsize(path) for path in info.files), info.total_bytes
+        )
+
+        with open(info.assemblies[-1], encoding='utf-8') as f:
+            last = f.read()
+        self.assertNotIn('include::assembly_', last)
+        with open(info.modules[0], encoding='utf-8') as f:
+            self.assertIn('[id="module_0_{context}"]', f.read())
+
+
+@unittest.skipIf(generate_corpus is None, "benchmarks could not be imported")
+class TestBaselineComparison(unittest.TestCase):
+    """Test cases for comparing results with a baseline."""
+
+    def results(self, **medians):
+        return {
+            'format': RESULTS_FORMAT,
+            'results': {name: {'median': value} for name, value in medians.items()},
+        }
+
+    def test_only_slowdowns_beyond_tolerance_regress(self):
+        """Test the tolerance and that unmatched benchmarks are skipped."""
+        baseline = self.results(EntityReference=1.0, ContentType=1.0)
+        current = self.results(EntityReference=1.1, ContentType=1.5, ExampleBlock=2.0)
+
+        comparisons = compare_results(current, baseline, tolerance=0.2)
+
+        self.assertEqual(
+            [(c.name, c.regression) for c in comparisons],
+            [('EntityReference', False), ('ContentType', True)],
+        )
+        self.assertAlmostEqual(comparisons[1].ratio, 1.5)
+
+    def test_memory_growth_beyond_tolerance_regresses(self):
+        """Test peak memory comparison, skipped when a side did not measure it."""
+        baseline = self.results(EntityReference=1.0, ContentType=1.0)
+        baseline['results']['EntityReference']['peak_memory'] = 1000
+        baseline['results']['ContentType']['peak_memory'] = 1000
+        current = self.results(EntityReference=1.0, ContentType=1.0)
+        current['results']['EntityReference']['peak_memory'] = 1500
+
+        comparisons = compare_results(current, baseline, memory_tolerance=0.2)
+
+        self.assertTrue(comparisons[0].memory_regression)
+        self.assertAlmostEqual(comparisons[0].memory_ratio, 1.5)
+        self.assertFalse(comparisons[0].regression)
+        self.assertIsNone(comparisons[1].memory_ratio)
+        self.assertFalse(comparisons[1].memory_regression)
+
+
+if __name__ == '__main__':
+    unittest.main()
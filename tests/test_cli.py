@@ -2,6 +2,7 @@
 Test suite for the CLI interface of the AsciiDoc DITA toolkit.
 """
 
+import argparse
 import os
 import re
 import sys
@@ -14,6 +15,17 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from asciidoc_dita_toolkit.asciidoc_dita import toolkit
 
+try:
+    from asciidoc_dita_toolkit.asciidoc_dita.plugins import (
+        ContextAnalyzer,
+        ContextMigrator,
+        CrossReference,
+    )
+    from src.adt_core.cli import create_legacy_subcommand
+except ImportError as e:
+    print(f"Warning: Could not import adt CLI: {e}")
+    create_legacy_subcommand = None
+
 
 class TestCLI(unittest.TestCase):
     """Test cases for the CLI interface."""
@@ -157,5 +169,64 @@ class TestCLI(unittest.TestCase):
             self.assertEqual(plugins, [])
 
 
+@unittest.skipIf(create_legacy_subcommand is None, "adt CLI could not be imported")
+class TestAdtPluginOptions(unittest.TestCase):
+    """Test that plugin-specific options are accepted by the adt subcommands."""
+
+    def parse(self, name, plugin, argv):
+        """Parse argv with the adt subcommand created for a legacy plugin."""
+        parser = argparse.ArgumentParser(prog="adt")
+        subparsers = parser.add_subparsers(dest="plugin")
+        create_legacy_subcommand(
+            subparsers, name, {"plugin": plugin, "description": name}
+        )
+        return parser.parse_args([name] + argv)
+
+    def test_context_migrator_options(self):
+        """Test ContextMigrator's rollback, backup and report options."""
+        args = self.parse(
+            "ContextMigrator",
+            ContextMigrator,
+            ["--rollback", "--backup-dir", ".backups", "--format", "jsonl", "-v"],
+        )
+        self.assertTrue(args.rollback)
+        self.assertEqual(args.backup_dir, ".backups")
+        self.assertEqual(args.format, "jsonl")
+        self.assertTrue(args.verbose)
+
+    def test_context_analyzer_report_options(self):
+        """Test ContextAnalyzer's streamed report formats."""
+        for report_format in ("jsonl", "csv"):
+            args = self.parse(
+                "ContextAnalyzer",
+                ContextAnalyzer,
+                ["--format", report_format, "--output", "report", "--detailed"],
+            )
+            self.assertEqual(args.format, report_format)
+            self.assertEqual(args.output, "report")
+        args = self.parse("ContextAnalyzer", ContextAnalyzer, ["--stream"])
+        self.assertTrue(args.stream)
+
+    def test_snapshot_option(self):
+        """Test that both reporting plugins accept --snapshot."""
+        for name, plugin in (
+            ("ContextAnalyzer", ContextAnalyzer),
+            ("CrossReference", CrossReference),
+        ):
+            args = self.parse(name, plugin, ["--snapshot", "before.json"])
+            self.assertEqual(args.snapshot, "before.json")
+
+    def test_cross_reference_report_options(self):
+        """Test CrossReference's report and stream options."""
+        args = self.parse(
+            "CrossReference",
+            CrossReference,
+            ["--check-only", "--report", "xrefs.jsonl", "--stream"],
+        )
+        self.assertTrue(args.check_only)
+        self.assertEqual(args.report, "xrefs.jsonl")
+        self.assertTrue(args.stream)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,112 @@
+"""
+Test suite for the compact record storage module.
+
+This script tests the columnar xref table and the slotted record types
+used by the analysis plugins.
+
+To run: python3 -m pytest tests/test_compact_records.py -v
+"""
+
+import os
+import pickle
+import sys
+import unittest
+from dataclasses import asdict
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    from asciidoc_dita_toolkit.asciidoc_dita.compact_records import (
+        XrefTable,
+        intern_value,
+    )
+    from asciidoc_dita_toolkit.asciidoc_dita.plugins.ContextAnalyzer import (
+        ContextAnalyzer,
+        XrefUsage,
+    )
+except ImportError as e:
+    print(f"Warning: Could not import compact_records module: {e}")
+    XrefTable = None
+
+
+ROWS = [
+    ('a.adoc', 1, 'xref:topic[Topic]', 'topic', ''),
+    ('b.adoc', 7, 'xref:other.adoc#x[X]', 'x', 'other.adoc'),
+    ('a.adoc', 9, 'xref:missing[Missing]', 'missing', ''),
+]
+
+
+@unittest.skipIf(XrefTable is None, "compact_records module could not be imported")
+class TestXrefTable(unittest.TestCase):
+    """Test cases for the columnar xref table."""
+
+    def test_behaves_like_a_list_of_tuples(self):
+        """Test that rows come back exactly as they were appended."""
+        table = XrefTable()
+        for row in ROWS:
+            table.append(row)
+
+        self.assertEqual(len(table), 3)
+        self.assertEqual(list(table), ROWS)
+        self.assertEqual(table[1], ROWS[1])
+        self.assertEqual(table, ROWS)
+
+    def test_file_paths_are_stored_once(self):
+        """Test that each distinct file path is kept once in the file table."""
+        table = XrefTable(ROWS)
+
+        self.assertEqual(table.files, ['a.adoc', 'b.adoc'])
+        self.assertIs(table[0][0], table[2][0])
+
+    def test_intern_value_shares_equal_strings(self):
+        """Test that equal strings built separately intern to one object."""
+        first = intern_value(''.join(['mod', 'ules/a.adoc']))
+        second = intern_value(''.join(['modules/', 'a.adoc']))
+
+        self.assertIs(first, second)
+
+
+@unittest.skipIf(XrefTable is None, "compact_records module could not be imported")
+class TestSlottedRecords(unittest.TestCase):
+    """Test cases for the slotted analysis records."""
+
+    def test_records_have_no_instance_dict(self):
+        """Test that records use slots and still convert and pickle."""
+        usage = XrefUsage('topic', '', 'a.adoc', 3, 'xref:topic[Topic]')
+
+        self.assertFalse(hasattr(usage, '__dict__'))
+        self.assertEqual(
+            asdict(usage),
+            {
+                'target_id': 'topic',
+                'target_file': '',
+                'filepath': 'a.adoc',
+                'line_number': 3,
+                'full_match': 'xref:topic[Topic]',
+            },
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(usage)), usage)
+
+    def test_analyzer_records_share_the_file_path(self):
+        """Test that all records from one file reference one path string."""
+        import tempfile
+
+        with tempfile.NamedTemporaryFile(
+            'w', suffix='.adoc', delete=False, encoding='utf-8'
+        ) as f:
+            f.write('[id="a_ctx"]\n== A\n\nxref:b_ctx[B] and xref:c_ctx[C]\n')
+
+        try:
+            analysis = ContextAnalyzer().analyze_file(f.name)
+        finally:
+            os.unlink(f.name)
+
+        paths = [analysis.filepath] + [x.filepath for x in analysis.xref_usages]
+        paths += [i.filepath for i in analysis.ids_with_context]
+        self.assertEqual(len(paths), 4)
+        self.assertTrue(all(path is paths[0] for path in paths))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -26,6 +26,12 @@ from asciidoc_dita_toolkit.asciidoc_dita.plugins.ui_interface import (
 from asciidoc_dita_toolkit.asciidoc_dita.plugins.content_type_processor import (
     ContentTypeProcessor,
 )
+from asciidoc_dita_toolkit.asciidoc_dita.plugins.content_type_batch import (
+    format_batch_summary,
+    format_report_summary,
+    run_content_type_batch,
+    run_content_type_report,
+)
 
 
 class TestContentTypeDetector(unittest.TestCase):
@@ -442,5 +448,136 @@ class TestIntegration(unittest.TestCase):
             )
 
 
+class TestBatchEngine(unittest.TestCase):
+    """Tests for the non-interactive batch engine."""
+
+    FILES = {
+        "proc_install.adoc": "= Installing Software\n\nSome text.\n",
+        "tables.adoc": "= Options\n\n|===\n| a | b\n|===\n",
+        "notes.adoc": "Plain text without a title.\n",
+        "old.adoc": ":_content-type: CONCEPT\n\n= Old\n",
+        "done.adoc": ":_mod-docs-content-type: REFERENCE\n\n= Done\n",
+    }
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.paths = []
+        for name, content in self.FILES.items():
+            path = os.path.join(self.temp_dir.name, name)
+            with open(path, "w", newline="") as f:
+                f.write(content)
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _read(self, name):
+        with open(os.path.join(self.temp_dir.name, name), newline="") as f:
+            return f.read()
+
+    def test_batch_assigns_types_and_summarizes(self):
+        """Test that the batch engine tags files and counts types and reasons."""
+        summary = run_content_type_batch(self.paths, workers=1)
+
+        self.assertEqual(summary.files_processed, 5)
+        self.assertEqual(summary.files_changed, 4)
+        self.assertEqual(summary.attributes_added, 3)
+        self.assertEqual(summary.attributes_updated, 1)
+        self.assertEqual(summary.by_reason["filename"], 1)
+        self.assertEqual(summary.by_reason["default"], 1)
+        self.assertEqual(summary.by_reason["converted"], 1)
+        self.assertEqual(summary.by_reason["existing"], 1)
+        self.assertEqual(summary.by_type["TBD"], 1)
+        self.assertEqual(summary.errors, [])
+
+        self.assertTrue(
+            self._read("proc_install.adoc").startswith(
+                ":_mod-docs-content-type: PROCEDURE\n\n= Installing"
+            )
+        )
+        self.assertTrue(
+            self._read("old.adoc").startswith(":_mod-docs-content-type: CONCEPT\n")
+        )
+        self.assertEqual(self._read("done.adoc"), self.FILES["done.adoc"])
+
+    def test_batch_matches_processor_output(self):
+        """Test that batch rewrites match the interactive processor in batch UI mode."""
+        with tempfile.TemporaryDirectory() as other_dir:
+            for name, content in self.FILES.items():
+                with open(os.path.join(other_dir, name), "w", newline="") as f:
+                    f.write(content)
+                processor = ContentTypeProcessor(ContentTypeDetector(), BatchUI())
+                with patch("builtins.print"):
+                    processor.process_file(os.path.join(other_dir, name))
+
+            run_content_type_batch(self.paths, workers=1)
+
+            for name in self.FILES:
+                with open(os.path.join(other_dir, name), newline="") as f:
+                    self.assertEqual(self._read(name), f.read(), name)
+
+    def test_batch_pool_matches_serial(self):
+        """Test that the process pool gives the same result as serial planning."""
+        summary = run_content_type_batch(self.paths * 10, workers=2, dry_run=True)
+        serial = run_content_type_batch(self.paths * 10, workers=1, dry_run=True)
+
+        self.assertEqual(summary, serial)
+        self.assertEqual(self._read("notes.adoc"), self.FILES["notes.adoc"])
+
+    def test_batch_reports_unreadable_files(self):
+        """Test that read errors are collected instead of raised."""
+        missing = os.path.join(self.temp_dir.name, "missing.adoc")
+        summary = run_content_type_batch([missing], workers=1)
+
+        self.assertEqual(summary.by_reason, {"error": 1})
+        self.assertEqual(len(summary.errors), 1)
+        self.assertIn("1 errors", format_batch_summary(summary))
+
+    def test_report_csv_does_not_modify_files(self):
+        """Test that the CSV report classifies files without changing them."""
+        import csv
+        import io
+
+        stream = io.StringIO()
+        summary = run_content_type_report(self.paths, stream, "csv", workers=1)
+
+        rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+        self.assertEqual(summary.files_classified, 5)
+        self.assertEqual(summary.errors, 0)
+        self.assertEqual([row["filepath"] for row in rows], self.paths)
+
+        install = rows[0]
+        self.assertEqual(install["suggested_type"], "PROCEDURE")
+        self.assertEqual(install["source"], "filename")
+        self.assertIn("filename prefix", install["reason"])
+        self.assertGreaterEqual(float(install["detect_ms"]), 0.0)
+        self.assertEqual(rows[4]["existing_type"], "REFERENCE")
+
+        for name, content in self.FILES.items():
+            self.assertEqual(self._read(name), content)
+        self.assertIn("5 files classified", format_report_summary(summary))
+
+    def test_report_jsonl_records(self):
+        """Test that the JSONL report writes one record per file."""
+        import io
+        import json
+
+        stream = io.StringIO()
+        run_content_type_report(self.paths, stream, "jsonl", workers=1)
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(len(records), 5)
+        self.assertEqual(records[1]["suggested_type"], "REFERENCE")
+        self.assertEqual(records[1]["source"], "content")
+        self.assertIsNone(records[2]["suggested_type"])
+
+    def test_report_rejects_unknown_format(self):
+        """Test that an unsupported report format raises ValueError."""
+        import io
+
+        with self.assertRaises(ValueError):
+            run_content_type_report(self.paths, io.StringIO(), "xml", workers=1)
+
+
 if __name__ == '__main__':
     unittest.main()
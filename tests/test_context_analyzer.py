@@ -30,6 +30,7 @@ try:
         AnalysisReport,
         format_text_report,
     )
+    from asciidoc_dita_toolkit.asciidoc_dita.file_utils import SCAN_CHUNK_SIZE
 except ImportError as e:
     print(f"Warning: Could not import ContextAnalyzer plugin: {e}")
     ContextAnalyzer = None
@@ -201,6 +202,58 @@ See xref:other_topic[Other Topic].
             finally:
                 os.unlink(f.name)
 
+    def test_mapped_scan_matches_full_read(self):
+        """Test that large files scanned through mmap give the same analysis."""
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.adoc', delete=False) as f:
+            f.write(
+                b'= Test Document\r\n\r\n:context: banana\r\n\r\n'
+                b'[id="topic_banana"]\n== Topic\r'
+                b'See xref:other_topic[Other] and link:https://example.com[site].\n'
+                b'\n[id="section_banana"]\nxref:a.adoc#b_c[B]'
+            )
+
+        try:
+            full = ContextAnalyzer().analyze_file(f.name)
+            mapped = ContextAnalyzer(mmap_threshold=0).analyze_file(f.name)
+
+            self.assertEqual(mapped, full)
+            self.assertEqual(full.context_attributes, ['banana'])
+            self.assertEqual([u.line_number for u in mapped.xref_usages], [7, 10])
+            self.assertEqual(mapped.link_usages[0].line_number, 7)
+        finally:
+            os.unlink(f.name)
+
+    def test_mapped_scan_counts_crlf_at_chunk_boundary(self):
+        """Test line numbers when a chunk ends inside a run of line endings."""
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.adoc', delete=False) as f:
+            f.write(b'a' * (SCAN_CHUNK_SIZE - 1) + b'\r\r\nxref:x[X]\n')
+
+        try:
+            full = ContextAnalyzer().analyze_file(f.name)
+            mapped = ContextAnalyzer(mmap_threshold=0).analyze_file(f.name)
+
+            self.assertEqual(mapped, full)
+            self.assertEqual(mapped.xref_usages[0].line_number, 3)
+        finally:
+            os.unlink(f.name)
+
+    def test_prefilter_skips_files_without_candidates(self):
+        """Test that files with no candidate byte strings are not decoded."""
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.adoc', delete=False) as f:
+            # Not valid UTF-8, so decoding the file would fail
+            f.write(b'= Plain Document\n\nCaf\xe9 with no IDs or references.\n')
+
+        try:
+            result = self.analyzer.analyze_file(f.name)
+            self.assertEqual(result.xref_usages, [])
+
+            report = self.analyzer.generate_report()
+            self.assertEqual(report.total_files_scanned, 1)
+            self.assertEqual(report.files_skipped, 1)
+            self.assertIn('Files Skipped by Prefilter: 1', format_text_report(report))
+        finally:
+            os.unlink(f.name)
+
     def test_detect_id_collisions(self):
         """Test ID collision detection."""
         # Add some test IDs that would collide
@@ -25,6 +25,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 try:
     from asciidoc_dita_toolkit.asciidoc_dita.plugins.ContextMigrator import (
         ContextMigrator,
+        IDCollisionIndex,
         MigrationOptions,
         IDChange,
         XrefChange,
@@ -108,6 +109,103 @@ class TestContextMigrator(unittest.TestCase):
 
         self.assertEqual(backup_content, original_content)
 
+    def test_create_backup_deduplicates_content(self):
+        """Test that identical content is stored once and recorded per file."""
+        paths = []
+        for name in ('a.adoc', 'b.adoc'):
+            path = os.path.join(self.temp_dir, name)
+            with open(path, 'w') as f:
+                f.write('[id="topic_banana"]\n== Topic\n')
+            paths.append(path)
+
+        backups = [self.migrator.create_backup(path) for path in paths]
+
+        self.assertEqual(backups[0], backups[1])
+        self.assertEqual(self.migrator.backup_store.stats['deduplicated'], 1)
+        store = self.migrator.backup_store
+        entries = store.load_manifest(store.manifest_path)
+        self.assertEqual(
+            [entry.path for entry in entries], [os.path.abspath(p) for p in paths]
+        )
+
+    def test_rollback_skips_unchanged_files(self):
+        """Test that rollback only rewrites files that differ from the backup."""
+        changed = os.path.join(self.temp_dir, 'changed.adoc')
+        untouched = os.path.join(self.temp_dir, 'untouched.adoc')
+        with open(changed, 'w') as f:
+            f.write('[id="topic_banana"]\n== Topic\n')
+        with open(untouched, 'w') as f:
+            f.write('= Plain\n')
+
+        self.migrator.migrate_file(changed)
+        self.migrator.create_backup(untouched)
+        restore_result = self.migrator.rollback()
+
+        self.assertEqual(restore_result.restored, [os.path.abspath(changed)])
+        self.assertEqual(restore_result.unchanged, [os.path.abspath(untouched)])
+        with open(changed, 'r') as f:
+            self.assertEqual(f.read(), '[id="topic_banana"]\n== Topic\n')
+
+    def test_backup_survives_in_place_write(self):
+        """Test that a backup is not changed by a later in-place write."""
+        original = '[id="topic_banana"]\n== Topic\n'
+        test_file = os.path.join(self.temp_dir, 'test.adoc')
+        with open(test_file, 'w') as f:
+            f.write(original)
+
+        backup_path = self.migrator.create_backup(test_file)
+        self.assertEqual(os.stat(test_file).st_nlink, 1)
+
+        # Plugins such as EntityReference rewrite files in place
+        with open(test_file, 'w') as f:
+            f.write('rewritten in place\n')
+        with open(backup_path, 'r') as f:
+            self.assertEqual(f.read(), original)
+
+        restore_result = self.migrator.rollback()
+        self.assertEqual(restore_result.errors, [])
+        self.assertEqual(restore_result.restored, [os.path.abspath(test_file)])
+        with open(test_file, 'r') as f:
+            self.assertEqual(f.read(), original)
+
+    def test_rollback_after_dry_run_and_unchanged_rerun(self):
+        """Test that rollback still restores the originals after later runs."""
+        original = '[id="topic_banana"]\n== Topic\n\nSee xref:topic_banana[].\n'
+        paths = []
+        for name in ('a.adoc', 'b.adoc'):
+            path = os.path.join(self.temp_dir, name)
+            with open(path, 'w') as f:
+                f.write(original)
+            paths.append(path)
+
+        for path in paths:
+            self.migrator.migrate_file(path)
+        self.migrator.backup_store.close()
+
+        # A dry run takes no backup
+        dry_run = ContextMigrator(
+            MigrationOptions(dry_run=True, backup_dir=self.options.backup_dir)
+        )
+        for path in paths:
+            self.assertEqual(dry_run.migrate_file(path).backup_path, '')
+
+        # A re-run over the migrated files changes nothing
+        rerun = ContextMigrator(self.options)
+        for path in paths:
+            rerun.migrate_file(path)
+        rerun.backup_store.close()
+        self.assertEqual(len(rerun.backup_store.list_manifests()), 2)
+
+        restore_result = ContextMigrator(self.options).rollback()
+
+        self.assertEqual(restore_result.errors, [])
+        self.assertEqual(
+            sorted(restore_result.restored), [os.path.abspath(p) for p in paths]
+        )
+        for path in paths:
+            with open(path, 'r') as f:
+                self.assertEqual(f.read(), original)
+
     def test_create_backup_disabled(self):
         """Test backup creation when disabled."""
         self.migrator.options.create_backups = False
@@ -138,6 +236,21 @@ class TestContextMigrator(unittest.TestCase):
         result = self.migrator.resolve_id_collisions('topic', existing_ids)
         self.assertEqual(result, 'topic')  # Returns original even with collision
 
+    def test_resolve_id_collisions_with_index(self):
+        """Test that the collision index gives the same names as a plain set."""
+        plain = {'topic', 'topic-1', 'topic-3'}
+        index = IDCollisionIndex(plain)
+
+        for base_id in ['topic', 'topic', 'topic', 'other', 'topic', 'other']:
+            expected = self.migrator.resolve_id_collisions(base_id, plain)
+            plain.add(expected)
+            result = self.migrator.resolve_id_collisions(base_id, index)
+            index.add(result)
+            self.assertEqual(result, expected)
+
+        self.assertEqual(index, plain)
+        self.assertEqual(index.next_suffix['topic'], 6)
+
     def test_remove_context_from_ids(self):
         """Test context removal from IDs."""
         content = """= Test Document
@@ -385,6 +498,37 @@ Content here.
 
         self.assertEqual(current_content, original_content)
 
+    def test_migrate_file_preserves_line_endings(self):
+        """Test that migration keeps CRLF endings and adds no trailing newline."""
+        test_file = os.path.join(self.temp_dir, 'test.adoc')
+        with open(test_file, 'wb') as f:
+            f.write(
+                b'[id="topic_banana"]\r\n== Topic\r\n\r\n'
+                b'See xref:topic_banana[Topic] and link:other.adoc#topic_banana[it].\r\n'
+            )
+
+        result = self.migrator.migrate_file(test_file)
+
+        self.assertTrue(result.success)
+        self.assertEqual(len(result.xref_changes), 2)
+        with open(test_file, 'rb') as f:
+            self.assertEqual(
+                f.read(),
+                b'[id="topic"]\r\n== Topic\r\n\r\n'
+                b'See xref:topic[Topic] and link:other.adoc#topic[it].\r\n',
+            )
+
+    def test_remove_context_from_ids_repeated_on_one_line(self):
+        """Test that repeated IDs on one line are each replaced at their own offset."""
+        content = 'a [id="x_banana"] b [id="x_banana"]\nc [id="y_banana"]'
+
+        new_content, changes = self.migrator.remove_context_from_ids(
+            content, 'test.adoc'
+        )
+
+        self.assertEqual(new_content, 'a [id="x"] b [id="x"]\nc [id="y"]')
+        self.assertEqual([change.line_number for change in changes], [1, 1, 2])
+
     def test_migrate_file_error_handling(self):
         """Test error handling during file migration."""
         # Try to migrate non-existent file
@@ -434,6 +578,165 @@ Content here.
         self.assertEqual(result.failed_migrations, 0)
         self.assertEqual(len(result.file_results), 2)
 
+    def _write_corpus(self, directory, count):
+        """Write files whose IDs collide across files and reference each other."""
+        os.makedirs(directory, exist_ok=True)
+        for i in range(count):
+            with open(os.path.join(directory, f'file{i:03d}.adoc'), 'w') as f:
+                f.write(
+                    f'[id="topic_ctx{i}"]\n== Topic\n\n'
+                    f'[id="unique{i}_ctx"]\n== Unique\n\n'
+                    f'See xref:topic_ctx{(i + 1) % count}[next] and xref:plain[plain].\n'
+                )
+
+    def test_migrate_directory_reads_each_file_once(self):
+        """Test that apply and validate reuse the buffers from the planning pass."""
+        test_subdir = os.path.join(self.temp_dir, 'once')
+        self._write_corpus(test_subdir, 3)
+        self.migrator.options.validate_after = True
+
+        from asciidoc_dita_toolkit.asciidoc_dita.plugins import ContextMigrator as module
+        from asciidoc_dita_toolkit.asciidoc_dita.plugins import backup_store
+
+        with patch.object(
+            module,
+            'read_text_preserve_endings',
+            wraps=module.read_text_preserve_endings,
+        ) as mock_read, patch.object(
+            backup_store, 'hashlib', wraps=backup_store.hashlib
+        ) as mock_hashlib:
+            result = self.migrator.migrate_directory(test_subdir)
+
+        self.assertEqual(mock_read.call_count, 3)
+        # Backups reuse the planned content and digest
+        mock_hashlib.sha256.assert_not_called()
+        store = self.migrator.backup_store
+        entries = store.load_manifest(store.list_manifests()[-1])
+        self.assertEqual(len(entries), 3)
+        for entry in entries:
+            blob = store.blob_path(entry.blob)
+            self.assertEqual(backup_store.file_digest(blob), entry.blob)
+        self.assertEqual(result.successful_migrations, 3)
+        self.assertEqual(len(result.validation_results), 3)
+
+    def test_migrate_directory_validates_plain_ids_across_files(self):
+        """Test that xrefs to plain IDs in other files are not reported as broken."""
+        test_subdir = os.path.join(self.temp_dir, 'plain')
+        os.makedirs(test_subdir)
+        with open(os.path.join(test_subdir, 'a.adoc'), 'w') as f:
+            f.write('[id="overview"]\n== Overview\n\nSee xref:topic_ctx[Topic].\n')
+        with open(os.path.join(test_subdir, 'b.adoc'), 'w') as f:
+            f.write(
+                '[id="topic_ctx"]\n== Topic\n\n'
+                'See xref:a.adoc#overview[Overview] and xref:missing[Missing].\n'
+            )
+        self.migrator.options.validate_after = True
+
+        result = self.migrator.migrate_directory(test_subdir)
+
+        broken = {
+            os.path.basename(v.filepath): v.broken_xrefs
+            for v in result.validation_results
+        }
+        self.assertEqual(broken, {'a.adoc': [], 'b.adoc': ['missing']})
+
+    def _interrupt_migration(self, directory):
+        """Migrate a directory and interrupt it after the first file is marked done."""
+        from asciidoc_dita_toolkit.asciidoc_dita.plugins.migration_journal import (
+            MigrationJournal,
+        )
+
+        real_mark_done = MigrationJournal.mark_done
+        marked = []
+
+        def mark_done_then_interrupt(journal, path):
+            if marked:
+                raise KeyboardInterrupt
+            marked.append(path)
+            real_mark_done(journal, path)
+
+        with patch.object(MigrationJournal, 'mark_done', mark_done_then_interrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                self.migrator.migrate_directory(directory)
+
+        return MigrationJournal.in_directory(self.options.backup_dir)
+
+    def test_migrate_directory_resumes_from_journal(self):
+        """Test that an interrupted migration resumes without redoing finished files."""
+        expected_dir = os.path.join(self.temp_dir, 'expected')
+        self._write_corpus(expected_dir, 4)
+        ContextMigrator(MigrationOptions(create_backups=False)).migrate_directory(
+            expected_dir
+        )
+
+        test_subdir = os.path.join(self.temp_dir, 'resume')
+        self._write_corpus(test_subdir, 4)
+        journal = self._interrupt_migration(test_subdir)
+        self.assertTrue(journal.exists())
+
+        # A second run refuses to start over a pending journal
+        result = ContextMigrator(self.options).migrate_directory(test_subdir)
+        self.assertEqual(result.total_files_processed, 0)
+
+        self.options.resume = True
+        result = ContextMigrator(self.options).migrate_directory(test_subdir)
+
+        # file000 was done; file001 was written but not yet marked done
+        self.assertEqual(result.total_files_processed, 3)
+        self.assertEqual(result.failed_migrations, 0)
+        self.assertFalse(journal.exists())
+        for name in sorted(os.listdir(expected_dir)):
+            with open(os.path.join(expected_dir, name)) as f:
+                expected = f.read()
+            with open(os.path.join(test_subdir, name)) as f:
+                self.assertEqual(f.read(), expected)
+
+    def test_rollback_restores_only_touched_files(self):
+        """Test that rolling back an interrupted migration restores touched files only."""
+        test_subdir = os.path.join(self.temp_dir, 'rollback')
+        self._write_corpus(test_subdir, 4)
+        originals = {}
+        for name in sorted(os.listdir(test_subdir)):
+            with open(os.path.join(test_subdir, name)) as f:
+                originals[name] = f.read()
+
+        journal = self._interrupt_migration(test_subdir)
+        restore_result = ContextMigrator(self.options).rollback()
+
+        self.assertEqual(
+            sorted(os.path.basename(path) for path in restore_result.restored),
+            ['file000.adoc', 'file001.adoc'],
+        )
+        self.assertFalse(journal.exists())
+        for name, original in originals.items():
+            with open(os.path.join(test_subdir, name)) as f:
+                self.assertEqual(f.read(), original)
+
+    def test_migrate_directory_pool_matches_serial(self):
+        """Test that the worker pool gives the same result as a serial run."""
+        results = {}
+        contents = {}
+        for workers in (1, 2):
+            test_subdir = os.path.join(self.temp_dir, f'workers{workers}')
+            self._write_corpus(test_subdir, 40)
+            options = MigrationOptions(
+                create_backups=False, validate_after=True, workers=workers
+            )
+            result = ContextMigrator(options).migrate_directory(test_subdir)
+            for file_result in result.file_results:
+                file_result.filepath = os.path.basename(file_result.filepath)
+            for validation in result.validation_results:
+                validation.filepath = os.path.basename(validation.filepath)
+            results[workers] = result
+            contents[workers] = {
+                name: open(os.path.join(test_subdir, name)).read()
+                for name in sorted(os.listdir(test_subdir))
+            }
+
+        self.assertEqual(results[1], results[2])
+        self.assertEqual(contents[1], contents[2])
+        self.assertIn('[id="topic-1"]', contents[1]['file001.adoc'])
+
 
 @unittest.skipIf(
     ContextMigrator is None, "ContextMigrator plugin could not be imported"
@@ -673,11 +976,26 @@ See xref:topic_banana[Topic in File 1].
         self.assertIn('xref:section[Section in File 2]', content1)
         self.assertIn('xref:topic[Topic in File 1]', content2)
 
-        # Check that backups were created
-        backup_dir = os.path.join(self.temp_dir, '.backups')
-        self.assertTrue(os.path.exists(backup_dir))
-        self.assertTrue(os.path.exists(os.path.join(backup_dir, 'file1.adoc')))
-        self.assertTrue(os.path.exists(os.path.join(backup_dir, 'file2.adoc')))
+        # Check that backups were recorded in the manifest
+        store = migrator.backup_store
+        manifests = store.list_manifests()
+        self.assertEqual(len(manifests), 1)
+        entries = store.load_manifest(manifests[0])
+        self.assertEqual(
+            sorted(entry.path for entry in entries),
+            sorted(os.path.abspath(path) for path in (file1, file2)),
+        )
+        for file_result in result.file_results:
+            self.assertTrue(os.path.exists(file_result.backup_path))
+
+        # Rolling back replays the manifest and restores the originals
+        restore_result = migrator.rollback()
+        self.assertEqual(len(restore_result.restored), 2)
+        self.assertEqual(restore_result.errors, [])
+        with open(file1, 'r') as f:
+            self.assertIn('[id="topic_banana"]', f.read())
+        with open(file2, 'r') as f:
+            self.assertIn('[id="section_apple"]', f.read())
 
     def test_migration_with_collisions(self):
         """Test migration with ID collisions."""
@@ -397,6 +397,68 @@ See xref:topic[This Topic].
             finally:
                 os.unlink(f.name)
 
+    def test_validation_scans_mapped_files(self):
+        """Test that mmap scanning of large files gives the same validation."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            master_file = os.path.join(temp_dir, 'master.adoc')
+            include_file = os.path.join(temp_dir, 'included.adoc')
+            with open(master_file, 'w', newline='') as f:
+                f.write(
+                    '= Master\r\n\r\n[id="master_topic"]\r\n'
+                    'include::included.adoc[]\r\n'
+                    'See xref:included_section[Included].\r\n'
+                )
+            with open(include_file, 'w') as f:
+                f.write(
+                    '[id="included_section"]\n=== Included\n\n'
+                    'See xref:missing[Missing] and xref:master_topic[Master].\n'
+                )
+
+            processors = [
+                CrossReferenceProcessor(validation_only=True),
+                CrossReferenceProcessor(validation_only=True, mmap_threshold=0),
+            ]
+            for processor in processors:
+                processor.build_id_map(master_file)
+                processor.process_files()
+
+            full, mapped = processors
+            self.assertEqual(mapped.id_map, full.id_map)
+            self.assertEqual(len(mapped.id_map), 2)
+            self.assertEqual(sorted(mapped.all_xrefs), sorted(full.all_xrefs))
+            self.assertEqual(mapped.broken_xrefs, full.broken_xrefs)
+            self.assertEqual(len(mapped.broken_xrefs), 1)
+            self.assertEqual(mapped.broken_xrefs[0].line_number, 4)
+
+    def test_files_without_xrefs_are_skipped(self):
+        """Test that files without "xref:" are counted as skipped and not rewritten."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            master_file = os.path.join(temp_dir, 'master.adoc')
+            include_file = os.path.join(temp_dir, 'included.adoc')
+            with open(master_file, 'w') as f:
+                f.write(
+                    '= Master\n\n[id="master_topic"]\n'
+                    'include::included.adoc[]\n'
+                    'See xref:included_section[Included].\n'
+                )
+            with open(include_file, 'w') as f:
+                f.write('[id="included_section"]\n=== Included\n')
+            os.utime(include_file, (0, 0))
+
+            processor = CrossReferenceProcessor()
+            processor.build_id_map(master_file)
+            processor.process_files()
+            report = processor.generate_validation_report()
+
+            self.assertEqual(report.files_skipped, 1)
+            self.assertEqual(report.total_files_processed, 2)
+            self.assertEqual(os.path.getmtime(include_file), 0)
+            self.assertIn(
+                'Files skipped by prefilter: 1', format_validation_report(report)
+            )
+            with open(master_file) as f:
+                self.assertIn('xref:included.adoc#included_section', f.read())
+
     def test_process_file_with_fixes(self):
         """Test file processing with xref fixes."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.adoc', delete=False) as f:
@@ -0,0 +1,201 @@
+"""
+Test suite for the prefetching I/O pipeline.
+
+This script tests the bounded read-ahead, the queued writes and their
+ordering and errors, that process_adoc_files with prefetch gives the
+same results as a plain run for the EntityReference and ContentType paths,
+and that failed background writes fail those runs.
+
+To run: python3 -m pytest tests/test_io_pipeline.py -v
+"""
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    from asciidoc_dita_toolkit.asciidoc_dita import file_utils, io_pipeline
+    from asciidoc_dita_toolkit.asciidoc_dita.file_utils import (
+        read_text_preserve_endings,
+        write_text_preserve_endings,
+    )
+    from asciidoc_dita_toolkit.asciidoc_dita.plugins.ContentType import (
+        ContentTypeModule,
+    )
+    from asciidoc_dita_toolkit.asciidoc_dita.plugins import EntityReference
+    from asciidoc_dita_toolkit.asciidoc_dita.plugins.EntityReference import (
+        EntityReferenceModule,
+    )
+    from asciidoc_dita_toolkit.asciidoc_dita.workflow_utils import process_adoc_files
+except ImportError as e:
+    print(f"Warning: Could not import io_pipeline module: {e}")
+    io_pipeline = None
+
+
+class Args:
+    def __init__(self, file=None, directory=".", recursive=False):
+        self.file = file
+        self.directory = directory
+        self.recursive = recursive
+
+
+def read_tree(root):
+    """Return {file name: content} for the files in root."""
+    contents = {}
+    for filename in sorted(os.listdir(root)):
+        with open(os.path.join(root, filename), 'rb') as f:
+            contents[filename] = f.read()
+    return contents
+
+
+@unittest.skipIf(io_pipeline is None, "io_pipeline module could not be imported")
+class TestIOPipeline(unittest.TestCase):
+    """Test cases for IOPipeline."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.paths = []
+        for i in range(12):
+            path = os.path.join(self.temp_dir, f'proc_file_{i}.adoc')
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(f'= File {i}\r\n\r\nCopyright &copy; &mdash; {i}.\n')
+            self.paths.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_prefetch_reads_ahead_within_bound(self):
+        """Test order, the read-ahead bound and that reads use the prefetch."""
+        with io_pipeline.io_pipeline(workers=2) as pipeline:
+            seen = []
+            for filepath in pipeline.prefetch(self.paths):
+                self.assertLessEqual(len(pipeline._prefetched), pipeline.read_ahead)
+                lines = read_text_preserve_endings(filepath)
+                self.assertEqual(lines[0], (f'= File {len(seen)}', '\r\n'))
+                seen.append(filepath)
+
+        self.assertEqual(seen, self.paths)
+        self.assertEqual(pipeline.read_ahead, 4)
+        self.assertEqual(pipeline.files_prefetched, len(self.paths))
+        self.assertIsNone(io_pipeline._active)
+
+    def test_writes_are_queued_ordered_and_errors_collected(self):
+        """Test that queued writes land in order and failures don't raise."""
+        path = self.paths[0]
+        missing = os.path.join(self.temp_dir, 'missing', 'file.adoc')
+        with io_pipeline.io_pipeline(workers=4) as pipeline:
+            for i in range(20):
+                write_text_preserve_endings(path, [(f'version {i}', '\n')])
+            write_text_preserve_endings(missing, [('text', '')])
+
+            # Reading a file waits for its pending writes
+            self.assertEqual(read_text_preserve_endings(path)[0][0], 'version 19')
+
+        self.assertEqual(pipeline.files_written, 20)
+        self.assertEqual(len(pipeline.errors), 1)
+        self.assertIn(missing, pipeline.errors[0])
+
+    def test_prefetch_matches_plain_run(self):
+        """Test EntityReference and ContentType runs with and without prefetch."""
+        plain_dir = os.path.join(self.temp_dir, 'plain')
+        prefetch_dir = os.path.join(self.temp_dir, 'prefetch')
+        os.mkdir(plain_dir)
+        for path in self.paths:
+            shutil.move(path, plain_dir)
+        shutil.copytree(plain_dir, prefetch_dir)
+
+        # Directories outside the working directory are rejected
+        self.addCleanup(os.chdir, os.getcwd())
+        results = []
+        for directory, prefetch in [(plain_dir, 0), (prefetch_dir, 3)]:
+            os.chdir(directory)
+            entity = EntityReferenceModule()
+            entity.initialize({'prefetch': prefetch})
+            content_type = ContentTypeModule()
+            content_type.initialize({'quiet_mode': True, 'prefetch': prefetch})
+            with patch('sys.stdout', io.StringIO()):
+                for module in (entity, content_type):
+                    result = module.execute({'directory': '.'})
+                    self.assertTrue(result['success'], result)
+            results.append(result['files_processed'])
+
+        self.assertEqual(results, [12, 12])
+        plain = read_tree(plain_dir)
+        self.assertEqual(read_tree(prefetch_dir), plain)
+        self.assertIn(b'{copy} {mdash}', plain['proc_file_0.adoc'])
+        self.assertIn(
+            b':_mod-docs-content-type: PROCEDURE', plain['proc_file_0.adoc']
+        )
+
+    def test_failed_background_writes_are_reported(self):
+        """Test that write failures with prefetch fail the run instead of vanishing."""
+        # Discovered paths are relative to the working directory
+        failing = os.path.basename(self.paths[0])
+        write_text = file_utils._write_text
+
+        def fail_first(filepath, *args):
+            if os.path.basename(filepath) == failing:
+                raise OSError('Operation not permitted')
+            return write_text(filepath, *args)
+
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.temp_dir)
+
+        with patch.object(file_utils, '_write_text', side_effect=fail_first):
+            with self.assertRaises(io_pipeline.PipelineWriteError) as raised:
+                process_adoc_files(
+                    Args(),
+                    lambda path: write_text_preserve_endings(path, [('new', '\n')]),
+                    prefetch=2,
+                )
+            self.assertEqual(len(raised.exception.errors), 1)
+            self.assertIn(failing, raised.exception.errors[0])
+            with open(self.paths[1]) as f:
+                self.assertEqual(f.read(), 'new\n')
+
+            batch = ContentTypeModule()
+            batch.initialize({'batch_mode': True, 'prefetch': 2})
+            with patch('sys.stdout', io.StringIO()):
+                batch_result = batch.execute({'directory': '.'})
+
+            content_type = ContentTypeModule()
+            content_type.initialize({'quiet_mode': True, 'prefetch': 2})
+            with patch('sys.stdout', io.StringIO()):
+                result = content_type.execute({'directory': '.'})
+        self.assertFalse(result['success'])
+        self.assertEqual(len(result['write_errors']), 1)
+
+        # The failed file's edit is not counted by the batch run
+        self.assertFalse(batch_result['success'])
+        self.assertEqual(len(batch_result['write_errors']), 1)
+        summary = batch_result['batch_summary']
+        self.assertEqual(summary['files_changed'], 11)
+        self.assertEqual(summary['attributes_added'], 11)
+        self.assertEqual(summary['attributes_updated'], 0)
+        self.assertEqual(batch_result['content_types_assigned'], 11)
+
+        def fail_entity_write(filepath, data):
+            raise OSError('Operation not permitted')
+
+        entity = EntityReferenceModule()
+        entity.initialize({'prefetch': 2})
+        with patch.object(
+            EntityReference, '_write_file', side_effect=fail_entity_write
+        ), patch('sys.stdout', io.StringIO()) as stdout:
+            result = entity.execute({'directory': '.'})
+        self.assertFalse(result['success'])
+        # Only the file whose first write failed still has entities
+        self.assertEqual(len(result['write_errors']), 1)
+        self.assertIn('Error writing', stdout.getvalue())
+        self.assertIn(failing, result['write_errors'][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
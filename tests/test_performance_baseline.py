@@ -237,6 +237,103 @@ def measure_execution_time(func, *args, **kwargs) -> Tuple[float, any]:
             self.fail(f"Error testing ADTModule performance: {e}")
 
 
+class TestDirectoryFilterPerformance(unittest.TestCase):
+    """Benchmark DirectoryConfig exclude patterns against literal exclude lists."""
+
+    NUM_MODULES = 150
+
+    def setUp(self):
+        """Create a tree where every module has a generated _build directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.repo = self.temp_dir.name
+        for i in range(self.NUM_MODULES):
+            for sub in ("", "_build", os.path.join("_build", "html")):
+                directory = os.path.join(self.repo, "modules", f"module{i}", sub)
+                os.makedirs(directory, exist_ok=True)
+                with open(os.path.join(directory, "topic.adoc"), "w") as f:
+                    f.write("= Topic\n")
+        self.cwd = os.getcwd()
+        os.chdir(self.repo)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.temp_dir.cleanup()
+
+    def _benchmark(self, exclude_dirs: List[str]) -> Tuple[float, List[str]]:
+        from asciidoc_dita_toolkit.asciidoc_dita.plugins.DirectoryConfig import (
+            get_filtered_adoc_files,
+        )
+
+        config = {"repoRoot": self.repo, "includeDirs": [], "excludeDirs": exclude_dirs}
+        times = []
+        for _ in range(3):
+            elapsed, files = measure_execution_time(
+                get_filtered_adoc_files, ".", config
+            )
+            times.append(elapsed)
+        return statistics.median(times), sorted(files)
+
+    def test_pattern_vs_literal_excludes(self):
+        """Test that one pattern selects the same files as a long literal list."""
+        literal = [
+            os.path.join("modules", f"module{i}", "_build")
+            for i in range(self.NUM_MODULES)
+        ]
+        literal_time, literal_files = self._benchmark(literal)
+        pattern_time, pattern_files = self._benchmark(["**/_build/**"])
+
+        self.assertEqual(pattern_files, literal_files)
+        self.assertEqual(len(pattern_files), self.NUM_MODULES)
+        self.assertLess(literal_time, 10.0)
+        self.assertLess(pattern_time, 10.0)
+        print(
+            f"\nDirectoryConfig excludes ({self.NUM_MODULES} generated dirs): "
+            f"literal list {literal_time * 1000:.1f}ms, "
+            f"pattern {pattern_time * 1000:.1f}ms"
+        )
+
+
+class TestCollisionResolutionPerformance(unittest.TestCase):
+    """Stress test ContextMigrator collision resolution with heavily duplicated IDs."""
+
+    NUM_DUPLICATES = 3000
+
+    def _resolve_all(self, existing_ids) -> Tuple[float, List[str]]:
+        from asciidoc_dita_toolkit.asciidoc_dita.plugins.ContextMigrator import (
+            ContextMigrator,
+        )
+
+        migrator = ContextMigrator()
+
+        def run():
+            names = []
+            for i in range(self.NUM_DUPLICATES):
+                new_id = migrator.resolve_id_collisions(f"topic{i % 3}", existing_ids)
+                existing_ids.add(new_id)
+                names.append(new_id)
+            return names
+
+        return measure_execution_time(run)
+
+    def test_index_matches_linear_probe(self):
+        """Test that the counter index keeps naming and avoids quadratic probing."""
+        from asciidoc_dita_toolkit.asciidoc_dita.plugins.ContextMigrator import (
+            IDCollisionIndex,
+        )
+
+        linear_time, linear_names = self._resolve_all(set())
+        index_time, index_names = self._resolve_all(IDCollisionIndex())
+
+        self.assertEqual(index_names, linear_names)
+        self.assertEqual(index_names[-1], f"topic2-{self.NUM_DUPLICATES // 3 - 1}")
+        self.assertLess(index_time, linear_time)
+        print(
+            f"\nCollision resolution ({self.NUM_DUPLICATES} IDs over 3 bases): "
+            f"linear probe {linear_time * 1000:.1f}ms, "
+            f"counter index {index_time * 1000:.1f}ms"
+        )
+
+
 def calculate_performance_metrics(legacy_stats: Dict, adtmodule_stats: Dict) -> Dict:
     """Calculate performance comparison metrics."""
     if "error" in legacy_stats or "error" in adtmodule_stats:
@@ -0,0 +1,196 @@
+"""
+Test suite for the profiling hooks.
+
+This script tests the per-phase timing layer, its activation through the
+--profile option and the ADT_PROFILE variable, the phases recorded by
+process_adoc_files and the file helpers, and the memory measurements of
+--memory-profile.
+
+To run: python3 -m pytest tests/test_profiling.py -v
+"""
+
+import io
+import os
+import pstats
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    from asciidoc_dita_toolkit.asciidoc_dita import profiling
+    from asciidoc_dita_toolkit.asciidoc_dita.memory_profiling import deep_sizeof
+    from asciidoc_dita_toolkit.asciidoc_dita.file_utils import (
+        read_text_preserve_endings,
+        write_text_preserve_endings,
+    )
+    from asciidoc_dita_toolkit.asciidoc_dita.plugins.EntityReference import (
+        EntityReferenceModule,
+    )
+    from asciidoc_dita_toolkit.asciidoc_dita.workflow_utils import process_adoc_files
+except ImportError as e:
+    print(f"Warning: Could not import profiling module: {e}")
+    profiling = None
+
+
+class Args:
+    def __init__(self, file=None, directory=".", recursive=False):
+        self.file = file
+        self.directory = directory
+        self.recursive = recursive
+
+
+@unittest.skipIf(profiling is None, "profiling module could not be imported")
+class TestProfiling(unittest.TestCase):
+    """Test cases for the profiling layer."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'doc.adoc')
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('= Title\n\nCopyright &copy; 2024.\n')
+        env = patch.dict(
+            os.environ,
+            {profiling.PROFILE_ENV_VAR: '', profiling.MEMORY_PROFILE_ENV_VAR: ''},
+        )
+        env.start()
+        self.addCleanup(env.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_disabled_profiling_is_a_no_op(self):
+        """Test that phases cost nothing and record nothing when disabled."""
+        self.assertIsNone(profiling.get_profiler())
+        self.assertIs(profiling.profile_phase('read'), profiling.profile_phase('scan'))
+        profiling.count_bytes('read', 10)
+
+        with profiling.profiling_session() as profiler:
+            self.assertIsNone(profiler)
+
+    def test_parse_profile_option(self):
+        """Test the summary, dump file and disabled values."""
+        self.assertIsNone(profiling.parse_profile_option(None))
+        self.assertIsNone(profiling.parse_profile_option('0'))
+        self.assertIsNone(profiling.parse_profile_option('1').dump_file)
+        self.assertEqual(
+            profiling.parse_profile_option('run.prof').dump_file, 'run.prof'
+        )
+        self.assertIsNone(profiling.parse_profile_option('1').memory)
+        self.assertIsNotNone(profiling.parse_profile_option(None, memory=True).memory)
+
+    def test_nested_phases_report_self_time(self):
+        """Test that a phase's self time excludes the phases inside it."""
+        profiler = profiling.Profiler()
+        with patch('time.perf_counter', side_effect=[0.0, 1.0, 3.0, 4.0]):
+            with profiler.phase('scan', files=1):
+                with profiler.phase('read'):
+                    pass
+
+        self.assertEqual(profiler.phases['scan'].seconds, 4.0)
+        self.assertEqual(profiler.phases['scan'].self_seconds, 2.0)
+        self.assertEqual(profiler.phases['read'].self_seconds, 2.0)
+        self.assertEqual(profiler.phases['scan'].files, 1)
+
+    def test_process_adoc_files_records_phases_and_bytes(self):
+        """Test discovery, scan, read and write phases of a profiled run."""
+        size = os.path.getsize(self.path)
+
+        def process(filepath):
+            write_text_preserve_endings(filepath, read_text_preserve_endings(filepath))
+
+        stream = io.StringIO()
+        with profiling.profiling_session('summary', stream=stream) as profiler:
+            process_adoc_files(Args(file=self.path), process)
+
+        self.assertIsNone(profiling.get_profiler())
+        phases = profiler.phases
+        self.assertEqual(phases['discovery'].calls, 1)
+        self.assertEqual(phases['scan'].files, 1)
+        self.assertEqual(phases['read'].bytes, size)
+        self.assertEqual(phases['write'].bytes, size)
+        self.assertIn('=== Profile Summary ===', stream.getvalue())
+
+        timings = profiler.file_timings
+        self.assertEqual(timings.files, 1)
+        self.assertEqual(timings.slowest()[0].path, self.path)
+        self.assertEqual(timings.slowest()[0].bytes_read, size)
+        self.assertEqual(timings.slowest()[0].bytes_written, size)
+        self.assertIn('=== Slowest Files (top 1 of 1) ===', stream.getvalue())
+
+    def test_file_timings_keep_slowest_and_histogram(self):
+        """Test that only the N slowest files are kept, and the buckets."""
+        timings = profiling.FileTimings(top=2)
+        for i, seconds in enumerate([0.0005, 0.003, 1.5, 0.0009, 7.0]):
+            timings.add(profiling.FileTiming(f'file{i}.adoc', seconds))
+
+        self.assertEqual(
+            [t.path for t in timings.slowest()], ['file4.adoc', 'file2.adoc']
+        )
+        self.assertEqual(timings.files, 5)
+        self.assertEqual(timings.counts[0], 2)  # < 1ms
+        self.assertEqual(timings.counts[2], 1)  # 2ms - 5ms
+        self.assertEqual(timings.counts[-1], 1)  # >= 5s
+
+        lines = timings.format()
+        self.assertIn('>= 5s', lines[-2])
+        self.assertTrue(lines[-2].rstrip().endswith('#'))
+
+    def test_deep_sizeof_counts_shared_objects_once(self):
+        """Test that nested containers are followed and shared items counted once."""
+        item = 'x' * 1000
+        self.assertGreater(deep_sizeof({'a': [item]}), sys.getsizeof(item))
+        self.assertEqual(
+            deep_sizeof([item, item]), sys.getsizeof([item, item]) + sys.getsizeof(item)
+        )
+
+    def test_memory_profile_records_peaks_structures_and_sites(self):
+        """Test phase peaks, structure sizes and allocation sites of a session."""
+        stream = io.StringIO()
+        with profiling.profiling_session(stream=stream, memory=True) as profiler:
+            with profiling.profile_phase('scan'):
+                data = ['line %d' % i for i in range(2000)]
+            with profiling.profile_phase('report'):
+                profiling.record_structures('Test', lines=data)
+
+        self.assertGreater(profiler.phases['scan'].peak_memory, 0)
+        structure = profiler.memory.structures['Test.lines']
+        self.assertEqual(structure.items, 2000)
+        self.assertGreater(structure.bytes, sys.getsizeof(data))
+        self.assertTrue(profiler.memory.sites)
+
+        summary = stream.getvalue()
+        self.assertIn('Peak memory', summary)
+        self.assertIn('=== Memory ===', summary)
+        self.assertIn('Test.lines', summary)
+        self.assertIn('Top allocation sites', summary)
+
+        # Recording outside a memory-profiled run does nothing
+        profiling.record_structures('Test', lines=data)
+
+    def test_environment_variable_profiles_module_execute(self):
+        """Test that ADT_PROFILE alone profiles a module driven directly."""
+        dump = os.path.join(self.temp_dir, 'run.prof')
+        module = EntityReferenceModule()
+        module.initialize({})
+
+        stderr = io.StringIO()
+        with patch.dict(os.environ, {profiling.PROFILE_ENV_VAR: dump}), patch(
+            'sys.stderr', stderr
+        ), patch('sys.stdout', io.StringIO()):
+            result = module.execute({'file': self.path})
+
+        self.assertTrue(result['success'])
+        summary = stderr.getvalue()
+        self.assertIn('EntityReference.execute', summary)
+        self.assertIn('write', summary)
+        self.assertIn(f'cProfile data written to {dump}', summary)
+        self.assertGreater(pstats.Stats(dump).total_calls, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+"""
+Test suite for report snapshots and the snapshot diff tool.
+
+This script tests the compact snapshot format written by ContextAnalyzer and
+CrossReference, its loader, and the comparison of two runs.
+
+To run: python3 -m pytest tests/test_report_snapshot.py -v
+"""
+
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    from asciidoc_dita_toolkit.asciidoc_dita.report_snapshot import (
+        SnapshotWriter,
+        diff_snapshots,
+        format_snapshot_diff,
+        load_snapshot,
+        main,
+    )
+    from asciidoc_dita_toolkit.asciidoc_dita.plugins.ContextAnalyzer import (
+        ContextAnalyzer,
+        save_analysis_snapshot,
+    )
+    from asciidoc_dita_toolkit.asciidoc_dita.plugins.CrossReference import (
+        process_master_file,
+        save_validation_snapshot,
+    )
+except ImportError as e:
+    print(f"Warning: Could not import report_snapshot module: {e}")
+    SnapshotWriter = None
+
+
+@unittest.skipIf(SnapshotWriter is None, "report_snapshot module could not be imported")
+class TestReportSnapshot(unittest.TestCase):
+    """Test cases for writing, loading and comparing snapshots."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, name, content):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def analyze(self, snapshot_name):
+        analyzer = ContextAnalyzer()
+        for name in sorted(os.listdir(self.temp_dir)):
+            if name.endswith('.adoc'):
+                analyzer.analyze_file(os.path.join(self.temp_dir, name))
+        path = os.path.join(self.temp_dir, snapshot_name)
+        save_analysis_snapshot(analyzer, analyzer.generate_report(), path)
+        return path
+
+    def test_round_trip_stores_each_string_once(self):
+        """Test that rows are decoded back and repeated strings are shared."""
+        path = os.path.join(self.temp_dir, 'run.json')
+        with SnapshotWriter(path, 'CrossReference') as writer:
+            for line in (3, 9):
+                writer.write(
+                    'broken',
+                    {
+                        'file': 'modules/a.adoc',
+                        'line': line,
+                        'xref': 'gone[Gone]',
+                        'target_id': 'gone',
+                        'target_file': '',
+                        'reason': 'not found',
+                    },
+                )
+            writer.write('warning', {'message': 'ignored'})
+            writer.write('summary', {'broken_xrefs': 2})
+
+        with open(path, encoding='utf-8') as f:
+            raw = json.load(f)
+        self.assertEqual(raw['strings'].count('modules/a.adoc'), 1)
+
+        snapshot = load_snapshot(path)
+        self.assertEqual(snapshot.tool, 'CrossReference')
+        self.assertEqual(snapshot.summary, {'broken_xrefs': 2})
+        self.assertEqual(len(snapshot.rows('broken_xrefs')), 2)
+        self.assertEqual(snapshot.rows('broken_xrefs')[1]['line'], 9)
+        self.assertEqual(snapshot.rows('broken_xrefs')[1]['file'], 'modules/a.adoc')
+        self.assertEqual(snapshot.rows('collisions'), [])
+
+    def test_load_rejects_other_files(self):
+        """Test that a file that is not a snapshot is refused."""
+        path = self.write('other.json', '{"total_files_scanned": 1}')
+        with self.assertRaises(ValueError):
+            load_snapshot(path)
+
+    def test_diff_reports_new_collisions(self):
+        """Test that a collision introduced between runs is reported as new."""
+        self.write('a.adoc', '[id="topic_a"]\n== A\n')
+        old = self.analyze('old.json')
+        self.write('b.adoc', '[id="topic_b"]\n== B\n')
+        new = self.analyze('new.json')
+
+        diff = diff_snapshots(load_snapshot(old), load_snapshot(new))
+
+        self.assertEqual(len(diff.new_collisions), 1)
+        self.assertEqual(diff.new_collisions[0]['base_id'], 'topic')
+        self.assertEqual(diff.resolved_collisions, [])
+        self.assertEqual(diff.summary_changes['total_context_ids'], (1, 2))
+        self.assertTrue(diff.has_regressions)
+        self.assertIn("Base ID 'topic'", format_snapshot_diff(diff))
+
+    def test_diff_ignores_line_shifts_of_broken_xrefs(self):
+        """Test that moved broken xrefs are not new, but added ones are."""
+        self.write('a.adoc', '[id="intro"]\n== Intro\n')
+        master = self.write(
+            'master.adoc', '[id="guide"]\n= Guide\n\ninclude::a.adoc[]\n\nxref:gone[G]\n'
+        )
+        old = os.path.join(self.temp_dir, 'old.json')
+        save_validation_snapshot(process_master_file(master, True), old)
+
+        self.write(
+            'master.adoc',
+            '[id="guide"]\n= Guide\n\nNew paragraph.\n\ninclude::a.adoc[]\n\n'
+            'xref:gone[G]\nxref:missing[M]\n',
+        )
+        new = os.path.join(self.temp_dir, 'new.json')
+        save_validation_snapshot(process_master_file(master, True), new)
+
+        diff = diff_snapshots(load_snapshot(old), load_snapshot(new))
+
+        self.assertEqual(
+            [row['target_id'] for row in diff.new_broken_xrefs], ['missing']
+        )
+        self.assertEqual(diff.resolved_broken_xrefs, [])
+
+    def test_cli_fails_on_regression(self):
+        """Test the diff tool's exit status and JSON output."""
+        self.write('a.adoc', '[id="topic_a"]\n== A\n')
+        old = self.analyze('old.json')
+        self.write('b.adoc', '[id="topic_b"]\n== B\n')
+        new = self.analyze('new.json')
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(main([old, new, '--format', 'json']), 0)
+            self.assertEqual(main([old, new, '--fail-on-regression']), 1)
+            self.assertEqual(main([new, new, '--fail-on-regression']), 0)
+
+        first = output.getvalue().split('=== Report Snapshot Diff ===')[0]
+        self.assertEqual(len(json.loads(first)['new_collisions']), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,247 @@
+"""
+Test suite for the streaming report writers.
+
+This script tests the text, JSON Lines and CSV report writers and the
+streaming report mode of the ContextAnalyzer, ContextMigrator and
+CrossReference plugins.
+
+To run: python3 -m pytest tests/test_report_writers.py -v
+"""
+
+import csv
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    from asciidoc_dita_toolkit.asciidoc_dita.report_writers import (
+        CsvReportWriter,
+        JsonLinesReportWriter,
+        MultiReportWriter,
+        ReportWriter,
+        TextReportWriter,
+        format_for_path,
+    )
+    from asciidoc_dita_toolkit.asciidoc_dita.plugins.ContextAnalyzer import (
+        ContextAnalyzer,
+        format_text_report,
+        open_analysis_writer,
+        write_analysis_summary,
+    )
+    from asciidoc_dita_toolkit.asciidoc_dita.plugins.ContextMigrator import (
+        ContextMigratorModule,
+    )
+    from asciidoc_dita_toolkit.asciidoc_dita.plugins.CrossReference import (
+        process_master_file,
+        open_validation_writer,
+    )
+except ImportError as e:
+    print(f"Warning: Could not import report_writers module: {e}")
+    JsonLinesReportWriter = None
+
+
+def read_jsonl(path):
+    """Return the records of a JSON Lines file."""
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+@unittest.skipIf(
+    JsonLinesReportWriter is None, "report_writers module could not be imported"
+)
+class TestReportWriters(unittest.TestCase):
+    """Test cases for the individual report writers."""
+
+    def test_jsonl_writer_tags_records_and_counts_them(self):
+        """Test that each record becomes one tagged JSON line."""
+        stream = io.StringIO()
+        writer = JsonLinesReportWriter(stream)
+        writer.write_section([('id', {'file': 'a.adoc', 'line': 1})])
+        writer.write('summary', {'total': 1})
+
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(
+            [json.loads(line) for line in lines],
+            [
+                {'type': 'id', 'file': 'a.adoc', 'line': 1},
+                {'type': 'summary', 'total': 1},
+            ],
+        )
+        self.assertEqual(writer.counts, {'id': 1, 'summary': 1})
+
+    def test_csv_writer_uses_fixed_columns_and_joins_lists(self):
+        """Test that CSV rows share one header and flatten list values."""
+        stream = io.StringIO()
+        writer = CsvReportWriter(stream, ['file', 'files'])
+        writer.write('file', {'file': 'a.adoc'})
+        writer.write('collision', {'files': ['a.adoc', 'b.adoc']})
+
+        rows = list(csv.reader(io.StringIO(stream.getvalue())))
+        self.assertEqual(
+            rows,
+            [
+                ['type', 'file', 'files'],
+                ['file', 'a.adoc', ''],
+                ['collision', '', 'a.adoc;b.adoc'],
+            ],
+        )
+
+    def test_text_writer_headings_and_kind_filter(self):
+        """Test that headings appear once and filtered kinds are only counted."""
+        stream = io.StringIO()
+        writer = TextReportWriter(
+            stream,
+            lambda kind, record: [record['text']],
+            header=['Title'],
+            headings={'item': ['Items:']},
+            kinds={'item'},
+        )
+        writer.write('item', {'text': 'one'})
+        writer.write('item', {'text': 'two'})
+        writer.write('hidden', {'text': 'three'})
+
+        self.assertEqual(stream.getvalue(), 'Title\nItems:\none\ntwo\n')
+        self.assertEqual(writer.counts['hidden'], 1)
+
+    def test_multi_writer_closes_every_writer(self):
+        """Test that a failing close does not leave later writers open."""
+
+        class FailingWriter(JsonLinesReportWriter):
+            def close(self):
+                raise OSError('disk full')
+
+        first, last = io.StringIO(), io.StringIO()
+        writer = MultiReportWriter(
+            [
+                FailingWriter(first),
+                JsonLinesReportWriter(last, close_stream=True),
+            ]
+        )
+        writer.write('file', {'path': 'a.adoc'})
+
+        with self.assertRaises(OSError):
+            writer.close()
+        self.assertTrue(last.closed)
+        with self.assertRaises(TypeError):
+            ReportWriter(io.StringIO())
+
+    def test_format_for_path(self):
+        """Test that report formats are picked from file extensions."""
+        self.assertEqual(format_for_path('report.jsonl'), 'jsonl')
+        self.assertEqual(format_for_path('report.JSON'), 'json')
+        self.assertEqual(format_for_path('report.csv'), 'csv')
+        self.assertEqual(format_for_path('report.txt'), 'text')
+        self.assertEqual(format_for_path(None), 'text')
+
+
+@unittest.skipIf(
+    JsonLinesReportWriter is None, "report_writers module could not be imported"
+)
+class TestStreamingReports(unittest.TestCase):
+    """Test cases for the plugins' streaming report mode."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.files = {
+            'a.adoc': ':context: x\n:context: y\n[id="topic_a"]\n== A\nxref:topic_b[B]\n',
+            'b.adoc': '[id="topic_b"]\n== B\nlink:https://example.com[Site]\n',
+            'c.adoc': '[id="intro_c"]\n== C\n',
+            'plain.adoc': 'No IDs here.\n',
+        }
+        for name, content in self.files.items():
+            with open(os.path.join(self.temp_dir, name), 'w', encoding='utf-8') as f:
+                f.write(content)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def paths(self):
+        return [os.path.join(self.temp_dir, name) for name in sorted(self.files)]
+
+    def test_streamed_analysis_matches_in_memory_summary(self):
+        """Test that streaming keeps no per-file state and gives the same totals."""
+        in_memory = ContextAnalyzer()
+        for path in self.paths():
+            in_memory.analyze_file(path)
+        report = in_memory.generate_report()
+        text = format_text_report(report)
+
+        output = os.path.join(self.temp_dir, 'analysis.jsonl')
+        streaming = ContextAnalyzer()
+        streaming.writer = open_analysis_writer('jsonl', output)
+        with streaming.writer:
+            for path in self.paths():
+                streaming.analyze_file(path)
+            streamed_report = streaming.generate_report()
+            write_analysis_summary(streaming.writer, streaming, streamed_report)
+
+        self.assertEqual(streaming.file_analyses, [])
+        self.assertEqual(streaming.all_xrefs, [])
+        records = read_jsonl(output)
+        kinds = [record['type'] for record in records]
+        self.assertEqual(kinds.count('file'), 4)
+        self.assertEqual(kinds.count('id'), 3)
+        self.assertEqual(kinds.count('xref'), 1)
+        self.assertEqual(kinds.count('link'), 1)
+        self.assertEqual(kinds[-2:], ['collision', 'summary'])
+
+        summary = records[-1]
+        self.assertEqual(summary['files_scanned'], report.total_files_scanned)
+        self.assertEqual(summary['total_context_ids'], report.total_context_ids)
+        for level in ('Low', 'Medium', 'High'):
+            key = f'{level.lower()}_risk'
+            self.assertIn(f'- {level} Risk: {summary[key]} files', text)
+
+    def test_migrator_streams_jsonl_records(self):
+        """Test that the migration report is written per file as JSON Lines."""
+        output = os.path.join(self.temp_dir, 'migration.jsonl')
+        module = ContextMigratorModule()
+        module.initialize(
+            {
+                'dry_run': True,
+                'create_backups': False,
+                'output_format': 'jsonl',
+                'output_file': output,
+            }
+        )
+
+        result = module.execute({'file': os.path.join(self.temp_dir, 'c.adoc')})
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['migration_result']['file_results'], [])
+        records = read_jsonl(output)
+        self.assertEqual(
+            [record['type'] for record in records], ['file', 'id_change', 'summary']
+        )
+        self.assertEqual(records[1]['old'], 'intro_c')
+        self.assertEqual(records[1]['new'], 'intro')
+        self.assertEqual(records[2]['total_id_changes'], 1)
+
+    def test_cross_reference_streams_broken_xrefs_to_csv(self):
+        """Test that broken xrefs are written to the CSV report, not kept."""
+        master = os.path.join(self.temp_dir, 'master.adoc')
+        with open(master, 'w', encoding='utf-8') as f:
+            f.write('[id="master"]\n= Guide\n\ninclude::b.adoc[]\n\nxref:gone[Gone]\n')
+        output = os.path.join(self.temp_dir, 'xrefs.csv')
+
+        with open_validation_writer('csv', output) as writer:
+            report = process_master_file(master, validation_only=True, writer=writer)
+
+        self.assertEqual(report.broken_xrefs, [])
+        self.assertFalse(report.validation_successful)
+        self.assertEqual(writer.counts['broken'], 1)
+        with open(output, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([row['type'] for row in rows], ['broken'])
+        self.assertEqual(rows[0]['target_id'], 'gone')
+
+
+if __name__ == '__main__':
+    unittest.main()